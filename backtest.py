@@ -0,0 +1,216 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import zeus_store
+from train_models import MODEL_PARAMS, load_training_matrix, model_inputs, single_class
+
+# ==========================================
+# Zeus Backtest (Rolling-origin evaluation)
+# แทนการสอบ 7 วันสุดท้ายครั้งเดียวใน evaluate_model.ipynb: เลื่อนจุดตัด (origin) ไปตลอดประวัติ
+# - ทุก origin: เทรนด้วยข้อมูล <= origin เท่านั้น แล้วทำนายชั่วโมงที่ +1, +3, +6, +12 (เหมือนหน้า Oracle)
+#   horizon h = แถวที่เวลาอยู่ในชั่วโมงที่จบที่ origin + h ชม.
+#   (Feature ของชั่วโมงนั้นใช้ค่าที่สถานีวัดได้จริง ส่วนแอปใช้ค่าพยากรณ์ของ Open-Meteo
+#    ผลนี้จึงวัดความผิดพลาดของโมเดลเอง ไม่รวมความผิดพลาดของ Open-Meteo)
+# - Feature Matrix สร้างครั้งเดียวแล้ว cache เป็น .npy (.zeus_cache/backtest/) ทุก process เปิดแบบ mmap
+# - แต่ละ fold รันใน process แยก (ProcessPool) โมเดลละ n_jobs=1 จึงใช้ Core เต็มโดยไม่แย่งกัน
+# รัน: python backtest.py --step-hours 24 --workers 0
+#      python backtest.py --set temp.n_estimators=50 --label temp50   (เทียบ Hyperparameter อื่น)
+# ==========================================
+
+CACHE_DIR = os.path.join('.zeus_cache', 'backtest')
+HORIZONS = (1, 3, 6, 12)
+SOURCE_DATASET = 'cleaned'
+MIN_TRAIN_DAYS = 7
+STEP_HOURS = 24
+
+
+# --- 1. Feature cache ---
+def dataset_fingerprint(name, store_dir=zeus_store.STORE_DIR):
+    # เปลี่ยนเมื่อไฟล์ใน dataset เปลี่ยน (ชื่อ / ขนาด / mtime) โดยไม่ต้องอ่านข้อมูล
+    h = hashlib.sha1()
+    root = zeus_store.dataset_path(name, store_dir)
+    for dirpath, _, files in sorted(os.walk(root)):
+        for f in sorted(files):
+            st_ = os.stat(os.path.join(dirpath, f))
+            h.update(f"{os.path.relpath(os.path.join(dirpath, f), root)}:{st_.st_size}:{st_.st_mtime_ns}".encode())
+    return h.hexdigest()[:16]
+
+
+def cached_features(name=SOURCE_DATASET, store_dir=zeus_store.STORE_DIR, cache_dir=CACHE_DIR):
+    # คืน path ของโฟลเดอร์ cache (X.npy / rain_clean.npy / times.npy)
+    path = os.path.join(cache_dir, f"{name}-{dataset_fingerprint(name, store_dir)}")
+    if os.path.isdir(path):
+        return path, True
+    X, rain_clean, times = load_training_matrix(name, store_dir)
+    if times is None:
+        raise ValueError(f"zeus_store/{name} ไม่มีคอลัมน์ datetime")
+    tmp = f"{path}.tmp-{os.getpid()}"
+    os.makedirs(tmp, exist_ok=True)
+    np.save(os.path.join(tmp, 'X.npy'), X)
+    np.save(os.path.join(tmp, 'rain_clean.npy'), rain_clean)
+    np.save(os.path.join(tmp, 'times.npy'), times.astype('datetime64[ns]').astype(np.int64))
+    os.replace(tmp, path)
+    return path, False
+
+
+def load_features(path, mmap_mode='r'):
+    return tuple(np.load(os.path.join(path, f"{n}.npy"), mmap_mode=mmap_mode)
+                 for n in ('X', 'rain_clean', 'times'))
+
+
+# --- 2. Folds ---
+def make_origins(times, horizons=HORIZONS, step_hours=STEP_HOURS, min_train_days=MIN_TRAIN_DAYS, max_folds=None):
+    # origin แรกหลังมีข้อมูลครบ min_train_days, origin สุดท้ายต้องยังมีข้อมูลถึง horizon ไกลสุด
+    first = pd.Timestamp(int(times[0])).ceil('h') + pd.Timedelta(days=min_train_days)
+    last = pd.Timestamp(int(times[-1])) - pd.Timedelta(hours=max(horizons))
+    if first > last:
+        return []
+    origins = list(pd.date_range(first, last, freq=pd.Timedelta(hours=step_hours)))
+    if max_folds and len(origins) > max_folds:
+        # เก็บ origin ล่าสุดไว้ (ใกล้สภาพอากาศปัจจุบันที่สุด)
+        origins = origins[-max_folds:]
+    return origins
+
+
+def build_model(name, overrides):
+    cls, params = MODEL_PARAMS[name]
+    return cls(**{**params, **overrides.get(name, {}), 'n_jobs': 1})
+
+
+def run_fold(task):
+    # ทำงานใน process ลูก: เปิด Feature cache แบบ mmap แล้วคืนผลรวมความคลาดเคลื่อนต่อ horizon
+    path, origin, names, horizons, overrides, window_days = task
+    X, rain_clean, times = load_features(path)
+    origin_ns = origin.value
+    lo = 0 if not window_days else int(np.searchsorted(times, origin_ns - pd.Timedelta(days=window_days).value))
+    hi = int(np.searchsorted(times, origin_ns, side='right'))
+    X_train, y_rain = X[lo:hi], np.asarray(rain_clean[lo:hi])
+
+    # แถวของแต่ละ horizon: (origin + h-1 ชม., origin + h ชม.]
+    hour = pd.Timedelta(hours=1).value
+    windows = {h: (int(np.searchsorted(times, origin_ns + (h - 1) * hour, side='right')),
+                   int(np.searchsorted(times, origin_ns + h * hour, side='right'))) for h in horizons}
+    t0 = time.perf_counter()
+    rows = []
+    for name in names:
+        if single_class(name, y_rain):
+            continue
+        X_model, y = model_inputs(name, X_train, y_rain)
+        model = build_model(name, overrides).fit(X_model, y)
+        for h, (a, b) in windows.items():
+            if b <= a:
+                continue
+            X_test, y_test = model_inputs(name, np.asarray(X[a:b]), np.asarray(rain_clean[a:b]))
+            pred = model.predict(X_test)
+            err = pred.astype(np.float64) - np.asarray(y_test, dtype=np.float64)
+            rows.append({'model': name, 'horizon': h, 'n': b - a,
+                         'abs': float(np.abs(err).sum()), 'sq': float((err ** 2).sum()),
+                         'correct': int((err == 0).sum())})
+    return {'origin': origin, 'train_rows': hi - lo, 'seconds': time.perf_counter() - t0, 'rows': rows}
+
+
+# --- 3. สรุปผล ---
+def summarize(folds):
+    # รวมทุก fold แบบถ่วงตามจำนวนแถว: MAE / RMSE (ทุกโมเดล) และ Accuracy (โมเดลฝน)
+    df = pd.DataFrame([{**r, 'origin': f['origin']} for f in folds for r in f['rows']])
+    if df.empty:
+        return df
+    g = df.groupby(['model', 'horizon'], sort=False)
+    out = g[['n', 'abs', 'sq', 'correct']].sum()
+    out['folds'] = g['origin'].nunique()
+    summary = pd.DataFrame({
+        'folds': out['folds'],
+        'rows': out['n'],
+        'mae': out['abs'] / out['n'],
+        'rmse': np.sqrt(out['sq'] / out['n']),
+    })
+    is_rain = summary.index.get_level_values('model') == 'rain'
+    summary['accuracy'] = np.where(is_rain, out['correct'] / out['n'], np.nan)
+    order = [n for n in MODEL_PARAMS if n in summary.index.get_level_values('model')]
+    return summary.reindex(order, level='model').round(4)
+
+
+def parse_overrides(items):
+    # --set temp.n_estimators=50 --set humidity.max_depth=12
+    overrides = {}
+    for item in items or []:
+        key, value = item.split('=', 1)
+        name, param = key.split('.', 1)
+        if name not in MODEL_PARAMS:
+            raise ValueError(f"ไม่รู้จักโมเดล '{name}' (มี {', '.join(MODEL_PARAMS)})")
+        try:
+            value = json.loads(value)
+        except ValueError:
+            pass
+        overrides.setdefault(name, {})[param] = value
+    return overrides
+
+
+def backtest(dataset=SOURCE_DATASET, store_dir=zeus_store.STORE_DIR, names=None, horizons=HORIZONS,
+             step_hours=STEP_HOURS, min_train_days=MIN_TRAIN_DAYS, max_folds=None, window_days=None,
+             overrides=None, workers=0, cache_dir=CACHE_DIR, progress=print):
+    names = list(names or MODEL_PARAMS)
+    workers = workers or os.cpu_count() or 1
+    t0 = time.perf_counter()
+    path, hit = cached_features(dataset, store_dir, cache_dir)
+    X, _, times = load_features(path)
+    progress(f"   {'♻️ ใช้' if hit else '🧮 สร้าง'} Feature cache {path} ({len(X):,} แถว, {time.perf_counter() - t0:.2f}s)")
+
+    origins = make_origins(times, horizons, step_hours, min_train_days, max_folds)
+    if not origins:
+        raise ValueError(f"ข้อมูลสั้นเกินไป: ต้องมีอย่างน้อย {min_train_days} วัน + {max(horizons)} ชม.")
+    progress(f"   🔁 {len(origins)} folds ({origins[0]} -> {origins[-1]}, ทุก {step_hours} ชม.) | {workers} process")
+    tasks = [(path, origin, names, tuple(horizons), overrides or {}, window_days) for origin in origins]
+    folds = []
+    if workers == 1:
+        results = map(run_fold, tasks)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(run_fold, tasks)
+    try:
+        for i, fold in enumerate(results, 1):
+            folds.append(fold)
+            progress(f"   ⏳ [{i}/{len(tasks)}] origin {fold['origin']} | train {fold['train_rows']:,} แถว "
+                     f"| {fold['seconds']:.1f}s")
+    finally:
+        if workers != 1:
+            pool.shutdown()
+    return summarize(folds), {'folds': len(folds), 'wall_s': round(time.perf_counter() - t0, 2), 'cache': path}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Backtest แบบเลื่อนจุดตัด (rolling-origin) ทุก horizon ของหน้า Oracle")
+    parser.add_argument('--dataset', default=SOURCE_DATASET)
+    parser.add_argument('--store-dir', default=zeus_store.STORE_DIR)
+    parser.add_argument('--models', nargs='+', choices=list(MODEL_PARAMS), default=None)
+    parser.add_argument('--horizons', type=int, nargs='+', default=list(HORIZONS))
+    parser.add_argument('--step-hours', type=int, default=STEP_HOURS, help="ระยะห่างระหว่าง origin")
+    parser.add_argument('--min-train-days', type=int, default=MIN_TRAIN_DAYS)
+    parser.add_argument('--max-folds', type=int, default=None, help="ใช้แค่ N origin ล่าสุด")
+    parser.add_argument('--window-days', type=int, default=None, help="เทรนเฉพาะ N วันก่อน origin (ไม่ใส่ = ทั้งประวัติ)")
+    parser.add_argument('--set', action='append', metavar='MODEL.PARAM=VALUE', help="เปลี่ยน Hyperparameter")
+    parser.add_argument('--label', default='baseline', help="ชื่อชุดทดลอง (ใช้ใน --output)")
+    parser.add_argument('--workers', type=int, default=0, help="จำนวน process (0 = ทุก Core)")
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--output', default=None, help="ต่อท้ายผลลง CSV ไว้เทียบหลายชุดทดลอง")
+    args = parser.parse_args()
+    zeus_store.use_system_memory_pool()
+
+    print(f"⚡ Backtest zeus_store/{args.dataset} [{args.label}] ...")
+    summary, info = backtest(args.dataset, args.store_dir, args.models, args.horizons, args.step_hours,
+                             args.min_train_days, args.max_folds, args.window_days,
+                             parse_overrides(args.set), args.workers, args.cache_dir)
+    print("-" * 50)
+    print(summary.to_string())
+    print(f"🎉 {info['folds']} folds เสร็จใน {info['wall_s']}s")
+    if args.output:
+        out = summary.reset_index().assign(label=args.label, params=json.dumps(parse_overrides(args.set)))
+        out.to_csv(args.output, mode='a', header=not os.path.exists(args.output), index=False)
+        print(f"💾 ต่อท้ายผลลง {args.output}")
@@ -0,0 +1,126 @@
+import argparse
+import asyncio
+import statistics
+import time
+import warnings
+from urllib.parse import urlparse
+
+import pandas as pd
+
+from _models import ROOT, load_or_train_models
+from openmeteo_stub import start_stub
+from zeus_api import ZeusAPI
+from zeus_weather import ForecastCache
+
+# ==========================================
+# วัดความเร็ว zeus_api จาก forecast ที่ cache ไว้แล้ว
+# - asgi: เรียก app ตรงๆ ใน process (ต้นทุนของ handler ล้วน ไม่รวม HTTP)
+# - http: ยิง HTTP keep-alive ไปที่ server ที่รันแยก (ต้นทุนจริงต่อ core รวม uvicorn)
+#   python benchmarks/openmeteo_stub.py --port 8099 &
+#   ZEUS_OPEN_METEO_URL=http://127.0.0.1:8099/v1/forecast python zeus_api.py --port 8000 &
+#   python benchmarks/bench_api.py --url http://127.0.0.1:8000 --concurrency 16
+# ==========================================
+
+warnings.filterwarnings("ignore")
+
+PATHS = (
+    '/forecast?lat=14.16&lon=101.35',
+    '/nowcast?lat=14.16&lon=101.35',
+    '/forecast?locations=14.16,101.35;13.75,100.50;18.79,98.98;7.88,98.39',
+    '/chat?message=%E0%B8%A3%E0%B9%89%E0%B8%AD%E0%B8%99%E0%B9%84%E0%B8%AB%E0%B8%A1',
+)
+
+
+async def call_asgi(app, target):
+    path, _, query = target.partition('?')
+    scope = {'type': 'http', 'method': 'GET', 'path': path, 'query_string': query.encode()}
+    sent = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent[0]['status'], len(sent[1]['body'])
+
+
+async def bench_asgi(app, target, requests):
+    status, size = await call_asgi(app, target)  # warm-up (คำนวณพยากรณ์ครั้งแรก)
+    samples = []
+    for _ in range(requests):
+        t0 = time.perf_counter()
+        await call_asgi(app, target)
+        samples.append(time.perf_counter() - t0)
+    return status, size, samples, sum(samples)
+
+
+async def http_get(reader, writer, host, target):
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    length = next(int(line.split(b':', 1)[1]) for line in head.split(b'\r\n')
+                  if line.lower().startswith(b'content-length:'))
+    await reader.readexactly(length)
+    return status, length
+
+
+async def bench_http(url, target, requests, concurrency):
+    parsed = urlparse(url)
+    samples, statuses = [], []
+
+    async def worker(n):
+        reader, writer = await asyncio.open_connection(parsed.hostname, parsed.port)
+        for _ in range(n):
+            t0 = time.perf_counter()
+            status, size = await http_get(reader, writer, parsed.netloc, target)
+            samples.append(time.perf_counter() - t0)
+            statuses.append((status, size))
+        writer.close()
+
+    await worker(1)  # warm-up
+    samples.clear()
+    statuses.clear()
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+    wall = time.perf_counter() - t0
+    return statuses[0][0], statuses[0][1], samples, wall
+
+
+def row(status, size, samples, wall):
+    samples = sorted(samples)
+    return {
+        'status': status,
+        'bytes': size,
+        'req_per_s': len(samples) / wall,
+        'mean_ms': statistics.fmean(samples) * 1000,
+        'p95_ms': samples[int(len(samples) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="วัดจำนวนคำขอต่อวินาทีของ zeus_api จาก cache")
+    parser.add_argument('--url', help="server ที่รันอยู่ (ไม่ใส่ = เรียก ASGI app ตรงๆ กับ Open-Meteo stub)")
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    args = parser.parse_args()
+
+    rows = {}
+    if args.url:
+        for target in PATHS:
+            rows[target] = row(*asyncio.run(bench_http(args.url, target, args.requests, args.concurrency)))
+        mode = f"http {args.url} (concurrency {args.concurrency})"
+    else:
+        models, kind = load_or_train_models(ROOT)
+        stub = start_stub()
+        app = ZeusAPI(models=models, forecast_cache=ForecastCache(base_url=stub.url, cache_dir=None))
+        for target in PATHS:
+            rows[target] = row(*asyncio.run(bench_asgi(app, target, args.requests)))
+        mode = f"asgi in-process (โมเดล: {kind})"
+    print(f"โหมด: {mode} | {args.requests} คำขอต่อ endpoint")
+    print(pd.DataFrame(rows).T.round(3).to_string())
+
+
+if __name__ == '__main__':
+    main()
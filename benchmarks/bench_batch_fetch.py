@@ -0,0 +1,84 @@
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from _models import ROOT, load_or_train_models
+from openmeteo_stub import start_stub
+from zeus_forecast import ForecastPrecomputer, compute_forecast, issue_hour
+from zeus_inference import engine_for
+from zeus_weather import ForecastCache
+
+# ==========================================
+# Microbenchmark: พยากรณ์หลายพิกัด ทีละพิกัด (ForecastCache.get_entry + predict ต่อพิกัด)
+# เทียบกับ ForecastPrecomputer.refresh_many (คำขอแบบหลายพิกัดผ่าน asyncio + predict Matrix เดียว)
+# ใช้ Open-Meteo stub ในเครื่อง (หน่วงเวลา / ล่มบางคำขอได้) ไม่ต้องต่ออินเทอร์เน็ต
+# รัน: python benchmarks/bench_batch_fetch.py --sites 120 --latency-ms 150 --fail-rate 0.2
+# ==========================================
+
+warnings.filterwarnings("ignore")
+
+
+def make_sites(n, seed=0):
+    # พิกัดสุ่มในกรอบประเทศไทย
+    rng = np.random.default_rng(seed)
+    return [(round(float(lat), 4), round(float(lon), 4))
+            for lat, lon in zip(rng.uniform(6, 20, n), rng.uniform(98, 105, n))]
+
+
+def sequential(sites, models, url):
+    cache = ForecastCache(base_url=url, cache_dir=None)
+    engine, chat_engine = engine_for(models), engine_for(models, ('temp',))
+    t0 = time.perf_counter()
+    forecasts = []
+    for lat, lon in sites:
+        entry = cache.get_entry(lat, lon)
+        if entry is None:
+            forecasts.append(None)
+            continue
+        issued_at = issue_hour(time.time())
+        forecasts.append(compute_forecast(entry.payload, issued_at, engine, chat_engine, (lat, lon)))
+    return forecasts, time.perf_counter() - t0
+
+
+def batched(sites, models, url):
+    precomputer = ForecastPrecomputer(ForecastCache(base_url=url, cache_dir=None), models)
+    t0 = time.perf_counter()
+    forecasts = {f.location: f for f in precomputer.refresh_many(sites)}
+    return [forecasts.get(site) for site in sites], time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="วัดการดึง + พยากรณ์หลายพิกัดแบบทีละพิกัดเทียบกับแบบรวม")
+    parser.add_argument('--sites', type=int, default=60)
+    parser.add_argument('--latency-ms', type=int, default=150)
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="สัดส่วนคำขอที่ stub ตอบ 503")
+    args = parser.parse_args()
+
+    models, kind = load_or_train_models(ROOT)
+    sites = make_sites(args.sites)
+    rows, results = {}, {}
+    for name, run in (('sequential (ทีละพิกัด)', sequential), ('batched (asyncio + predict รวม)', batched)):
+        stub = start_stub(latency_ms=args.latency_ms, fail_rate=args.fail_rate)
+        forecasts, seconds = run(sites, models, stub.url)
+        results[name] = forecasts
+        rows[name] = {
+            'seconds': seconds,
+            'http_requests': stub.requests,
+            'ok_sites': sum(f is not None and not f.error for f in forecasts),
+        }
+        stub.shutdown()
+
+    # ผลทำนายต้องเท่ากันทุกพิกัดที่ได้ทั้งสองแบบ
+    a, b = results.values()
+    diffs = [float(np.max(np.abs(x.preds[k] - y.preds[k])))
+             for x, y in zip(a, b) if x is not None and y is not None and x.preds and y.preds for k in x.preds]
+    print(f"โมเดล: {kind} | {args.sites} พิกัด | stub หน่วง {args.latency_ms} ms, ล่ม {args.fail_rate:.0%} "
+          f"| ผลต่างสูงสุด: {max(diffs, default=0.0):.2e}")
+    print(pd.DataFrame(rows).T.round(3).to_string())
+
+
+if __name__ == '__main__':
+    main()
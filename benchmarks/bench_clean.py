@@ -0,0 +1,123 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from _models import ROOT
+import zeus_clean
+import zeus_store
+
+# ==========================================
+# Benchmark: ทำความสะอาดแบบโหลดทั้งก้อน (โค้ดเดิมใน clean_data.ipynb) เทียบกับ zeus_clean (ทีละเดือน)
+# วัดเวลาและหน่วยความจำสูงสุด (peak RSS) เมื่อข้อมูลยาวขึ้นเรื่อยๆ แต่ละแบบรันใน process แยก
+# รัน: python benchmarks/bench_clean.py --months 3 12 24
+# ==========================================
+
+WORK_DIR = os.path.join(ROOT, '.zeus_cache', 'bench_clean')
+
+
+def make_store(months):
+    # ต่อข้อมูลดิบจริง (~5 สัปดาห์) ซ้ำไปข้างหลังจนครบจำนวนเดือน
+    store_dir = os.path.join(WORK_DIR, f"{months}_months")
+    if zeus_store.exists('master_raw', store_dir):
+        return store_dir
+    base = pd.read_csv(os.path.join(ROOT, 'zeus_dataset_raw_newdata.csv'))
+    base['datetime'] = zeus_store.parse_datetime(base['datetime'])
+    span = base['datetime'].max() - base['datetime'].min() + pd.Timedelta(minutes=5)
+    copies = int(np.ceil(pd.Timedelta(days=30 * months) / span))
+
+    def chunks():
+        for k in range(copies - 1, -1, -1):
+            part = base.copy()
+            part['datetime'] -= span * k
+            part['unix_time'] -= int(span.total_seconds()) * k
+            yield part
+
+    zeus_store.write_chunks(chunks(), 'master_raw', store_dir)
+    return store_dir
+
+
+def legacy_clean(store_dir):
+    # ลอกมาจาก clean_data.ipynb ก่อนย้ายไป zeus_clean.py
+    df = zeus_store.read_dataset('master_raw', store_dir=store_dir)
+    df = df[df['timezone'].str.strip() != 'Africa/Malabo']
+    df = df.dropna(subset=['station_id'])
+    df = df.dropna(subset=['datetime'])
+    df = df.drop_duplicates(subset=['datetime'], keep='last')
+    df = df.sort_values('datetime')
+    df = df.replace(-999, np.nan)
+    df['lat'] = df['lat'].replace(0, np.nan)
+    df['long'] = df['long'].replace(0, np.nan)
+    for col in ['temp', 'humidity', 'pressure', 'co2', 'pm25', 'uv']:
+        mean = df[col].mean()
+        std = df[col].std()
+        if std > 0:
+            z_scores = np.abs((df[col] - mean) / std)
+            df.loc[z_scores > 5, col] = np.nan
+    df = df.dropna(subset=['temp', 'humidity', 'pressure', 'rain', 'uv', 'wind_speed'])
+    df['hour'] = df['datetime'].dt.hour
+    df['is_day'] = df['hour'].apply(lambda x: 1 if 6 <= x <= 18 else 0).astype(int)
+    df['rain_clean'] = df['rain'].apply(lambda x: 1 if x > 0.05 else 0).astype(int)
+    df['month'] = df['datetime'].dt.month
+    zeus_store.write_dataset(df, 'cleaned_legacy', store_dir)
+    return len(df)
+
+
+def peak_rss_kb():
+    # VmHWM เริ่มนับใหม่หลัง exec (ru_maxrss ติดค่าสูงสุดของ process แม่มาด้วย)
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1])
+    return 0
+
+
+def child(kind, store_dir):
+    from zeus_registry import current_rss_bytes
+    base_kb = current_rss_bytes() / 1024
+    t0 = time.perf_counter()
+    if kind == 'legacy':
+        rows = legacy_clean(store_dir)
+    else:
+        rows = zeus_clean.clean_dataset('master_raw', 'cleaned', store_dir)['rows_out']
+    seconds = time.perf_counter() - t0
+    peak_mb = (peak_rss_kb() - base_kb) / 1024
+    print(json.dumps({'seconds': seconds, 'peak_mb': peak_mb, 'rows': rows}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="เทียบการทำความสะอาดแบบโหลดทั้งก้อนกับ zeus_clean")
+    parser.add_argument('--months', type=int, nargs='+', default=[3, 12, 24])
+    parser.add_argument('--child', nargs=2, metavar=('KIND', 'STORE_DIR'))
+    args = parser.parse_args()
+    zeus_store.use_system_memory_pool()
+    if args.child:
+        child(*args.child)
+        return
+
+    rows = {}
+    for months in args.months:
+        store_dir = make_store(months)
+        n_raw = zeus_store.dataset_info('master_raw', store_dir)['rows']
+        for kind in ('legacy', 'zeus_clean'):
+            out = subprocess.run([sys.executable, __file__, '--child', kind, store_dir],
+                                 capture_output=True, text=True, check=True)
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            rows[f"{months} เดือน / {kind}"] = {
+                'raw_rows': n_raw, 'clean_rows': r['rows'],
+                'seconds': round(r['seconds'], 2), 'peak_rss_mb': round(r['peak_mb'], 1),
+            }
+        same = zeus_store.read_dataset('cleaned_legacy', store_dir=store_dir).reset_index(drop=True)
+        new = zeus_store.read_dataset('cleaned', store_dir=store_dir).reset_index(drop=True)
+        rows[f"{months} เดือน / zeus_clean"]['same_output'] = bool(
+            np.allclose(same['temp'], new['temp'], equal_nan=True) and len(same) == len(new))
+    print(pd.DataFrame(rows).T.to_string())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+import argparse
+import os
+import shutil
+import statistics
+import time
+
+import pandas as pd
+
+from _models import ROOT
+import zeus_store
+
+# ==========================================
+# Benchmark: CSV (แบบที่ notebook ใช้ส่งต่อกัน) เทียบกับ Zeus Store (Parquet แบ่งตามสถานี/วันที่)
+# ขยาย zeus_test_unseen.csv ซ้ำหลายสัปดาห์ (--weeks) ให้ขนาดใกล้ข้อมูลหลายเดือน
+# รัน: python benchmarks/bench_dataset_store.py --weeks 52
+# ==========================================
+
+WORK_DIR = os.path.join(ROOT, '.zeus_cache', 'bench_store')
+TRAIN_COLUMNS = ['datetime', 'temp', 'humidity', 'pressure', 'rain', 'uv', 'wind_speed',
+                 'hour', 'is_day', 'month', 'rain_clean']
+
+
+def make_frame(weeks):
+    # ต่อข้อมูล 7 วันจริงซ้ำๆ โดยเลื่อนเวลาถอยหลังทีละสัปดาห์
+    base = pd.read_csv(os.path.join(ROOT, 'zeus_test_unseen.csv'))
+    base['datetime'] = pd.to_datetime(base['datetime'])
+    frames = []
+    for w in range(weeks):
+        part = base.copy()
+        part['datetime'] -= pd.Timedelta(weeks=weeks - 1 - w)
+        part['unix_time'] -= (weeks - 1 - w) * 7 * 86400
+        part['month'] = part['datetime'].dt.month
+        frames.append(part)
+    return pd.concat(frames, ignore_index=True)
+
+
+def timeit(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return round(statistics.median(samples), 1)
+
+
+def dir_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(r, f)) for r, _, files in os.walk(path) for f in files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="เทียบ CSV กับ Zeus Store")
+    parser.add_argument('--weeks', type=int, default=26)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    zeus_store.use_system_memory_pool()
+
+    df = make_frame(args.weeks)
+    shutil.rmtree(WORK_DIR, ignore_errors=True)
+    os.makedirs(WORK_DIR)
+    csv_path = os.path.join(WORK_DIR, 'zeus_master_cleaned.csv')
+    start = df['datetime'].max() - pd.Timedelta(days=7)
+
+    def csv_last_week():
+        # CSV อ่านทั้งไฟล์ก่อนแล้วค่อยกรอง
+        d = pd.read_csv(csv_path, usecols=TRAIN_COLUMNS)
+        d['datetime'] = pd.to_datetime(d['datetime'])
+        return d[d['datetime'] >= start]
+
+    rows = {
+        'CSV': {
+            'write_ms': timeit(lambda: df.to_csv(csv_path, index=False), args.repeat),
+            'disk_mb': round(dir_size(csv_path) / 1024 ** 2, 2),
+            'read_all_ms': timeit(lambda: pd.read_csv(csv_path), args.repeat),
+            'read_train_cols_ms': timeit(lambda: pd.read_csv(csv_path, usecols=TRAIN_COLUMNS), args.repeat),
+            'read_last_7d_ms': timeit(csv_last_week, args.repeat),
+        },
+        'Zeus Store (Parquet)': {
+            'write_ms': timeit(lambda: zeus_store.write_dataset(df, 'cleaned', WORK_DIR), args.repeat),
+            'disk_mb': round(dir_size(zeus_store.dataset_path('cleaned', WORK_DIR)) / 1024 ** 2, 2),
+            'read_all_ms': timeit(lambda: zeus_store.read_dataset('cleaned', store_dir=WORK_DIR), args.repeat),
+            'read_train_cols_ms': timeit(
+                lambda: zeus_store.read_dataset('cleaned', TRAIN_COLUMNS, store_dir=WORK_DIR), args.repeat),
+            'read_last_7d_ms': timeit(
+                lambda: zeus_store.read_dataset('cleaned', TRAIN_COLUMNS, start=start, store_dir=WORK_DIR), args.repeat),
+        },
+    }
+    # ผลที่อ่านได้ต้องเท่ากัน (ต่างกันแค่ความละเอียด float32)
+    a = csv_last_week().reset_index(drop=True)
+    b = zeus_store.read_dataset('cleaned', TRAIN_COLUMNS, start=start, store_dir=WORK_DIR)
+    max_diff = (a['temp'] - b['temp'].astype('float64')).abs().max()
+    print(f"ข้อมูล: {len(df):,} แถว ({args.weeks} สัปดาห์) | 7 วันล่าสุด {len(b):,} แถว | ผลต่าง temp สูงสุด {max_diff:.1e}")
+    print(pd.DataFrame(rows).T.to_string())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from _models import ROOT, load_or_train_models
+from zeus_forest import export_model, load_flat_forest
+from zeus_inference import MODEL_FEATURES
+from zeus_registry import current_rss_bytes
+
+# ==========================================
+# Benchmark: joblib.load(zeus_oracle_model.pkl) vs Flat Forest (.npy)
+# วัดเวลาโหลด / RSS (ใน process แยก) / latency ตอนทำนาย 1 แถวกับ 24 แถว
+# รัน: python benchmarks/bench_flat_forest.py
+# ==========================================
+
+warnings.filterwarnings("ignore")
+
+
+def child_load(kind, path):
+    # รันใน process ใหม่ เพื่อให้ RSS ไม่ปนกับของที่โหลดไว้แล้ว
+    rss_before = current_rss_bytes()
+    t0 = time.perf_counter()
+    if kind == 'pickle':
+        model = joblib.load(path)
+    else:
+        model = load_flat_forest(path, mmap_mode='r' if kind == 'flat-mmap' else None)
+    elapsed = time.perf_counter() - t0
+    print(json.dumps({'load_s': elapsed, 'rss_mb': (current_rss_bytes() - rss_before) / 1024 ** 2}))
+    del model
+
+
+def measure_load(kind, path, runs=3):
+    results = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, __file__, '--child', kind, path],
+                             capture_output=True, text=True, check=True, cwd=os.path.dirname(__file__))
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {
+        'load_ms': statistics.median(r['load_s'] for r in results) * 1000,
+        'rss_mb': statistics.median(r['rss_mb'] for r in results),
+    }
+
+
+def latency_ms(fn, repeat):
+    fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--models-dir', default=ROOT)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--child', nargs=2, metavar=('KIND', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child_load(*args.child)
+
+    models, kind = load_or_train_models(args.models_dir)
+    model = models['temp']
+    features = list(MODEL_FEATURES['temp'])
+    X = pd.read_csv(os.path.join(ROOT, 'zeus_test_unseen.csv'), usecols=features)[features]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # บันทึกแบบเดียวกับ train_model.ipynb (compress=3)
+        pkl = os.path.join(tmp, 'zeus_oracle_model.pkl')
+        joblib.dump(model, pkl, compress=3)
+        forest = export_model(model, 'temp', flat_dir=tmp, source_path=pkl)
+        meta = os.path.join(tmp, 'temp', 'meta.json')
+
+        X24 = np.ascontiguousarray(X.iloc[:24].to_numpy(np.float32))
+        max_diff = float(np.max(np.abs(model.predict(X) - forest.predict(X))))
+
+        rows = {}
+        for label, load_kind, path in [('sklearn joblib.load (compress=3)', 'pickle', pkl),
+                                       ('flat forest np.load', 'flat', meta),
+                                       ('flat forest mmap', 'flat-mmap', meta)]:
+            rows[label] = measure_load(load_kind, path)
+
+        rows['sklearn joblib.load (compress=3)'].update(
+            predict_1_ms=latency_ms(lambda: model.predict(X.iloc[:1]), args.repeat),
+            predict_24_ms=latency_ms(lambda: model.predict(X.iloc[:24]), args.repeat))
+        mapped = load_flat_forest(meta, mmap_mode='r')
+        for label, f in (('flat forest np.load', forest), ('flat forest mmap', mapped)):
+            rows[label].update(
+                predict_1_ms=latency_ms(lambda: f.predict_matrix(X24[:1]), args.repeat),
+                predict_24_ms=latency_ms(lambda: f.predict_matrix(X24), args.repeat))
+
+        print(f"โมเดล temp ({kind}): {forest.meta['n_trees']} ต้น, {forest.meta['n_nodes']:,} nodes | "
+              f"pkl {os.path.getsize(pkl) / 1024 ** 2:.1f} MB | flat {forest.nbytes / 1024 ** 2:.1f} MB | "
+              f"ผลต่างสูงสุดกับ sklearn: {max_diff:.2e}")
+        print(pd.DataFrame(rows).T.round(2).to_string())
+
+
+if __name__ == '__main__':
+    main()
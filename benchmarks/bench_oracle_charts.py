@@ -0,0 +1,123 @@
+import argparse
+import statistics
+import time
+import warnings
+from datetime import datetime
+
+import pandas as pd
+import plotly
+import plotly.graph_objects as go
+import plotly.io as pio
+import pytz
+from plotly.subplots import make_subplots
+
+from _models import ROOT, load_or_train_models, synthetic_hourly
+from zeus_charts import ORACLE_TABS, oracle_figures
+from zeus_forecast import compute_forecast, issue_hour
+from zeus_inference import OracleEngine
+
+# ==========================================
+# Microbenchmark: กราฟหน้า Oracle ต่อการเปิดหน้า 1 ครั้ง (ขนาด spec ที่ส่ง + เวลาฝั่ง server)
+# - legacy: สร้าง go.Figure 4 รูป (template plotly_dark เต็ม) ทุก rerun แล้วส่งทั้ง 4 แท็บ
+# - cached: รูปแบบเดิมแต่สร้างครั้งเดียวต่อผลพยากรณ์ (ยังส่งทั้ง 4 แท็บ)
+# - compact + lazy: zeus_charts (float32, x0/dx, template ย่อ) ส่งเฉพาะแท็บที่เปิด
+# รัน: python benchmarks/bench_oracle_charts.py --repeat 200
+# ==========================================
+
+warnings.filterwarnings("ignore")
+
+
+def legacy_figures(forecast):
+    # ลอกมาจาก build_oracle_figures() ใน app.py ก่อนย้ายไป zeus_charts
+    times, hourly = forecast.times, forecast.api
+    fig_temp = go.Figure()
+    fig_temp.add_trace(go.Scatter(x=times, y=forecast.preds['temp'], name='Zeus Oracle Model (Local)',
+                                  line=dict(color='#FFD700', width=4)))
+    fig_temp.add_trace(go.Scatter(x=times, y=hourly['temperature_2m'][:24], name='Standard API',
+                                  line=dict(color='gray', dash='dot', width=2)))
+    fig_temp.update_layout(template="plotly_dark", title="เปรียบเทียบอุณหภูมิ (Temperature)",
+                           yaxis_title="°C", hovermode="x unified")
+
+    fig_hum = go.Figure()
+    fig_hum.add_trace(go.Scatter(x=times, y=forecast.preds['humidity'], name='Zeus Oracle Model',
+                                 line=dict(color='#00BFFF', width=4)))
+    fig_hum.add_trace(go.Scatter(x=times, y=hourly['relative_humidity_2m'][:24], name='API Base',
+                                 line=dict(color='gray', dash='dot', width=2)))
+    fig_hum.update_layout(template="plotly_dark", title="เปรียบเทียบความชื้น (Humidity)",
+                          yaxis_title="%", hovermode="x unified")
+
+    fig_uv = go.Figure()
+    fig_uv.add_trace(go.Scatter(x=times, y=forecast.preds['uv'], name='Zeus Oracle Model',
+                                line=dict(color='#FFA500', width=4)))
+    fig_uv.add_trace(go.Scatter(x=times, y=hourly['uv_index'][:24], name='API Base',
+                                line=dict(color='gray', dash='dot', width=2)))
+    fig_uv.update_layout(template="plotly_dark", title="เปรียบเทียบดัชนี UV",
+                         yaxis_title="Index", hovermode="x unified")
+
+    fig_rain = make_subplots(specs=[[{"secondary_y": True}]])
+    fig_rain.add_trace(go.Bar(x=times, y=forecast.preds['rain'], name='Zeus Oracle Model (Probability %)',
+                              marker_color='#1E90FF', opacity=0.6), secondary_y=False)
+    fig_rain.add_trace(go.Scatter(x=times, y=hourly['rain'][:24], name='API Rain (mm)',
+                                  line=dict(color='white', dash='solid')), secondary_y=True)
+    fig_rain.update_layout(template="plotly_dark", title="เปรียบเทียบฝน: โอกาสตก (AI) vs ปริมาณ (API)",
+                           hovermode="x unified")
+    fig_rain.update_yaxes(title_text="Zeus: Rain Probability (%)", secondary_y=False, range=[0, 100])
+    fig_rain.update_yaxes(title_text="API: Rain Amount (mm)", secondary_y=True)
+    return {'temp': fig_temp, 'humidity': fig_hum, 'uv': fig_uv, 'rain': fig_rain}
+
+
+def plotly_chart_spec(figure):
+    # สิ่งที่ st.plotly_chart ทำกับ figure ทุกครั้งที่ถูกเรียก (streamlit/elements/plotly_chart.py)
+    figure = plotly.tools.return_figure_from_figure_or_data(figure, validate_figure=True)
+    return pio.to_json(figure, validate=False)
+
+
+def page_view(get_figures, names):
+    figures = get_figures()
+    return sum(len(plotly_chart_spec(figures[name]).encode('utf-8')) for name in names)
+
+
+def measure(fn, repeat):
+    payload = fn()  # warm-up
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return {
+        'payload_kb': payload / 1024,
+        'mean_ms': statistics.fmean(samples),
+        'p50_ms': samples[len(samples) // 2],
+        'p95_ms': samples[int(len(samples) * 0.95) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="วัดขนาด / เวลาของกราฟหน้า Oracle ต่อการเปิดหน้า")
+    parser.add_argument('--models-dir', default=ROOT)
+    parser.add_argument('--repeat', type=int, default=100)
+    args = parser.parse_args()
+
+    models, kind = load_or_train_models(args.models_dir)
+    engine = OracleEngine(models)
+    issued_at = issue_hour(datetime.now(pytz.timezone('Asia/Bangkok')).timestamp())
+    forecast = compute_forecast({'hourly': synthetic_hourly()}, issued_at, engine, engine)
+
+    all_tabs = [name for name, _ in ORACLE_TABS]
+    cached_legacy = legacy_figures(forecast)
+    cached_compact = oracle_figures(forecast)
+    rows = {
+        'legacy (build 4 + send 4)': measure(lambda: page_view(lambda: legacy_figures(forecast), all_tabs),
+                                             args.repeat),
+        'cached (send 4)': measure(lambda: page_view(lambda: cached_legacy, all_tabs), args.repeat),
+        'compact + lazy (send 1 tab)': measure(lambda: page_view(lambda: cached_compact, all_tabs[:1]),
+                                               args.repeat),
+        'compact (send 4)': measure(lambda: page_view(lambda: cached_compact, all_tabs), args.repeat),
+    }
+    print(f"โมเดล: {kind} | เวลา = สร้างกราฟ (ถ้ามี) + serialize แบบ st.plotly_chart ต่อการเปิดหน้า Oracle 1 ครั้ง")
+    print(pd.DataFrame(rows).T.round(2).to_string())
+
+
+if __name__ == '__main__':
+    main()
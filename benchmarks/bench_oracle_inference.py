@@ -0,0 +1,102 @@
+import argparse
+import statistics
+import time
+import warnings
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from _models import ROOT, load_or_train_models, synthetic_hourly
+from zeus_inference import OracleEngine, build_hourly_matrix
+
+# ==========================================
+# Microbenchmark: หน้า Oracle แบบเดิม (DataFrame + predict 4 ครั้ง)
+# เทียบกับ OracleEngine (Matrix float32 ชุดเดียว)
+# รัน: python benchmarks/bench_oracle_inference.py --repeat 200
+# ==========================================
+
+warnings.filterwarnings("ignore")
+
+
+def legacy_predict(hourly, models, current_dt):
+    # ลอกมาจาก page_oracle() ก่อนเปลี่ยนเป็น Engine
+    next_24_hours, month_list = [], []
+    for i in range(24):
+        future_time = current_dt + timedelta(hours=i)
+        next_24_hours.append(future_time.hour)
+        month_list.append(future_time.month)
+    is_day_list = [1 if 6 <= h <= 18 else 0 for h in next_24_hours]
+    uv_corrected = [0.0 if is_day_list[i] == 0 else v for i, v in enumerate(hourly['uv_index'][:24])]
+    future_df = pd.DataFrame({
+        'temp': hourly['temperature_2m'][:24],
+        'humidity': hourly['relative_humidity_2m'][:24],
+        'pressure': hourly['surface_pressure'][:24],
+        'rain': hourly['rain'][:24],
+        'uv': uv_corrected,
+        'wind_speed': hourly['wind_speed_10m'][:24],
+        'hour': next_24_hours,
+        'is_day': is_day_list,
+        'month': month_list,
+    })
+    X_temp = future_df[['humidity', 'pressure', 'rain', 'uv', 'wind_speed', 'hour', 'is_day', 'month']]
+    X_hum = future_df[['temp', 'pressure', 'rain', 'uv', 'wind_speed', 'hour', 'is_day', 'month']]
+    X_rain = future_df[['temp', 'humidity', 'pressure', 'uv', 'wind_speed', 'hour', 'is_day', 'month']]
+    X_uv = future_df[['temp', 'humidity', 'pressure', 'rain', 'wind_speed', 'hour', 'is_day', 'month']]
+    return {
+        'temp': models['temp'].predict(X_temp),
+        'humidity': models['humidity'].predict(X_hum),
+        'rain': models['rain'].predict_proba(X_rain)[:, 1] * 100,
+        'uv': models['uv'].predict(X_uv),
+    }
+
+
+def engine_predict(hourly, engine, current_dt):
+    X, _ = build_hourly_matrix(hourly, current_dt, hours=24)
+    return engine.predict(X)
+
+
+def timeit(fn, repeat):
+    fn()  # warm-up
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return {
+        'mean_ms': statistics.fmean(samples),
+        'p50_ms': samples[len(samples) // 2],
+        'p95_ms': samples[int(len(samples) * 0.95) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--models-dir', default=ROOT)
+    parser.add_argument('--repeat', type=int, default=100)
+    args = parser.parse_args()
+
+    models, kind = load_or_train_models(args.models_dir)
+    hourly = synthetic_hourly()
+    current_dt = datetime.now(pytz.timezone('Asia/Bangkok'))
+
+    t0 = time.perf_counter()
+    engine = OracleEngine(models)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    old = legacy_predict(hourly, models, current_dt)
+    new = engine_predict(hourly, engine, current_dt)
+    max_diff = max(float(np.max(np.abs(old[k] - new[k]))) for k in old)
+
+    rows = {
+        'legacy (DataFrame + 4x predict)': timeit(lambda: legacy_predict(hourly, models, current_dt), args.repeat),
+        'OracleEngine (float32 matrix)': timeit(lambda: engine_predict(hourly, engine, current_dt), args.repeat),
+    }
+    print(f"โมเดล: {kind} | สร้าง Engine (ตรวจ Feature ครั้งเดียว): {build_ms:.1f} ms | ผลต่างสูงสุด: {max_diff:.2e}")
+    print(pd.DataFrame(rows).T.round(3).to_string())
+
+
+if __name__ == '__main__':
+    main()
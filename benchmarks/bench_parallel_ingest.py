@@ -0,0 +1,103 @@
+import argparse
+import contextlib
+import glob
+import io
+import os
+import random
+import shutil
+import time
+
+import pandas as pd
+
+from _models import ROOT
+import merge_data
+
+# ==========================================
+# Benchmark: รวม Log รายวันด้วย merge_data.ingest() แบบ 1..N process
+# สร้างชุดข้อมูลจำลอง (ค่าเริ่มต้น 1,000 ไฟล์รายวัน) จากบรรทัดจริงใน dataset_new/
+# รัน: python benchmarks/bench_parallel_ingest.py --files 1000 --workers 1 2 4 8
+# ==========================================
+
+CORPUS_DIR = os.path.join(ROOT, '.zeus_cache', 'bench_ingest')
+LINES_PER_DAY = 288  # ทุก 5 นาที
+START_UNIX = 1704042000  # 2024-01-01 00:00 (Asia/Bangkok)
+
+
+def make_corpus(n_files, corpus_dir=CORPUS_DIR, source_dir=os.path.join(ROOT, 'dataset_new'), seed=42):
+    # ใช้บรรทัดจริงเป็นแม่แบบ แล้วเปลี่ยนเวลาให้เป็นวันของไฟล์นั้น (บรรทัด debug ที่ไม่ครบ 26 ค่าติดมาด้วย)
+    folder = os.path.join(corpus_dir, f"{n_files}_files")
+    if os.path.isdir(folder) and len(os.listdir(folder)) == n_files:
+        return folder
+    shutil.rmtree(folder, ignore_errors=True)
+    os.makedirs(folder)
+
+    templates = []
+    for path in sorted(glob.glob(os.path.join(source_dir, '*'))):
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            templates.extend(line.rstrip('\n') for line in f)
+    rng = random.Random(seed)
+    for day in range(n_files):
+        lines = []
+        for k in range(LINES_PER_DAY):
+            line = rng.choice(templates)
+            head, sep, payload = line.partition('] ')
+            fields = payload.split(',')
+            if sep and len(fields) == len(merge_data.column_names):
+                ts = START_UNIX + day * 86400 + k * 300
+                fields[0] = str(ts)
+                fields[2] = time.strftime('%Y-%m-%d %H:%M', time.gmtime(ts + 7 * 3600))
+                line = head + sep + ','.join(fields)
+            lines.append(line)
+        name = time.strftime('%Y%m%d', time.gmtime(START_UNIX + day * 86400 + 7 * 3600))
+        with open(os.path.join(folder, name), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+    return folder
+
+
+def run_ingest(folder, output, workers):
+    t0 = time.perf_counter()
+    manifest, rows = merge_data.ingest(folder, output, rebuild=True, workers=workers)
+    return time.perf_counter() - t0, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="วัดการรวม Log แบบขนาน")
+    parser.add_argument('--files', type=int, default=1000)
+    parser.add_argument('--workers', type=int, nargs='+', default=None)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    workers_list = args.workers or sorted({1, 2, 4, cpus} | ({8} if cpus >= 8 else set()))
+    folder = make_corpus(args.files)
+    size_mb = sum(os.path.getsize(p) for p in glob.glob(os.path.join(folder, '*'))) / 1024 ** 2
+    print(f"ชุดข้อมูล: {args.files} ไฟล์ ({size_mb:.1f} MB) | CPU: {cpus} core")
+
+    out_dir = os.path.join(CORPUS_DIR, 'out')
+    os.makedirs(out_dir, exist_ok=True)
+    rows, baseline, reference = {}, None, None
+    for workers in workers_list:
+        output = os.path.join(out_dir, f"merged_w{workers}.csv")
+        samples = []
+        for _ in range(args.repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                seconds, n_rows = run_ingest(folder, output, workers)
+            samples.append(seconds)
+        best = min(samples)
+        baseline = baseline or best
+        # ผลต้องเหมือนกันทุกจำนวน worker
+        merged = pd.read_csv(output)
+        same = True if reference is None else merged.equals(reference)
+        reference = merged if reference is None else reference
+        rows[f"{workers} worker(s)"] = {
+            'best_s': round(best, 3),
+            'rows': n_rows,
+            'rows_per_s': round(n_rows / best),
+            'speedup': round(baseline / best, 2),
+            'same_output': same,
+        }
+    print(pd.DataFrame(rows).T.to_string())
+
+
+if __name__ == '__main__':
+    main()
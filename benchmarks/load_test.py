@@ -0,0 +1,391 @@
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+
+from _models import ROOT, load_or_train_models
+from openmeteo_stub import start_stub
+
+# ==========================================
+# Load test ของหน้าเว็บ: จำลอง N session พร้อมกัน เปิด Zeus Eye -> The Zeus Oracle -> Ark Zeus Chat (+ ส่งข้อความ)
+# Open-Meteo ถูกแทนด้วย stub ในเครื่อง (ZEUS_OPEN_METEO_URL) วัดได้โดยไม่ต้องต่ออินเทอร์เน็ต
+# --mode apptest: รันสคริปต์ใน process นี้ด้วย Streamlit AppTest (ไม่ต้องเปิด server)
+#                 AppTest ใช้ Runtime ตัวเดียวทั้ง process จึงรันได้ทีละ rerun -> เวลาที่วัดรวมเวลารอคิวด้วย
+# --mode server:  เปิด `streamlit run app.py` จริง (หรือ --url ของ server ที่รันอยู่) แล้วต่อ WebSocket
+#                 เหมือน browser N ตัวพร้อมกัน (CPU / RSS อ่านจาก /proc ของ server process)
+# รายงาน p50/p95/p99 ของเวลา rerun แยกตามหน้า, Cold start, เวลาโหลดโมเดล (Model Registry), CPU และ RSS ต่อ session
+# --save เก็บผลเป็น JSON, --baseline เทียบ p95 กับผลเดิม (ช้าลงเกิน --tolerance = exit 1)
+# รัน: python benchmarks/load_test.py --sessions 8 --rounds 3 --latency-ms 150
+#      python benchmarks/load_test.py --mode server --sessions 20 --save load_baseline.json
+# ==========================================
+
+PAGES = ["Zeus Eye", "The Zeus Oracle", "Ark Zeus Chat"]
+CHAT_PAGE = "Ark Zeus Chat"
+CHAT_MESSAGES = ["วันนี้ร้อนไหม", "ฝนจะตกไหม", "สวัสดี"]
+PERCENTILES = (50, 95, 99)
+SERVER_START_TIMEOUT = 60
+
+# AppTest สลับ Runtime._instance ของทั้ง process ทุกครั้งที่ run -> ห้าม run ซ้อนกัน
+_APPTEST_LOCK = threading.Lock()
+
+
+def session_plan(rounds, messages):
+    # (label, หน้า, ข้อความแชท) ตามลำดับที่ผู้ใช้หนึ่งคนกด
+    plan = [('cold', None, None)]
+    for _ in range(rounds):
+        for page in PAGES:
+            plan.append((page, page, None))
+            if page == CHAT_PAGE:
+                plan.extend(('chat message', page, msg) for msg in messages)
+    return plan
+
+
+def percentile(values, q):
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[q - 1]
+
+
+def process_cpu_seconds(pid=None):
+    if pid is None:
+        return time.process_time()
+    with open(f'/proc/{pid}/stat') as f:
+        fields = f.read().rsplit(')', 1)[1].split()
+    # utime + stime (หน่วย clock tick)
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+def process_rss_mb(pid=None):
+    if pid is None:
+        from zeus_registry import current_rss_bytes
+        return current_rss_bytes() / 1024 ** 2
+    with open(f'/proc/{pid}/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+
+
+def prepare_workdir(workdir, flat=False):
+    # โฟลเดอร์ที่แอปมองเป็น cwd: มีไฟล์โมเดล (จริงหรือตัวแทน) ให้ ModelRegistry โหลด
+    from zeus_registry import MODEL_FILES
+    _, kind = load_or_train_models()
+    os.makedirs(workdir, exist_ok=True)
+    source = ROOT if kind == 'real' else os.path.join(ROOT, '.zeus_cache', 'bench_models')
+    for f in MODEL_FILES.values():
+        shutil.copyfile(os.path.join(source, f), os.path.join(workdir, f))
+    if flat:
+        from zeus_forest import export_all
+        export_all(base_dir=workdir)
+    return kind
+
+
+# ==========================================
+# โหมด AppTest (ใน process เดียวกัน)
+# ==========================================
+
+def apptest_session(app_path, plan, timeout, start_gate):
+    from streamlit.testing.v1 import AppTest
+    timings, errors = [], []
+    at = AppTest.from_file(app_path, default_timeout=timeout)
+    start_gate.wait()
+    for label, page, message in plan:
+        if page:
+            at.sidebar.radio[0].set_value(page)
+        if message:
+            at.chat_input[0].set_value(message)
+        t0 = time.perf_counter()
+        with _APPTEST_LOCK:
+            at.run()
+        timings.append((label, time.perf_counter() - t0))
+        errors.extend(e.value for e in at.exception)
+    registry = at.sidebar.dataframe[0].value if len(at.sidebar.dataframe) else None
+    return timings, errors, registry
+
+
+def run_apptest(sessions, plan, timeout):
+    app_path = os.path.join(ROOT, 'app.py')
+    gate = threading.Barrier(sessions)
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        futures = [pool.submit(apptest_session, app_path, plan, timeout, gate) for _ in range(sessions)]
+        return [f.result() for f in futures]
+
+
+# ==========================================
+# โหมด Server (WebSocket เหมือน browser)
+# ==========================================
+
+class ServerSession:
+    # คุยกับ /_stcore/stream ด้วย BackMsg / ForwardMsg (protobuf) แบบเดียวกับหน้าเว็บ
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.widget_ids = {}
+        self.page = PAGES[0]
+        self.registry = None
+
+    async def rerun(self, page=None, message=None):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        self.page = page or self.page
+        msg = BackMsg()
+        msg.rerun_script.query_string = ''
+        # ส่งค่าหน้าปัจจุบันทุกครั้ง (widget ที่ไม่ส่งจะกลับเป็นค่าเริ่มต้น)
+        if 'radio' in self.widget_ids:
+            widget = msg.rerun_script.widget_states.widgets.add()
+            widget.id, widget.string_value = self.widget_ids['radio'], self.page
+        if message and 'chat_input' in self.widget_ids:
+            widget = msg.rerun_script.widget_states.widgets.add()
+            widget.id = self.widget_ids['chat_input']
+            widget.chat_input_value.data = message
+        await self.ws.send(msg.SerializeToString())
+
+        errors = []
+        while True:
+            fm = ForwardMsg()
+            fm.ParseFromString(await self.ws.recv())
+            kind = fm.WhichOneof('type')
+            if kind == 'delta' and fm.delta.WhichOneof('type') == 'new_element':
+                element = fm.delta.new_element
+                name = element.WhichOneof('type')
+                if name in ('radio', 'chat_input'):
+                    self.widget_ids[name] = getattr(element, name).id
+                elif name == 'exception':
+                    errors.append(element.exception.message)
+                elif name == 'dataframe':
+                    self.registry = element.dataframe.arrow_data.data
+            # หน้าแชทเรียก st.rerun() หลังตอบ -> รอรอบถัดไปจนจบจริง
+            elif kind == 'script_finished' and fm.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                return errors
+
+    def registry_table(self):
+        if not self.registry:
+            return None
+        import pyarrow as pa
+        return pa.ipc.open_stream(self.registry).read_pandas()
+
+
+async def server_session(url, plan, timeout):
+    import websockets
+    timings, errors = [], []
+    async with websockets.connect(url, subprotocols=['streamlit'], max_size=None) as ws:
+        session = ServerSession(ws)
+        for label, page, message in plan:
+            t0 = time.perf_counter()
+            errors.extend(await asyncio.wait_for(session.rerun(page, message), timeout))
+            timings.append((label, time.perf_counter() - t0))
+    return timings, errors, session.registry_table()
+
+
+async def _run_server_sessions(url, sessions, plan, timeout):
+    return await asyncio.gather(*(server_session(url, plan, timeout) for _ in range(sessions)))
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(workdir, port):
+    cmd = [sys.executable, '-m', 'streamlit', 'run', os.path.join(ROOT, 'app.py'),
+           '--server.headless', 'true', '--server.port', str(port), '--browser.gatherUsageStats', 'false']
+    proc = subprocess.Popen(cmd, cwd=workdir, env=dict(os.environ),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + SERVER_START_TIMEOUT
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"streamlit ปิดตัวทันที (exit {proc.returncode})")
+        try:
+            if requests.get(f'http://127.0.0.1:{port}/_stcore/health', timeout=1).ok:
+                return proc
+        except requests.RequestException:
+            pass
+        time.sleep(0.25)
+    proc.kill()
+    raise RuntimeError(f"streamlit ไม่ตอบภายใน {SERVER_START_TIMEOUT} วินาที")
+
+
+def ws_url(url):
+    url = url.rstrip('/')
+    if url.startswith('http'):
+        url = 'ws' + url[len('http'):]
+    return url + '/_stcore/stream'
+
+
+# ==========================================
+# รวมผล
+# ==========================================
+
+def latency_row(values):
+    values = sorted(values)
+    return {'n': len(values), **{f"p{q}_ms": round(percentile(values, q) * 1000, 1) for q in PERCENTILES},
+            'max_ms': round(values[-1] * 1000, 1)}
+
+
+def summarize(results):
+    by_label, errors = {}, []
+    for timings, errs, _ in results:
+        errors.extend(errs)
+        for label, seconds in timings:
+            by_label.setdefault(label, []).append(seconds)
+    latency = {label: latency_row(by_label[label]) for label in ['cold', *PAGES, 'chat message'] if label in by_label}
+    warm = [s for label, values in by_label.items() if label != 'cold' for s in values]
+    if warm:
+        latency['all (warm)'] = latency_row(warm)
+
+    model_load = {}
+    registry = next((r for _, _, r in results if r is not None), None)
+    if registry is not None:
+        if 'model' in registry.columns:
+            registry = registry.set_index('model')
+        model_load = {model: {'load_time_s': row['load_time_s'], 'rss_mb': row['rss_mb'], 'format': row['format']}
+                      for model, row in registry.to_dict('index').items()}
+    return latency, sorted(set(errors)), model_load
+
+
+def load_test(sessions=4, rounds=2, messages=CHAT_MESSAGES, latency_ms=0, timeout=120, flat=False,
+              workdir=None, mode='apptest', url=None, pid=None):
+    plan = session_plan(rounds, messages)
+    stub, proc, kind = None, None, 'remote'
+    if url is None:
+        workdir = workdir or tempfile.mkdtemp(prefix='zeus_load_')
+        kind = prepare_workdir(workdir, flat) + (' (flat)' if flat else '')
+        stub = start_stub(latency_ms=latency_ms)
+        # ตั้งค่าก่อนแอป import zeus_weather (อ่าน env ตอน import) / server process รับ env ต่อไป
+        os.environ['ZEUS_OPEN_METEO_URL'] = stub.url
+        os.environ['ZEUS_CACHE_DIR'] = os.path.join(workdir, '.zeus_cache')
+
+    try:
+        if mode == 'server':
+            if url is None:
+                port = free_port()
+                proc = start_server(workdir, port)
+                url, pid = f'http://127.0.0.1:{port}', proc.pid
+        else:
+            os.chdir(workdir)
+        # วัด CPU / RSS เฉพาะเมื่อรู้ process ของแอป (apptest = process นี้)
+        measure = mode == 'apptest' or pid is not None
+        target = pid if mode == 'server' else None
+        rss_before = process_rss_mb(target) if measure else None
+        cpu_before = process_cpu_seconds(target) if measure else None
+
+        t0 = time.perf_counter()
+        if mode == 'server':
+            results = asyncio.run(_run_server_sessions(ws_url(url), sessions, plan, timeout))
+        else:
+            results = run_apptest(sessions, plan, timeout)
+        wall = time.perf_counter() - t0
+
+        cpu = process_cpu_seconds(target) - cpu_before if measure else None
+        rss_after = process_rss_mb(target) if measure else None
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(10)
+        if stub is not None:
+            stub.shutdown()
+
+    latency, errors, model_load = summarize(results)
+    reruns = sum(len(timings) for timings, _, _ in results)
+    result = {
+        'mode': mode,
+        'sessions': sessions,
+        'rounds': rounds,
+        'models': kind,
+        'api_latency_ms': latency_ms if stub else None,
+        'api_requests': stub.requests if stub else None,
+        'reruns': reruns,
+        'errors': errors,
+        'wall_s': round(wall, 2),
+        'reruns_per_s': round(reruns / wall, 1),
+        'latency': latency,
+        'model_load': model_load,
+    }
+    if measure:
+        result.update({
+            'cpu_s': round(cpu, 2),
+            'cpu_s_per_session': round(cpu / sessions, 3),
+            'cpu_ms_per_rerun': round(cpu / reruns * 1000, 1),
+            'rss_before_mb': round(rss_before, 1),
+            'rss_after_mb': round(rss_after, 1),
+            'rss_per_session_mb': round((rss_after - rss_before) / sessions, 2),
+        })
+    return result
+
+
+def compare(result, baseline, tolerance):
+    # p95 ของแต่ละหน้าช้าลงเกิน tolerance (สัดส่วน) เทียบกับ baseline = regression
+    if baseline.get('mode', result['mode']) != result['mode']:
+        return [f"baseline เป็นโหมด {baseline['mode']} แต่รอบนี้เป็น {result['mode']} (เทียบกันไม่ได้)"]
+    regressions = []
+    for label, row in result['latency'].items():
+        old = baseline.get('latency', {}).get(label)
+        if old and old['p95_ms'] > 0 and row['p95_ms'] > old['p95_ms'] * (1 + tolerance):
+            regressions.append(f"{label}: p95 {old['p95_ms']} -> {row['p95_ms']} ms")
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Zeus Streamlit load test")
+    parser.add_argument('--mode', choices=['apptest', 'server'], default='apptest')
+    parser.add_argument('--sessions', type=int, default=4, help="จำนวน session พร้อมกัน")
+    parser.add_argument('--rounds', type=int, default=2, help="จำนวนรอบที่แต่ละ session เปิดครบ 3 หน้า")
+    parser.add_argument('--messages', nargs='*', default=CHAT_MESSAGES, help="ข้อความที่ส่งในหน้าแชททุกรอบ")
+    parser.add_argument('--latency-ms', type=int, default=0, help="ความหน่วงของ Open-Meteo stub")
+    parser.add_argument('--timeout', type=float, default=120, help="timeout ต่อ rerun (วินาที)")
+    parser.add_argument('--flat', action='store_true', help="ใช้ Flat Forest (zeus_models_flat/) แทน .pkl")
+    parser.add_argument('--workdir', default=None, help="โฟลเดอร์ทำงานของแอป (ค่าเริ่มต้น: temp)")
+    parser.add_argument('--url', default=None, help="(server) ยิง server ที่รันอยู่แล้ว เช่น http://127.0.0.1:8501")
+    parser.add_argument('--pid', type=int, default=None, help="(server + --url) PID ของ server สำหรับวัด CPU/RSS")
+    parser.add_argument('--save', default=None, help="บันทึกผลเป็น JSON")
+    parser.add_argument('--baseline', default=None, help="JSON ผลรอบก่อน สำหรับเทียบ p95")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="ยอมให้ p95 ช้าลงได้กี่สัดส่วน")
+    args = parser.parse_args()
+    if args.url and args.mode != 'server':
+        parser.error("--url ใช้กับ --mode server เท่านั้น")
+
+    save = os.path.abspath(args.save) if args.save else None
+    baseline = os.path.abspath(args.baseline) if args.baseline else None
+    result = load_test(args.sessions, args.rounds, args.messages, args.latency_ms, args.timeout, args.flat,
+                       args.workdir, args.mode, args.url, args.pid)
+
+    print(f"👥 [{result['mode']}] {result['sessions']} sessions x {result['rounds']} rounds | models: {result['models']}"
+          + (f" | API stub {result['api_latency_ms']} ms ({result['api_requests']} requests)" if result['api_requests']
+             is not None else ''))
+    print(pd.DataFrame(result['latency']).T.to_string())
+    print()
+    summary = ('reruns', 'wall_s', 'reruns_per_s', 'cpu_s', 'cpu_s_per_session', 'cpu_ms_per_rerun',
+               'rss_before_mb', 'rss_after_mb', 'rss_per_session_mb')
+    print(pd.Series({k: result[k] for k in summary if k in result}).to_string())
+    if result['model_load']:
+        print()
+        print(pd.DataFrame(result['model_load']).T.to_string())
+    if result['errors']:
+        print(f"\n❌ Exception ระหว่างรัน: {result['errors']}")
+
+    if save:
+        with open(save, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 บันทึกผลที่ {save}")
+    if baseline:
+        with open(baseline, encoding='utf-8') as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        if regressions:
+            print("\n🐢 ช้าลงกว่า baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\n✅ ไม่ช้าลงกว่า baseline")
+    if result['errors']:
+        sys.exit(1)
@@ -0,0 +1,130 @@
+import argparse
+import json
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytz
+
+# ==========================================
+# Open-Meteo stub สำหรับทดสอบโหลด (ไม่ต้องต่ออินเทอร์เน็ต)
+# ตอบ /v1/forecast หน้าตาเดียวกับ Open-Meteo (current + hourly 48 ชม. เริ่มเที่ยงคืนวันนี้ตามเวลาไทย)
+# รองรับคำขอหลายพิกัด (latitude=a,b,c&longitude=x,y,z -> list)
+# ค่าเป็นรอบวันแบบ sin ตามละติจูด/ลองจิจูด (พิกัดต่างกันได้ค่าต่างกันเล็กน้อย)
+# รันแยก:  python benchmarks/openmeteo_stub.py --port 8099 --latency-ms 150
+#          ZEUS_OPEN_METEO_URL=http://127.0.0.1:8099/v1/forecast streamlit run app.py
+# ==========================================
+
+THAI_TZ = pytz.timezone('Asia/Bangkok')
+
+
+def make_payload(lat=14.16, lon=101.35, hours=48, now=None):
+    now = now or datetime.now(THAI_TZ)
+    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    shift = (lat + lon) % 1.0
+    times = [start + timedelta(hours=h) for h in range(hours)]
+    day = [math.sin((t.hour - 8) / 24 * 2 * math.pi) for t in times]
+    hourly = {
+        'time': [t.strftime('%Y-%m-%dT%H:%M') for t in times],
+        'temperature_2m': [round(28 + shift + 5 * d, 1) for d in day],
+        'relative_humidity_2m': [round(70 - 15 * d) for d in day],
+        'uv_index': [round(max(0.0, 9 * math.sin((t.hour - 6) / 12 * math.pi)), 2) for t in times],
+        'direct_radiation': [round(max(0.0, 800 * math.sin((t.hour - 6) / 12 * math.pi))) for t in times],
+        'surface_pressure': [round(1005 + math.cos(t.hour / 24 * 2 * math.pi), 1) for t in times],
+        'wind_speed_10m': [5.0 + t.hour % 3 for t in times],
+        'rain': [0.4 if t.hour in (15, 16) else 0.0 for t in times],
+    }
+    h = now.hour
+    current = {
+        'time': now.strftime('%Y-%m-%dT%H:%M'),
+        'temperature_2m': hourly['temperature_2m'][h],
+        'relative_humidity_2m': hourly['relative_humidity_2m'][h],
+        'apparent_temperature': hourly['temperature_2m'][h] + 3,
+        'is_day': 1 if 6 <= h <= 18 else 0,
+        'precipitation': hourly['rain'][h],
+        'rain': hourly['rain'][h],
+        'weather_code': 61 if hourly['rain'][h] else 1,
+        'cloud_cover': 40,
+        'pressure_msl': hourly['surface_pressure'][h] + 4,
+        'surface_pressure': hourly['surface_pressure'][h],
+        'wind_speed_10m': hourly['wind_speed_10m'][h],
+        'wind_direction_10m': 180,
+    }
+    return {'latitude': lat, 'longitude': lon, 'timezone': 'Asia/Bangkok', 'current': current, 'hourly': hourly}
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency_ms=0, fail_rate=0.0):
+        super().__init__(address, _Handler)
+        self.latency = latency_ms / 1000
+        self.fail_rate = fail_rate
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1/forecast"
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        server = self.server
+        with server._lock:
+            server.requests += 1
+            n = server.requests
+        if url.path != '/v1/forecast':
+            self.send_error(404)
+            return
+        if server.latency:
+            time.sleep(server.latency)
+        # จำลอง API ล่มเป็นบางครั้ง (ทุก 1/fail_rate คำขอ)
+        if server.fail_rate and n % max(1, round(1 / server.fail_rate)) == 0:
+            self.send_error(503)
+            return
+        query = parse_qs(url.query)
+        # หลายพิกัด (latitude=a,b&longitude=x,y) ตอบเป็น list ตามลำดับ เหมือน Open-Meteo
+        lats = [float(v) for v in query.get('latitude', ['14.16'])[0].split(',')]
+        lons = [float(v) for v in query.get('longitude', ['101.35'])[0].split(',')]
+        if len(lats) != len(lons):
+            self.send_error(400, 'latitude / longitude count mismatch')
+            return
+        payloads = [make_payload(lat, lon) for lat, lon in zip(lats, lons)]
+        body = json.dumps(payloads[0] if len(payloads) == 1 else payloads).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub(host='127.0.0.1', port=0, latency_ms=0, fail_rate=0.0):
+    # port=0 ให้ระบบเลือกพอร์ตว่างเอง; คืน server ที่รันอยู่ใน Thread เบื้องหลัง (server.url, server.requests)
+    server = StubServer((host, port), latency_ms, fail_rate)
+    threading.Thread(target=server.serve_forever, name='openmeteo-stub', daemon=True).start()
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Open-Meteo stub server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--latency-ms', type=int, default=0)
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="สัดส่วนคำขอที่ตอบ 503")
+    args = parser.parse_args()
+    server = StubServer((args.host, args.port), args.latency_ms, args.fail_rate)
+    print(f"🌦️ Open-Meteo stub: {server.url} (latency {args.latency_ms} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -1,64 +1,338 @@
-import pandas as pd
-import glob
+import argparse
+import hashlib
+import heapq
+import io
+import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# รวมไฟล์ Log ของสถานีเป็น CSV ไฟล์เดียว (แบบ Streaming + Incremental)
+# - อ่านทีละบรรทัด แปลงเป็น DataFrame ทีละก้อน (chunk) พร้อมชนิดข้อมูลตั้งแต่แรก
+# - จำไฟล์ที่เคยอ่านแล้วไว้ใน manifest (ชื่อ, ขนาด, mtime, hash) แล้วต่อท้ายเฉพาะแถวใหม่
+# - รันซ้ำบนโฟลเดอร์ที่ไม่มีอะไรเปลี่ยน -> แค่ stat ไฟล์ ไม่อ่านเนื้อไฟล์เลย
+# - --workers N: แยกไฟล์ให้ process pool อ่านพร้อมกัน แต่ละ worker คืนเป็น Array ตามคอลัมน์
+#   แล้วรวมด้วย k-way merge ตาม unix_time (ไม่ต้อง sort ทั้งก้อนใหม่)
+# ==========================================
 
 # 1. กำหนดโฟลเดอร์ที่เก็บไฟล์ (ใส่ '.' ถ้าวางไฟล์ py นี้ไว้ที่เดียวกับข้อมูล)
-folder_path = './dataset_new' 
-all_files = glob.glob(os.path.join(folder_path, "*")) # อ่านทุกไฟล์
+FOLDER_PATH = './dataset_new'
+OUTPUT_FILE = 'zeus_dataset_newdata.csv'
 
 # ชื่อ Column ตามลำดับใน Dataset (Mapping ตามที่คุณให้มา)
 # ตัดส่วน Log ขยะออก แล้วเริ่มนับที่ Unix Time
 column_names = [
-    'unix_time', 'timezone', 'datetime', 'station_id', 
-    'unk1', 'unk2', 'unk3', 'lat', 'long', 
-    'rain', 'temp', 'humidity', 'pressure', 
-    'wind_speed', 'wind_dir', 'uv', 
-    'co2', 'pm1', 'pm25', 'pm4', 'pm10', 
+    'unix_time', 'timezone', 'datetime', 'station_id',
+    'unk1', 'unk2', 'unk3', 'lat', 'long',
+    'rain', 'temp', 'humidity', 'pressure',
+    'wind_speed', 'wind_dir', 'uv',
+    'co2', 'pm1', 'pm25', 'pm4', 'pm10',
     'light_r', 'light_g', 'light_b', 'light_ir', 'light_vis'
 ]
 
-data_list = []
+# ชนิดข้อมูลของแต่ละคอลัมน์ (พิกัดใช้ float64 เพราะต้องการทศนิยม 8 ตำแหน่ง)
+COLUMN_DTYPES = {name: 'float32' for name in column_names}
+COLUMN_DTYPES.update({
+    'unix_time': 'int64',
+    'timezone': 'str',
+    'datetime': 'str',
+    'station_id': 'str',
+    'unk1': 'str',
+    'lat': 'float64',
+    'long': 'float64',
+})
+
+CHUNK_ROWS = 50_000
+HASH_BLOCK = 1 << 20
+# จำนวนไฟล์ที่รวมแล้วเขียนลง CSV ต่อรอบ (ต่อ worker) กันไม่ให้ผลทั้งโฟลเดอร์ค้างในหน่วยความจำ
+FILES_PER_WORKER = 16
+
+
+def extract_payload(line):
+    # คีย์เวิร์ดคือแยกด้วย '] ' (วงเล็บปิดและเว้นวรรค) เอาเฉพาะส่วนหลัง ] คือข้อมูล CSV จริงๆ
+    parts = line.split('] ', 2)
+    if len(parts) < 2:
+        return None
+    payload = parts[1].strip()
+    # ข้ามบรรทัด debug ของอุปกรณ์ที่ไม่ได้มี 26 ค่า
+    if payload.count(',') != len(column_names) - 1:
+        return None
+    return payload
+
+
+def payloads_to_frame(payloads):
+    # ให้ C parser ของ pandas แปลงทั้งก้อนทีเดียว พร้อมชนิดข้อมูลที่กำหนด
+    df = pd.read_csv(io.StringIO('\n'.join(payloads)), header=None, names=column_names,
+                     dtype=COLUMN_DTYPES, na_values=['', 'nan'], keep_default_na=False)
+    # แปลงเวลาให้เป็นมาตรฐาน
+    df['datetime'] = pd.to_datetime(df['datetime'], format='%Y-%m-%d %H:%M', errors='coerce')
+    return df
+
 
-print(f"กำลังค้นหาไฟล์... เจอทั้งหมด {len(all_files)} ไฟล์")
+def iter_file_chunks(path, offset=0, chunk_rows=CHUNK_ROWS):
+    # อ่านไฟล์ตั้งแต่ byte ที่ offset เป็นต้นไป คืน (DataFrame, offset ใหม่) ทีละก้อน
+    # บรรทัดสุดท้ายที่ยังเขียนไม่เสร็จ (ไม่มี \n) จะยังไม่ถูกนับ
+    payloads = []
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b'\n'):
+                break
+            offset += len(raw)
+            payload = extract_payload(raw.decode('utf-8', errors='ignore'))
+            if payload is not None:
+                payloads.append(payload)
+            if len(payloads) >= chunk_rows:
+                yield payloads_to_frame(payloads), offset
+                payloads = []
+    if payloads:
+        yield payloads_to_frame(payloads), offset
+    else:
+        yield None, offset
 
-for filename in all_files:
-    # ข้ามไฟล์ script ของเราเอง หรือไฟล์ csv ที่อาจจะเคยสร้างไว้
-    if filename.endswith('.py') or filename.endswith('.csv'):
-        continue
-        
+
+def prefix_sha256(path, length):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        remaining = length
+        while remaining > 0:
+            block = f.read(min(HASH_BLOCK, remaining))
+            if not block:
+                break
+            h.update(block)
+            remaining -= len(block)
+    return h.hexdigest()
+
+
+# --- โหมดขนาน: worker อ่านทั้งไฟล์แล้วคืนเป็นคอลัมน์ ---
+def parse_file_columns(task):
+    # task = (path, offset) -> dict ของ Array แต่ละคอลัมน์ เรียงตาม unix_time แล้ว
+    # (ส่งกลับข้าม process เป็น buffer ของ NumPy แทน list ของ string)
+    path, offset = task
+    result = {'path': path, 'columns': None, 'offset': offset, 'sha256': '', 'error': '', 'stat': None}
     try:
-        # เปิดไฟล์มาอ่านทีละบรรทัด เพื่อตัดส่วน Header ขยะทิ้ง
-        with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-            
-        cleaned_data = []
-        for line in lines:
-            # คีย์เวิร์ดคือแยกด้วย '] ' (วงเล็บปิดและเว้นวรรค)
-            if '] ' in line:
-                # เอาเฉพาะส่วนหลัง ]  คือข้อมูล CSV จริงๆ
-                clean_line = line.split('] ')[1].strip()
-                cleaned_data.append(clean_line.split(','))
-        
-        # แปลงเป็น DataFrame
-        df = pd.DataFrame(cleaned_data, columns=column_names)
-        data_list.append(df)
-        print(f"อ่านไฟล์ {filename} สำเร็จ!")
-        
+        # stat ก่อนอ่าน: บรรทัดที่ต่อท้ายระหว่างอ่านต้องไม่ถูกนับว่าอ่านแล้ว
+        st = os.stat(path)
+        result['stat'] = (st.st_size, st.st_mtime_ns)
+        frames = [df for df, result['offset'] in iter_file_chunks(path, offset, CHUNK_ROWS) if df is not None]
+        if frames:
+            df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+            unix_time = df['unix_time'].to_numpy()
+            order = np.argsort(unix_time, kind='stable')
+            result['columns'] = {name: df[name].to_numpy()[order] for name in df.columns}
+        result['sha256'] = prefix_sha256(path, result['offset'])
     except Exception as e:
-        print(f"อ่านไฟล์ {filename} ไม่ได้: {e}")
+        result['error'] = str(e)
+    return result
 
-# รวมทุกไฟล์เป็นก้อนเดียว
-if data_list:
-    final_df = pd.concat(data_list, ignore_index=True)
-    
-    # แปลงเวลาให้เป็นมาตรฐาน
-    final_df['datetime'] = pd.to_datetime(final_df['datetime'])
-    final_df = final_df.sort_values('datetime') # เรียงตามเวลา
-    
-    # Save เป็น CSV ไฟล์เดียวจบ
-    final_df.to_csv("zeus_dataset_newdata.csv", index=False)
+
+def kway_merge_order(keys):
+    # keys: Array ที่เรียงแล้วหลายชุด -> ลำดับ index (ของ Array ที่ต่อกัน) ที่เรียงรวมกันแล้ว
+    # ไฟล์รายวันแทบไม่ทับช่วงเวลากัน จึงหยิบเป็นช่วงยาวๆ ด้วย searchsorted (galloping)
+    # แทนการเทียบทีละแถว; ค่าเท่ากันให้ชุดที่มาก่อนได้ก่อน (stable)
+    starts = np.cumsum([0] + [len(k) for k in keys[:-1]])
+    heap = [(k[0], i, 0) for i, k in enumerate(keys) if len(k)]
+    heapq.heapify(heap)
+    pieces = []
+    while heap:
+        _, i, pos = heapq.heappop(heap)
+        run = keys[i]
+        if heap:
+            bound_key, bound_run, _ = heap[0]
+            # เอาทุกแถวที่ไม่เกินหัวของชุดถัดไป (ถ้าเท่ากัน ให้ชุดที่ index น้อยกว่าได้ก่อน)
+            side = 'right' if i < bound_run else 'left'
+            end = max(int(np.searchsorted(run, bound_key, side=side)), pos + 1)
+        else:
+            end = len(run)
+        pieces.append(np.arange(starts[i] + pos, starts[i] + end))
+        if end < len(run):
+            heapq.heappush(heap, (run[end], i, end))
+    return np.concatenate(pieces) if pieces else np.empty(0, dtype=np.int64)
+
+
+def merge_columns(chunks):
+    # รวมผลจากหลาย worker เป็น DataFrame เดียวที่เรียงตาม unix_time
+    chunks = [c for c in chunks if c is not None]
+    if not chunks:
+        return None
+    order = kway_merge_order([c['unix_time'] for c in chunks])
+    return pd.DataFrame({name: np.concatenate([c[name] for c in chunks])[order] for name in column_names})
+
+
+def iter_parallel(plan, workers, batch_files=None):
+    # อ่านไฟล์ตาม plan ด้วย process pool แล้วคืน (DataFrame ที่รวมแล้ว, ผลของแต่ละไฟล์) ทีละรอบ
+    batch_files = batch_files or workers * FILES_PER_WORKER
+    tasks = [(entry.path, offset) for entry, offset in plan]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for start in range(0, len(tasks), batch_files):
+            batch = tasks[start:start + batch_files]
+            results = list(pool.map(parse_file_columns, batch, chunksize=max(1, len(batch) // (workers * 4))))
+            yield merge_columns([r['columns'] for r in results if not r['error']]), results
+
+
+# --- Manifest ---
+def load_manifest(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'files': {}, 'rows': 0, 'max_unix_time': None}
+
+
+def save_manifest(path, manifest):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def list_data_files(folder):
+    files = []
+    with os.scandir(folder) as it:
+        for entry in it:
+            # ข้ามไฟล์ script ของเราเอง หรือไฟล์ csv ที่อาจจะเคยสร้างไว้
+            if not entry.is_file() or entry.name.endswith(('.py', '.csv', '.json')):
+                continue
+            files.append(entry)
+    # ชื่อไฟล์เป็นวันที่ (YYYYMMDD) เรียงชื่อ = เรียงเวลา
+    return sorted(files, key=lambda e: e.name)
+
+
+def plan_ingest(files, manifest):
+    # ตัดสินใจต่อไฟล์: ข้าม / อ่านต่อจาก offset / อ่านใหม่ทั้งไฟล์ / ต้อง rebuild
+    plan = []
+    for entry in files:
+        st = entry.stat()
+        known = manifest['files'].get(entry.name)
+        if known is None:
+            plan.append((entry, 0))
+            continue
+        if st.st_size == known['size'] and st.st_mtime_ns == known['mtime_ns']:
+            continue
+        # ไฟล์ของวันนี้ที่ยังถูกเขียนต่อท้าย: ส่วนที่อ่านไปแล้วต้องเหมือนเดิม
+        if st.st_size >= known['offset'] and prefix_sha256(entry.path, known['offset']) == known['sha256']:
+            plan.append((entry, known['offset']))
+            continue
+        return None
+    return plan
+
+
+def _append(df, output, manifest):
+    # ต่อท้าย CSV; คืน False ถ้าก้อนนี้มีเวลาย้อนไปก่อนข้อมูลที่เขียนไปแล้ว
+    in_order = True
+    if len(df):
+        first, last = int(df['unix_time'].iloc[0]), int(df['unix_time'].iloc[-1])
+        max_seen = manifest.get('max_unix_time')
+        if max_seen is not None and first < max_seen:
+            in_order = False
+        manifest['max_unix_time'] = max(last, max_seen if max_seen is not None else last)
+        df.to_csv(output, mode='a', header=not os.path.exists(output), index=False)
+    return in_order
+
+
+def _record_file(manifest, name, path, offset, sha256, stat, complete=True):
+    # stat = (size, mtime_ns) ที่ได้ *ก่อน* เริ่มอ่าน: ถ้าไฟล์โตระหว่างอ่าน รอบหน้าขนาดจะไม่ตรงแล้วอ่านต่อจาก offset
+    size, mtime_ns = stat
+    manifest['files'][name] = {
+        # อ่านไม่จบ: ไม่จำขนาดไฟล์ไว้ รอบหน้าจะได้อ่านต่อจาก offset (ไม่ข้ามไฟล์ และไม่อ่านซ้ำจาก 0)
+        'size': size if complete else None,
+        'mtime_ns': mtime_ns,
+        'offset': offset,
+        'sha256': sha256,
+    }
+    if complete:
+        print(f"อ่านไฟล์ {path} สำเร็จ!")
+
+
+def ingest(folder=FOLDER_PATH, output=OUTPUT_FILE, manifest_path=None, rebuild=False,
+           chunk_rows=CHUNK_ROWS, workers=1):
+    manifest_path = manifest_path or f"{output}.manifest.json"
+    files = list_data_files(folder)
+    print(f"กำลังค้นหาไฟล์... เจอทั้งหมด {len(files)} ไฟล์")
+
+    manifest = load_manifest(manifest_path)
+    plan = None if rebuild or not os.path.exists(output) else plan_ingest(files, manifest)
+    if plan is None:
+        if not rebuild and manifest['files']:
+            print("⚠️ มีไฟล์เก่าถูกแก้ไข -> สร้าง CSV ใหม่ทั้งหมด")
+        manifest = {'files': {}, 'rows': 0, 'max_unix_time': None}
+        if os.path.exists(output):
+            os.remove(output)
+        plan = [(entry, 0) for entry in files]
+
+    if not plan:
+        return manifest, 0
+
+    new_rows = 0
+    in_order = True
+    if workers > 1:
+        names = {entry.path: entry.name for entry, _ in plan}
+        for df, results in iter_parallel(plan, workers):
+            if df is not None:
+                in_order &= _append(df, output, manifest)
+                new_rows += len(df)
+            for r in results:
+                if r['error']:
+                    print(f"อ่านไฟล์ {r['path']} ไม่ได้: {r['error']}")
+                    continue
+                _record_file(manifest, names[r['path']], r['path'], r['offset'], r['sha256'], r['stat'])
+    else:
+        for entry, offset in plan:
+            # offset ของก้อนสุดท้ายที่ต่อท้าย CSV ไปแล้วจริง
+            start = done = offset
+            try:
+                # stat ก่อนอ่าน: บรรทัดที่ต่อท้ายระหว่างอ่านต้องไม่ถูกนับว่าอ่านแล้ว
+                st = os.stat(entry.path)
+                stat = (st.st_size, st.st_mtime_ns)
+                for df, offset in iter_file_chunks(entry.path, offset, chunk_rows):
+                    if df is not None and not df.empty:
+                        df = df.sort_values('unix_time', kind='stable')  # เรียงตามเวลา
+                        in_order &= _append(df, output, manifest)
+                        new_rows += len(df)
+                    done = offset
+            except Exception as e:
+                print(f"อ่านไฟล์ {entry.path} ไม่ได้: {e}")
+                if done > start:
+                    # ก้อนแรกๆ ลง CSV ไปแล้ว: จำตำแหน่งไว้ กันแถวซ้ำตอนรันรอบหน้า
+                    _record_file(manifest, entry.name, entry.path, done, prefix_sha256(entry.path, done),
+                                 stat, complete=False)
+                continue
+            _record_file(manifest, entry.name, entry.path, offset, prefix_sha256(entry.path, offset), stat)
+
+    manifest['rows'] += new_rows
+    if not in_order:
+        # มีไฟล์ย้อนหลังเข้ามาทีหลัง: เรียงไฟล์ผลลัพธ์ใหม่ทั้งก้อน (กรณีนี้เกิดไม่บ่อย)
+        print("⚠️ มีข้อมูลย้อนเวลา -> เรียงลำดับ CSV ใหม่ทั้งไฟล์")
+        final_df = pd.read_csv(output, dtype=COLUMN_DTYPES, keep_default_na=False, na_values=[''])
+        final_df = final_df.sort_values('unix_time', kind='stable')
+        final_df.to_csv(output, index=False)
+    save_manifest(manifest_path, manifest)
+    return manifest, new_rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="รวมไฟล์ Log ของสถานีเป็น CSV (ต่อท้ายเฉพาะข้อมูลใหม่)")
+    parser.add_argument('--folder', default=FOLDER_PATH)
+    parser.add_argument('--output', default=OUTPUT_FILE)
+    parser.add_argument('--manifest', default=None)
+    parser.add_argument('--rebuild', action='store_true', help="ไม่สน manifest สร้าง CSV ใหม่ทั้งหมด")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--workers', type=int, default=1, help="จำนวน process ที่อ่านไฟล์พร้อมกัน (0 = ทุก core)")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    workers = args.workers or os.cpu_count() or 1
+    manifest, new_rows = ingest(args.folder, args.output, args.manifest, args.rebuild, args.chunk_rows, workers)
     print("-----------------------------------")
-    print("✅ รวมร่างเสร็จสมบูรณ์")
-    print(f"ข้อมูลทั้งหมด {len(final_df)} แถว")
-else:
-    print("❌ ไม่พบข้อมูลที่อ่านได้")
\ No newline at end of file
+    if not manifest['rows']:
+        print("❌ ไม่พบข้อมูลที่อ่านได้")
+    elif not new_rows:
+        print(f"✅ ไม่มีข้อมูลใหม่ ไฟล์ CSV เป็นปัจจุบันแล้ว ({manifest['rows']} แถว, {time.perf_counter() - t0:.2f} วินาที)")
+    else:
+        print("✅ รวมร่างเสร็จสมบูรณ์")
+        print(f"เพิ่มข้อมูลใหม่ {new_rows} แถว | ข้อมูลทั้งหมด {manifest['rows']} แถว "
+              f"({time.perf_counter() - t0:.2f} วินาที)")
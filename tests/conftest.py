@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+# ให้ import โมดูลของแอปและ Open-Meteo stub ใน benchmarks/ ได้ โดยไม่ต้องติดตั้งเป็น package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, 'benchmarks')]
+
+from openmeteo_stub import start_stub  # noqa: E402
+
+
+@pytest.fixture
+def stub():
+    server = start_stub()
+    yield server
+    server.shutdown()
+    server.server_close()
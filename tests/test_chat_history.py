@@ -0,0 +1,56 @@
+from zeus_chat_history import RECENT_MESSAGES, ChatHistory, ChatSpillStore
+
+
+def contents(history):
+    return [m['content'] for m in history.visible()]
+
+
+def make_history(n, page_size=7):
+    history = ChatHistory(ChatSpillStore(':memory:', max_age=None), page_size=page_size)
+    for i in range(n):
+        history.append('user' if i % 2 == 0 else 'assistant', f"msg {i}")
+    return history
+
+
+def test_keeps_only_recent_messages_in_memory():
+    n = RECENT_MESSAGES * 2 + 5
+    history = make_history(n)
+    assert len(history) == n
+    assert len(history.recent) == RECENT_MESSAGES
+    assert contents(history) == [f"msg {i}" for i in range(n - RECENT_MESSAGES, n)]
+    assert history.store.stats()['messages'] == n - RECENT_MESSAGES
+
+
+def test_paging_back_returns_every_message_once_in_order():
+    n = RECENT_MESSAGES * 2 + 5
+    history = make_history(n)
+    pages = 0
+    while history.has_older():
+        assert history.load_older() > 0
+        pages += 1
+    assert pages == -(-(n - RECENT_MESSAGES) // history.page_size)
+    assert contents(history) == [f"msg {i}" for i in range(n)]
+    assert [m['role'] for m in history.visible()][:2] == ['user', 'assistant']
+
+    # ส่งข้อความใหม่ -> ยุบกลับเหลือแค่ข้อความล่าสุด แล้วเลื่อนดูย้อนหลังได้อีกรอบ
+    history.collapse()
+    history.append('user', f"msg {n}")
+    assert history.has_older()
+    while history.has_older():
+        history.load_older()
+    assert contents(history) == [f"msg {i}" for i in range(n + 1)]
+
+
+def test_pruned_history_hides_load_older():
+    history = make_history(RECENT_MESSAGES + 10)
+    assert history.has_older()
+    history.store.prune(max_age=-1)
+    assert history.load_older() == 0
+    assert not history.has_older()
+
+
+def test_clear_removes_spilled_messages():
+    history = make_history(RECENT_MESSAGES + 3)
+    history.clear()
+    assert len(history) == 0 and not history.has_older()
+    assert history.store.stats()['messages'] == 0
@@ -0,0 +1,64 @@
+import asyncio
+import random
+import threading
+import time
+
+from zeus_fetch import BatchFetcher
+from zeus_weather import ForecastCache, make_session
+
+SITES = [(14.16, 101.35), (13.75, 100.5), (18.79, 98.98), (7.88, 98.39), (12.57, 99.96), (16.43, 102.83)]
+
+
+def fetch(fetcher, sites, **kwargs):
+    return asyncio.run(fetcher.fetch(sites, ('temperature_2m',), ('temperature_2m',), **kwargs))
+
+
+def test_batch_fetch_keeps_site_order(stub):
+    fetcher = BatchFetcher(stub.url, chunk_size=4)
+    payloads = fetch(fetcher, SITES)
+    assert [(p['latitude'], p['longitude']) for p in payloads] == SITES
+    assert stub.requests == 2
+
+
+def test_failed_chunk_returns_none_per_site(stub):
+    # stub ตอบ 503 ทุกคำขอที่ 2: ก้อนกลางพัง ก้อนอื่นได้ครบ (concurrency=1 ให้ลำดับคำขอแน่นอน)
+    stub.fail_rate = 0.5
+    fetcher = BatchFetcher(stub.url, chunk_size=2, concurrency=1, retries=0)
+    payloads = fetch(fetcher, SITES)
+    assert payloads[2:4] == [None, None]
+    assert all(p is not None for p in payloads[:2] + payloads[4:])
+    assert fetcher.stats['failed_chunks'] == 1
+
+
+def test_failed_chunk_is_retried_with_backoff(stub):
+    # คำขอที่ 2 (ก้อนหลัง) ได้ 503 แล้วรอบลองใหม่เป็นคำขอที่ 3 ผ่าน
+    stub.fail_rate = 0.5
+    fetcher = BatchFetcher(stub.url, chunk_size=3, concurrency=1, retries=2, backoff=0.01, rng=random.Random(0))
+    payloads = fetch(fetcher, SITES)
+    assert all(p is not None for p in payloads)
+    assert fetcher.stats == {'requests': 3, 'retries': 1, 'failed_chunks': 0}
+
+
+def test_unreachable_api_returns_none_for_every_site(stub):
+    url = stub.url
+    stub.shutdown()
+    stub.server_close()
+    fetcher = BatchFetcher(url, chunk_size=4, retries=1, backoff=0.01)
+    assert fetch(fetcher, SITES) == [None] * len(SITES)
+    assert fetcher.stats['failed_chunks'] == 2
+
+
+def test_prefetch_shares_inflight_with_get_entry(stub):
+    # get_entry ที่มาระหว่าง prefetch ต้องรอก้อนรวม ไม่ยิงคำขอเดี่ยวซ้ำ
+    stub.latency = 0.3
+    cache = ForecastCache(base_url=stub.url, cache_dir=None, session=make_session(retries=0))
+    worker = threading.Thread(target=cache.prefetch, args=(SITES,))
+    worker.start()
+    deadline = time.monotonic() + 5
+    while len(cache._inflight) < len(SITES) and time.monotonic() < deadline:
+        time.sleep(0.005)
+    entry = cache.get_entry(*SITES[0])
+    worker.join()
+    assert entry is not None
+    assert stub.requests == 1
+    assert not cache._inflight
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+
+from zeus_forest import load_flat_forest, save_flat_forest, flatten_forest
+
+
+def make_data(seed=0, n=400):
+    rng = np.random.default_rng(seed)
+    # ค่าซ้ำเยอะ (ปัดทศนิยม) ให้ threshold ตกระหว่างค่าจริงใกล้ๆ กัน
+    X = np.round(rng.normal(size=(n, 4)) * 10, 1).astype(np.float32)
+    y = X[:, 0] * 0.5 + np.sin(X[:, 1]) + rng.normal(scale=0.1, size=n)
+    return X, y
+
+
+def on_thresholds(model, X):
+    # แถวที่ค่า Feature ตรงกับ threshold พอดี (หลังแปลงเป็น float32) และค่าติดกันทั้งสองฝั่ง
+    rows = []
+    for est in model.estimators_:
+        tree = est.tree_
+        for node in np.flatnonzero(tree.children_left != -1)[:20]:
+            t = np.float32(tree.threshold[node])
+            for value in (t, np.nextafter(t, np.float32(-np.inf)), np.nextafter(t, np.float32(np.inf))):
+                row = X[node % len(X)].copy()
+                row[tree.feature[node]] = value
+                rows.append(row)
+    return np.vstack([X, np.asarray(rows, dtype=np.float32)])
+
+
+def round_trip(model, tmp_path):
+    save_flat_forest(flatten_forest(model), str(tmp_path))
+    return load_flat_forest(str(tmp_path / 'meta.json'), mmap_mode='r')
+
+
+def test_regressor_matches_sklearn_exactly(tmp_path):
+    X, y = make_data()
+    model = RandomForestRegressor(n_estimators=8, max_depth=8, random_state=0).fit(X, y)
+    flat = round_trip(model, tmp_path)
+    X_test = on_thresholds(model, X)
+    np.testing.assert_array_equal(flat.predict(X_test), model.predict(X_test))
+
+
+@pytest.mark.parametrize('class_weight', [None, 'balanced'])
+def test_classifier_matches_sklearn_exactly(tmp_path, class_weight):
+    X, y = make_data(seed=1)
+    label = (y > np.quantile(y, 0.8)).astype(int)
+    model = RandomForestClassifier(n_estimators=8, max_depth=8, class_weight=class_weight,
+                                   random_state=0).fit(X, label)
+    flat = round_trip(model, tmp_path)
+    X_test = on_thresholds(model, X)
+    proba, expected = flat.predict_proba(X_test), model.predict_proba(X_test)
+    np.testing.assert_array_equal(proba[:, 1], expected[:, 1])
+    # คลาส 0 เก็บเป็น 1 - p (ไม่ได้เก็บค่าแยกต่อใบ) จึงต่างจาก sklearn ได้แค่ระดับ ulp
+    np.testing.assert_allclose(proba[:, 0], expected[:, 0], rtol=0, atol=1e-15)
+    np.testing.assert_array_equal(flat.predict(X_test), model.predict(X_test))
+
@@ -0,0 +1,80 @@
+import time
+
+from zeus_weather import ForecastCache, make_session, next_update_at
+
+
+class Clock:
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def wait_idle(cache, timeout=5.0):
+    # รอ refresh เบื้องหลังให้เสร็จ
+    deadline = time.monotonic() + timeout
+    while cache._inflight and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not cache._inflight
+
+
+def make_cache(url, **kwargs):
+    # ไม่ให้ urllib3 retry เอง ทดสอบจะได้ไม่ต้องรอ backoff
+    return ForecastCache(base_url=url, session=make_session(retries=0), **kwargs)
+
+
+def test_cache_hit_does_not_call_api_again(stub):
+    cache = make_cache(stub.url, cache_dir=None)
+    first = cache.get_entry(14.16, 101.35)
+    second = cache.get_entry(14.16, 101.35)
+    assert first is not None and first.source == 'api'
+    assert second is first
+    assert stub.requests == 1
+
+
+def test_stale_entry_is_served_while_refreshing(stub):
+    clock = Clock(1_700_000_000.0)
+    cache = make_cache(stub.url, cache_dir=None, clock=clock)
+    old = cache.get_entry(14.16, 101.35)
+
+    # เลยเวลาหมดอายุ แต่ยังไม่เกิน max_stale: ได้ของเก่าทันที แล้ว refresh อยู่เบื้องหลัง
+    clock.now = next_update_at(clock.now) + 60
+    assert cache.get_entry(14.16, 101.35) is old
+    wait_idle(cache)
+
+    fresh = cache.get_entry(14.16, 101.35)
+    assert fresh is not old
+    assert fresh.fetched_at == clock.now
+    assert stub.requests == 2
+
+
+def test_falls_back_to_disk_when_api_is_down(stub, tmp_path):
+    saved = make_cache(stub.url, cache_dir=str(tmp_path)).get_entry(14.16, 101.35)
+
+    stub.fail_rate = 1.0
+    cache = make_cache(stub.url, cache_dir=str(tmp_path))
+    entry = cache.get_entry(14.16, 101.35)
+    assert entry is not None and entry.source == 'disk'
+    assert entry.payload == saved.payload
+    assert not cache._inflight
+
+
+def test_failed_refresh_can_be_retried(stub):
+    # session พังแบบที่ไม่ใช่ RequestException ต้องไม่ทิ้ง future ค้างไว้ใน _inflight
+    class BrokenSession:
+        calls = 0
+
+        def get(self, *args, **kwargs):
+            BrokenSession.calls += 1
+            raise RuntimeError("boom")
+
+        def close(self):
+            pass
+
+    cache = ForecastCache(base_url=stub.url, cache_dir=None, session=BrokenSession())
+    assert cache.get_entry(1, 2) is None
+    assert cache.get_entry(1, 2) is None
+    assert BrokenSession.calls == 2
+    assert not cache._inflight
@@ -0,0 +1,461 @@
+import argparse
+import json
+import os
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+
+import zeus_store
+from zeus_clean import RAIN_THRESHOLD
+from zeus_forest import FLAT_DIR, export_model
+from zeus_inference import FEATURES, MODEL_FEATURES, is_day_hour
+from zeus_registry import MODEL_FILES, current_rss_bytes
+
+# ==========================================
+# Zeus Training Job (แทน train_model.ipynb สำหรับ retrain ตอนกลางคืน)
+# - อ่าน zeus_store/train ครั้งเดียวเป็น float32 Matrix (n x 9 เรียงตาม FEATURES)
+#   ทุกโมเดลหยิบคอลัมน์ของตัวเองจาก Matrix นี้ ไม่สร้าง DataFrame ใหม่ทีละโมเดล
+# - is_day / rain_clean / hour / month คำนวณแบบ Vectorized (ไม่ใช้ .apply ทีละแถว)
+# - Fit 4 โมเดลพร้อมกันใน Thread pool โดยแบ่ง n_jobs ให้รวมกันไม่เกินจำนวน Core
+#   (sklearn สร้างต้นไม้แบบปล่อย GIL อยู่แล้ว จึงใช้ Thread ได้โดยไม่ต้อง copy ข้อมูลข้าม process)
+# - รายงานเวลาและ RSS สูงสุดระหว่าง fit ของแต่ละโมเดล
+# รัน: python train_models.py --jobs 0
+#      python train_models.py --incremental --validate   (เพิ่มเฉพาะวันใหม่ แล้ววัดผลกับ 7 วันสุดท้าย)
+# ==========================================
+
+TRAIN_DATASET = 'train'
+
+# เป้าหมายของแต่ละโมเดล (คอลัมน์ใน Store)
+TARGETS = {'temp': 'temp', 'humidity': 'humidity', 'rain': 'rain_clean', 'uv': 'uv'}
+
+# Hyperparameter เดียวกับ train_model.ipynb
+MODEL_PARAMS = {
+    'temp': (RandomForestRegressor, {'n_estimators': 100, 'random_state': 42}),
+    'humidity': (RandomForestRegressor, {
+        'n_estimators': 200,         # โหวตหลายเสียงให้ผลลัพธ์นิ่งขึ้น
+        'max_depth': 10,             # ไม่ท่องจำข้อมูลลึกเกินไป
+        'min_samples_leaf': 5,       # ป้องกันการเดาสุ่มของต้นไม้
+        'max_features': 'sqrt',      # บังคับให้ดูตัวแปรอื่นนอกจากอุณหภูมิ
+        'random_state': 42,
+    }),
+    'rain': (RandomForestClassifier, {'n_estimators': 100, 'class_weight': 'balanced', 'random_state': 42}),
+    'uv': (RandomForestRegressor, {'n_estimators': 100, 'random_state': 42}),
+}
+
+# ค่าใช้จ่ายโดยประมาณ (ใช้จัดลำดับและแบ่ง Core): humidity มีต้นเยอะแต่ตื้นและดูแค่ sqrt(8) Feature
+MODEL_COST = {'temp': 3, 'humidity': 1, 'rain': 3, 'uv': 3}
+
+RSS_SAMPLE_SECONDS = 0.02
+
+# Feature ที่สร้างจาก datetime ได้ถ้าไม่มีใน Store
+DERIVED_FEATURES = frozenset({'hour', 'is_day', 'month'})
+
+
+def build_estimator(name, n_jobs=-1):
+    cls, params = MODEL_PARAMS[name]
+    return cls(n_jobs=n_jobs, **params)
+
+
+# --- 1. Feature Matrix ---
+def load_training_matrix(dataset=TRAIN_DATASET, store_dir=zeus_store.STORE_DIR, start=None):
+    # คืน (X float32 เรียงตาม FEATURES, rain_clean int8, datetime64) หลังตัดแถวที่มีค่าว่าง
+    # start: อ่านเฉพาะข้อมูลตั้งแต่เวลานี้ (Store ข้ามโฟลเดอร์เดือนที่เก่ากว่าโดยไม่เปิดไฟล์)
+    available = set(zeus_store.open_dataset(dataset, store_dir).schema.names)
+    # Feature ที่สร้างเองไม่ได้ต้องมีครบ (notebook เดิมพังตอน dropna ถ้าคอลัมน์หาย)
+    missing = [c for c in FEATURES if c not in available and c not in DERIVED_FEATURES]
+    if missing:
+        raise ValueError(f"zeus_store/{dataset} ไม่มีคอลัมน์ Feature: {', '.join(missing)}")
+    wanted = [c for c in (*FEATURES, 'rain_clean') if c in available]
+    table = zeus_store.read_table(dataset, wanted, start=start, store_dir=store_dir)
+    n = table.num_rows
+    times = table.column('datetime').to_numpy() if 'datetime' in available else None
+
+    X = np.empty((n, len(FEATURES)), dtype=np.float32, order='F')
+    for j, col in enumerate(FEATURES):
+        if col in available:
+            X[:, j] = table.column(col).to_numpy()
+    # 🚨 ระบบกันเหนียว: สร้าง Feature เสริมจาก datetime หากตกหล่น
+    if DERIVED_FEATURES - available:
+        if times is None:
+            raise ValueError(f"zeus_store/{dataset} ไม่มีคอลัมน์ datetime สำหรับสร้าง hour / is_day / month")
+        index = pd.DatetimeIndex(times)
+        hour = index.hour.to_numpy(dtype=np.float32)
+        if 'hour' not in available:
+            X[:, FEATURES.index('hour')] = hour
+        if 'is_day' not in available:
+            X[:, FEATURES.index('is_day')] = is_day_hour(hour)
+        if 'month' not in available:
+            X[:, FEATURES.index('month')] = index.month.to_numpy(dtype=np.float32)
+
+    rain = X[:, FEATURES.index('rain')]
+    if 'rain_clean' in available:
+        rain_clean = table.column('rain_clean').to_numpy(zero_copy_only=False).astype(np.float32)
+    else:
+        rain_clean = np.where(np.isnan(rain), np.nan, rain > RAIN_THRESHOLD).astype(np.float32)
+    del table
+
+    # เก็บเฉพาะแถวที่ทุก Feature และเป้าหมายมีค่า (เหมือน dropna ใน notebook)
+    valid = ~np.isnan(X).any(axis=1) & ~np.isnan(rain_clean)
+    if not valid.all():
+        X = np.asfortranarray(X[valid])
+        rain_clean = rain_clean[valid]
+        times = times[valid] if times is not None else None
+    return X, rain_clean.astype(np.int8), times
+
+
+def model_inputs(name, X, rain_clean):
+    # ส่งเป็น DataFrame ที่ชี้ไปยัง float32 array (ไม่ copy) เพื่อให้โมเดลจำชื่อ Feature ไว้เหมือนเดิม
+    columns = list(MODEL_FEATURES[name])
+    X_model = pd.DataFrame(X[:, [FEATURES.index(c) for c in columns]], columns=columns, copy=False)
+    y = rain_clean if TARGETS[name] == 'rain_clean' else X[:, FEATURES.index(TARGETS[name])]
+    return X_model, y
+
+
+# --- 2. การจัดสรร Core ---
+def plan_jobs(names, jobs):
+    # แบ่ง Core ให้โมเดลที่ fit พร้อมกัน: รวมกันไม่เกิน jobs, Core ที่เหลือให้โมเดลที่หนักกว่าก่อน
+    names = sorted(names, key=lambda n: -MODEL_COST.get(n, 1))
+    workers = max(1, min(len(names), jobs))
+    n_jobs = {name: 1 for name in names}
+    for i in range(jobs - workers):
+        n_jobs[names[i % workers]] += 1
+    return names, workers, n_jobs
+
+
+class RssSampler:
+    # อ่าน RSS ของ process เป็นระยะใน Thread แยก ให้แต่ละโมเดลถามค่าสูงสุดในช่วงที่ตัวเอง fit อยู่
+    # (ถ้า fit พร้อมกันหลายโมเดล ค่าที่ได้คือ RSS ของทั้ง process ในช่วงนั้น)
+
+    def __init__(self, interval=RSS_SAMPLE_SECONDS):
+        self.interval = interval
+        self._windows = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _sample(self):
+        rss = current_rss_bytes()
+        with self._lock:
+            for key, peak in self._windows.items():
+                if rss > peak:
+                    self._windows[key] = rss
+        return rss
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self, key):
+        with self._lock:
+            self._windows[key] = 0
+        self._sample()
+
+    def stop(self, key):
+        self._sample()
+        with self._lock:
+            return self._windows.pop(key)
+
+
+# --- 3. Fit / บันทึก ---
+def save_model(model, name, out_dir='.', export_flat=True):
+    # เขียนไฟล์ใหม่ข้างๆ แล้วค่อยสลับ (แอปที่กำลังรันจะไม่เจอไฟล์ที่เขียนไม่เสร็จ)
+    path = os.path.join(out_dir, MODEL_FILES[name])
+    tmp = f"{path}.tmp-{os.getpid()}"
+    joblib.dump(model, tmp, compress=3)
+    os.replace(tmp, path)
+    if export_flat:
+        export_model(model, name, os.path.join(out_dir, FLAT_DIR), source_path=path)
+    return path
+
+
+def single_class(name, rain_clean):
+    # โมเดลฝนต้องเห็นทั้งวันฝนตกและไม่ตก (ช่วงหน้าแล้งอาจไม่มีฝนเลย)
+    return TARGETS[name] == 'rain_clean' and len(np.unique(rain_clean)) < 2
+
+
+def train_one(name, X, rain_clean, n_jobs, out_dir, sampler, export_flat):
+    sampler.start(name)
+    t0 = time.perf_counter()
+    X_model, y = model_inputs(name, X, rain_clean)
+    model = build_estimator(name, n_jobs)
+    model.fit(X_model, y)
+    fit_seconds = time.perf_counter() - t0
+
+    t1 = time.perf_counter()
+    save_model(model, name, out_dir, export_flat)
+    save_seconds = time.perf_counter() - t1
+    peak = sampler.stop(name)
+    return model, {
+        'model': name,
+        'file': MODEL_FILES[name],
+        'n_jobs': n_jobs,
+        'fit_s': round(fit_seconds, 2),
+        'save_s': round(save_seconds, 2),
+        'peak_rss_mb': round(peak / 1024 ** 2, 1),
+        'nodes': sum(est.tree_.node_count for est in model.estimators_),
+    }
+
+
+def train_all(dataset=TRAIN_DATASET, store_dir=zeus_store.STORE_DIR, names=None, jobs=0,
+              out_dir='.', export_flat=True, progress=print):
+    # jobs: จำนวน Core ที่ใช้ได้ทั้งหมด (0 = ทุก Core)
+    jobs = jobs or os.cpu_count() or 1
+    names = list(names or MODEL_PARAMS)
+    report = {'rows': 0, 'jobs': jobs, 'skipped': [], 'rss_before_mb': round(current_rss_bytes() / 1024 ** 2, 1)}
+
+    t0 = time.perf_counter()
+    X, rain_clean, times = load_training_matrix(dataset, store_dir)
+    report['rows'] = len(X)
+    report['load_s'] = round(time.perf_counter() - t0, 2)
+    report['matrix_mb'] = round(X.nbytes / 1024 ** 2, 1)
+    if len(X) == 0:
+        raise ValueError(f"zeus_store/{dataset} เหลือ 0 แถวหลังตัดค่าว่าง")
+    progress(f"   ✅ Matrix {X.shape[0]:,} x {X.shape[1]} float32 ({report['matrix_mb']} MB, {report['load_s']}s)")
+    for name in [n for n in names if single_class(n, rain_clean)]:
+        progress(f"   ⚠️ ข้าม {name}: ข้อมูลมีแค่คลาสเดียว (ใช้โมเดลเดิมต่อ)")
+        names.remove(name)
+        report['skipped'].append(name)
+
+    order, workers, n_jobs = plan_jobs(names, jobs)
+    progress(f"   🧵 fit พร้อมกัน {workers} โมเดล | n_jobs: " + ', '.join(f"{n}={n_jobs[n]}" for n in order))
+    models, rows = {}, []
+    with RssSampler() as sampler, ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {name: pool.submit(train_one, name, X, rain_clean, n_jobs[name], out_dir, sampler, export_flat)
+                   for name in order}
+        for name in order:
+            models[name], row = futures[name].result()
+            rows.append(row)
+            progress(f"   ⏳ {name}: fit {row['fit_s']}s + save {row['save_s']}s | peak RSS {row['peak_rss_mb']} MB")
+    report['models'] = sorted(rows, key=lambda r: names.index(r['model']))
+    report['wall_s'] = round(time.perf_counter() - t0, 2)
+
+    # จดไว้ว่าโมเดลเห็นข้อมูลถึงวันไหนแล้ว ให้โหมด --incremental ต่อจากตรงนี้
+    if times is not None and models:
+        state = load_state(out_dir)
+        # ป่าเต็มเห็นวันสุดท้ายไปแล้ว (แม้ไม่ครบวัน) -> incremental เริ่มวันถัดไป ไม่เพิ่มป่าย่อยของวันเดิมซ้ำ
+        next_day = str(times.max().astype('datetime64[D]') + np.timedelta64(1, 'D'))
+        for name, model in models.items():
+            state['models'][name] = {
+                'next_day': next_day,
+                'periods': [{'day': 'full', 'trees': len(model.estimators_), 'rows': len(X)}],
+            }
+        save_state(state, out_dir)
+    return models, report
+
+
+# ==========================================
+# Incremental Training (--incremental)
+# ไม่ fit ใหม่ทั้งป่า: เพิ่มต้นไม้ชุดเล็กที่เรียนจากข้อมูล "วันใหม่" ทีละวันด้วย warm_start
+# แล้วตัดต้นไม้ของวันที่เก่าที่สุดทิ้งเมื่อเกินหน้าต่าง (Rolling window ของป่าย่อยรายวัน)
+# - อ่านเฉพาะข้อมูลตั้งแต่ next_day (Store ข้ามเดือนเก่าเอง) เวลาที่ใช้จึงขึ้นกับข้อมูลใหม่ ไม่ใช่ทั้งประวัติ
+# - เทรนเฉพาะวันที่ครบวันแล้ว (วันสุดท้ายของ train มักถูกตัดครึ่งวันโดย split_data)
+# - ป่าจากการเทรนเต็ม (train_all) นับเป็น 1 ช่วง และถูกตัดทิ้งเหมือนกันเมื่อครบหน้าต่าง
+#   ป่าเต็มรวมวันสุดท้ายที่ไม่ครบวันไปแล้ว จึงตั้ง next_day เป็นวันถัดไป (ชั่วโมงที่เหลือของวันนั้นไม่ถูกเทรนซ้ำ/เพิ่ม)
+# - state อยู่ใน zeus_train_state.json ข้างไฟล์ .pkl
+# ==========================================
+
+STATE_FILE = 'zeus_train_state.json'
+WINDOW_DAYS = 28
+
+
+def state_path(out_dir='.'):
+    return os.path.join(out_dir, STATE_FILE)
+
+
+def load_state(out_dir='.'):
+    try:
+        with open(state_path(out_dir), encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = {}
+    state.setdefault('models', {})
+    return state
+
+
+def save_state(state, out_dir='.'):
+    path = state_path(out_dir)
+    tmp = f"{path}.tmp-{os.getpid()}"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1)
+    os.replace(tmp, path)
+
+
+def trees_per_day(name, window_days=WINDOW_DAYS):
+    # ขนาดป่าเมื่อหน้าต่างเต็ม ~ n_estimators เดิม
+    return -(-MODEL_PARAMS[name][1]['n_estimators'] // window_days)
+
+
+def add_day(model, name, X, rain_clean, n_trees, n_jobs):
+    # warm_start: ต้นไม้เดิมอยู่ครบ sklearn fit แค่ต้นที่เพิ่มบนข้อมูลชุดนี้
+    X_model, y = model_inputs(name, X, rain_clean)
+    model.set_params(warm_start=True, n_estimators=len(model.estimators_) + n_trees, n_jobs=n_jobs)
+    with warnings.catch_warnings():
+        # class_weight='balanced' คำนวณจากข้อมูลวันนั้น ซึ่งเป็นสิ่งที่ต้องการอยู่แล้ว
+        warnings.simplefilter('ignore', UserWarning)
+        model.fit(X_model, y)
+    model.set_params(warm_start=False)
+
+
+def evict(model, periods, window_days=WINDOW_DAYS):
+    # ต้นไม้เรียงตามช่วงที่เพิ่มเข้ามา: ตัดจากหัวแถวทีละช่วง
+    while len(periods) > window_days:
+        oldest = periods.pop(0)
+        model.estimators_ = model.estimators_[oldest['trees']:]
+    model.set_params(n_estimators=len(model.estimators_))
+
+
+def update_model(name, state, X, rain_clean, days, last_day, jobs, out_dir, export_flat, window_days):
+    entry = state['models'][name]
+    model = joblib.load(os.path.join(out_dir, MODEL_FILES[name]))
+    row = {'model': name, 'days': 0, 'rows': 0, 'skipped_days': 0, 'evicted_trees': 0}
+    trees_before = len(model.estimators_)
+    t0 = time.perf_counter()
+    for day in np.unique(days):
+        day_str = str(day)
+        if day_str < entry['next_day'] or day >= last_day:
+            continue
+        rows = days == day
+        if single_class(name, rain_clean[rows]):
+            row['skipped_days'] += 1
+            continue
+        n_trees = trees_per_day(name, window_days)
+        add_day(model, name, X[rows], rain_clean[rows], n_trees, jobs)
+        entry['periods'].append({'day': day_str, 'trees': n_trees, 'rows': int(rows.sum())})
+        row['days'] += 1
+        row['rows'] += int(rows.sum())
+    entry['next_day'] = max(entry['next_day'], str(last_day))
+    if row['days']:
+        n_before_evict = len(model.estimators_)
+        evict(model, entry['periods'], window_days)
+        row['evicted_trees'] = n_before_evict - len(model.estimators_)
+        save_model(model, name, out_dir, export_flat)
+    row['fit_s'] = round(time.perf_counter() - t0, 2)
+    row['trees'] = f"{trees_before} -> {len(model.estimators_)}"
+    return model, row
+
+
+def train_incremental(dataset=TRAIN_DATASET, store_dir=zeus_store.STORE_DIR, names=None, jobs=0,
+                      out_dir='.', export_flat=True, window_days=WINDOW_DAYS, progress=print):
+    jobs = jobs or os.cpu_count() or 1
+    names = list(names or MODEL_PARAMS)
+    state = load_state(out_dir)
+    report = {'jobs': jobs, 'models': [], 'full': []}
+    t0 = time.perf_counter()
+
+    # โมเดลที่ยังไม่มี state (หรือโหลด .pkl ไม่ได้) ต้องเทรนเต็มครั้งแรกก่อน
+    missing = [n for n in names if n not in state['models']
+               or not os.path.exists(os.path.join(out_dir, MODEL_FILES[n]))]
+    if missing:
+        progress(f"   🆕 ยังไม่มี state ของ {', '.join(missing)} -> เทรนเต็มครั้งแรก")
+        models, full = train_all(dataset, store_dir, missing, jobs, out_dir, export_flat, progress)
+        report['full'] = full['models']
+        state = load_state(out_dir)
+    names = [n for n in names if n in state['models']]
+    if not names:
+        report['wall_s'] = round(time.perf_counter() - t0, 2)
+        return {}, report
+
+    start = min(state['models'][n]['next_day'] for n in names)
+    X, rain_clean, times = load_training_matrix(dataset, store_dir, start=start)
+    report['rows'] = len(X)
+    if len(X) == 0:
+        progress(f"   💤 ไม่มีข้อมูลใหม่ตั้งแต่ {start}")
+        report['wall_s'] = round(time.perf_counter() - t0, 2)
+        return {}, report
+    days = times.astype('datetime64[D]')
+    last_day = days.max()
+    progress(f"   📥 ข้อมูลใหม่ตั้งแต่ {start}: {len(X):,} แถว (เทรนถึงก่อน {last_day} ซึ่งยังไม่ครบวัน)")
+
+    models = {}
+    with RssSampler() as sampler:
+        for name in names:
+            sampler.start(name)
+            models[name], row = update_model(name, state, X, rain_clean, days, last_day, jobs,
+                                             out_dir, export_flat, window_days)
+            row['peak_rss_mb'] = round(sampler.stop(name) / 1024 ** 2, 1)
+            report['models'].append(row)
+            progress(f"   ⏳ {name}: +{row['days']} วัน ({row['rows']:,} แถว) ต้นไม้ {row['trees']} "
+                     f"| {row['fit_s']}s | peak RSS {row['peak_rss_mb']} MB")
+    state['window_days'] = window_days
+    save_state(state, out_dir)
+    report['wall_s'] = round(time.perf_counter() - t0, 2)
+    return models, report
+
+
+# --- 4. ตรวจกับข้อสอบ 7 วันสุดท้าย (zeus_store/test จาก split_data.ipynb) ---
+def evaluate(models, dataset='test', store_dir=zeus_store.STORE_DIR):
+    X, rain_clean, _ = load_training_matrix(dataset, store_dir)
+    scores = {}
+    for name, model in models.items():
+        X_model, y = model_inputs(name, X, rain_clean)
+        pred = model.predict(X_model)
+        if TARGETS[name] == 'rain_clean':
+            scores[name] = {'metric': 'accuracy', 'value': round(float((pred == y).mean()), 4)}
+        else:
+            scores[name] = {'metric': 'mae', 'value': round(float(np.abs(pred - y).mean()), 4)}
+    return scores
+
+
+def load_models(names, out_dir='.'):
+    models = {}
+    for name in names:
+        try:
+            models[name] = joblib.load(os.path.join(out_dir, MODEL_FILES[name]))
+        except Exception:
+            pass
+    return models
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="เทรนโมเดล Zeus ทั้ง 4 ตัวจาก zeus_store/train")
+    parser.add_argument('--dataset', default=TRAIN_DATASET)
+    parser.add_argument('--store-dir', default=zeus_store.STORE_DIR)
+    parser.add_argument('--models', nargs='+', choices=list(MODEL_PARAMS), default=None)
+    parser.add_argument('--jobs', type=int, default=0, help="จำนวน Core ทั้งหมด (0 = ทุก Core)")
+    parser.add_argument('--out-dir', default='.', help="โฟลเดอร์ที่เก็บ .pkl และ zeus_models_flat/")
+    parser.add_argument('--no-flat', action='store_true', help="ไม่ต้อง Export Flat Forest")
+    parser.add_argument('--incremental', action='store_true', help="เพิ่มต้นไม้จากวันใหม่แทนการเทรนใหม่ทั้งหมด")
+    parser.add_argument('--window-days', type=int, default=WINDOW_DAYS)
+    parser.add_argument('--validate', default=None, metavar='DATASET', nargs='?', const='test',
+                        help="วัดผลก่อน/หลังเทรนกับข้อสอบ 7 วันสุดท้าย (ค่าเริ่มต้น zeus_store/test)")
+    args = parser.parse_args()
+    zeus_store.use_system_memory_pool()
+    names = args.models or list(MODEL_PARAMS)
+
+    before = {}
+    if args.validate:
+        before = evaluate(load_models(names, args.out_dir), args.validate, args.store_dir)
+
+    mode = 'incremental' if args.incremental else 'full'
+    print(f"⚡ กำลังฝึกเทพ Zeus ({mode}) จาก zeus_store/{args.dataset} ...")
+    if args.incremental:
+        models, report = train_incremental(args.dataset, args.store_dir, names, args.jobs,
+                                           args.out_dir, not args.no_flat, args.window_days)
+    else:
+        models, report = train_all(args.dataset, args.store_dir, names, args.jobs,
+                                   args.out_dir, not args.no_flat)
+    print("-" * 50)
+    if report['models']:
+        print(pd.DataFrame(report['models']).set_index('model').to_string())
+    print(f"🎉 เสร็จใน {report['wall_s']}s ({report.get('rows', 0):,} แถว, {report['jobs']} Core)")
+
+    if args.validate:
+        after = evaluate(load_models(names, args.out_dir), args.validate, args.store_dir)
+        print(f"\n📝 ผลสอบกับ zeus_store/{args.validate}:")
+        for name, score in after.items():
+            old = before.get(name, {}).get('value', '-')
+            print(f"   {name:<9} {score['metric']:<8} ก่อน {old} -> หลัง {score['value']}")
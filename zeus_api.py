@@ -0,0 +1,298 @@
+import argparse
+import asyncio
+import json
+import math
+from urllib.parse import parse_qs
+
+from zeus_forecast import ForecastPrecomputer, chat_context
+from zeus_indices import UV_BURN, hourly_indices
+from zeus_metrics import METRICS
+from zeus_registry import MODEL_FILES, ModelRegistry
+from zeus_responses import ResponseStore, zeus_reply
+from zeus_stations import DEFAULT_STATIONS, load_catalog
+from zeus_weather import ForecastCache
+
+# ==========================================
+# Zeus API (ไม่มี UI)
+# ASGI app เล็กๆ (ไม่ใช้ framework) ให้ระบบอื่นดึงพยากรณ์ได้โดยไม่ต้องรันสคริปต์ Streamlit ทั้งหน้า
+#   GET  /forecast?lat=14.16&lon=101.35          พยากรณ์ 24 ชม. จากโมเดล (เหมือนหน้า Oracle)
+#   GET  /forecast?locations=14.16,101.35;13.75,100.50   หลายพิกัดในคำขอเดียว -> {"results": [...]}
+#   GET  /nowcast?...                            ค่าชั่วโมงปัจจุบัน + อุณหภูมิจากโมเดล + Heat Index / อารมณ์ของซุส
+#   GET  /chat?message=...  หรือ POST /chat {"message": ..., "lat": ..., "lon": ...}
+#   POST /forecast, /nowcast {"locations": [[lat, lon], ...]}
+#   GET  /healthz, /metrics
+# ใช้ ModelRegistry / ForecastCache / ForecastPrecomputer / ResponseStore ชุดเดียวกับ app.py
+# - JSON ของแต่ละพิกัดสร้างครั้งเดียวต่อผลพยากรณ์ (post hook) คำขอที่เจอ cache แค่ต่อ bytes แล้วส่ง
+# - พิกัดที่ยังไม่เคยคำนวณ: คำนวณใน Thread pool ไม่บล็อก event loop (หลายพิกัดใหม่ = คำขอ Open-Meteo เดียว + predict รวม)
+# รัน: python zeus_api.py --port 8000   (หรือ uvicorn zeus_api:app)
+# ==========================================
+
+MAX_BATCH = 100
+MAX_BODY = 64 * 1024
+JSON_TYPE = b'application/json; charset=utf-8'
+
+
+class ApiError(Exception):
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _series(values, digits=2):
+    # NaN -> null (JSON ไม่มี NaN)
+    return [None if math.isnan(v) else round(v, digits) for v in map(float, values)]
+
+
+def forecast_body(forecast):
+    body = {'lat': forecast.location[0], 'lon': forecast.location[1], 'issued_at': forecast.issued_at.isoformat()}
+    if forecast.error:
+        body['error'] = forecast.error
+        return body
+    preds, api = forecast.preds, forecast.api
+    idx = hourly_indices(preds['temp'], preds['humidity'], preds['uv'], api['surface_pressure'], api['rain'])
+    # แกนเวลาส่งแค่จุดเริ่ม + ระยะห่าง
+    body.update({
+        'start': forecast.times[0].isoformat(),
+        'step_s': 3600,
+        'temp': _series(preds['temp']),
+        'humidity': _series(preds['humidity']),
+        'rain_prob': _series(preds['rain'], 1),
+        'uv': _series(preds['uv']),
+        'feels_like': _series(idx['heat_index'], 1),
+        'uv_burn': [UV_BURN[level] for level in idx['uv_level']],
+        'storm_hours': [i for i, alert in enumerate(idx['storm_alert']) if alert],
+    })
+    return body
+
+
+def nowcast_body(forecast, context):
+    body = {'lat': forecast.location[0], 'lon': forecast.location[1], 'issued_at': forecast.issued_at.isoformat()}
+    chat = forecast.chat
+    if chat:
+        body['observed'] = {k: chat[k] for k in ('temp', 'hum', 'press', 'rain_status', 'uv', 'wind')}
+    if context is None:
+        body['error'] = forecast.chat_error or "ไม่มีข้อมูลปัจจุบัน"
+        return body
+    body.update({
+        'pred_temp': round(context.pred_temp, 2),
+        'heat_index': round(context.heat_index, 1),
+        'advice': context.advice.strip(),
+        'mood': context.mood_text,
+        'mood_icon': context.mood_icon,
+        'storm_alert': context.mood_alert,
+    })
+    return body
+
+
+def api_views(forecast):
+    # post hook ของ ForecastPrecomputer: ทุกอย่างที่ API ตอบ สร้างครั้งเดียวต่อผลพยากรณ์
+    context = chat_context(forecast)
+    return {
+        'chat': context,
+        'forecast_json': _dumps(forecast_body(forecast)),
+        'nowcast_json': _dumps(nowcast_body(forecast, context)),
+    }
+
+
+def _coord(value, name, limit):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise ApiError(400, f"{name} ต้องเป็นตัวเลข") from None
+    if not -limit <= value <= limit:
+        raise ApiError(400, f"{name} อยู่นอกช่วง ±{limit}")
+    return value
+
+
+def default_location():
+    # สถานีแรกใน catalog = สถานีที่หน้า Dashboard เลือกไว้ตอนเปิด (ไม่มีพิกัด -> สถานีเริ่มต้นใน zeus_stations)
+    station, fallback = load_catalog()[0], DEFAULT_STATIONS[0]
+    return (station.get('lat') or fallback['lat'], station.get('lon') or fallback['lon'])
+
+
+def parse_locations(query, body, default):
+    # ?lat=&lon= / ?locations=lat,lon;lat,lon / {"locations": [[lat, lon], ...]} / {"lat": .., "lon": ..}
+    raw = None
+    if body.get('locations') is not None:
+        raw = body['locations']
+    elif 'locations' in query:
+        raw = [pair.split(',') for pair in query['locations'].split(';') if pair]
+    else:
+        lat = body.get('lat', query.get('lat'))
+        lon = body.get('lon', query.get('lon'))
+        if lat is None and lon is None:
+            return [default], False
+        return [(_coord(lat, 'lat', 90), _coord(lon, 'lon', 180))], False
+    if not isinstance(raw, list) or not raw:
+        raise ApiError(400, "locations ต้องเป็นรายการพิกัด [lat, lon]")
+    if len(raw) > MAX_BATCH:
+        raise ApiError(400, f"ขอได้ไม่เกิน {MAX_BATCH} พิกัดต่อคำขอ")
+    locations = []
+    for pair in raw:
+        if not isinstance(pair, (list, tuple)) or len(pair) != 2:
+            raise ApiError(400, "แต่ละพิกัดต้องเป็น [lat, lon]")
+        locations.append((_coord(pair[0], 'lat', 90), _coord(pair[1], 'lon', 180)))
+    return locations, True
+
+
+class ZeusAPI:
+
+    def __init__(self, models=None, forecast_cache=None, responses=None, precomputer=None):
+        self.models = models if models is not None else ModelRegistry(MODEL_FILES)
+        self.forecast_cache = forecast_cache or ForecastCache()
+        self.responses = responses or ResponseStore()
+        self.precomputer = precomputer or ForecastPrecomputer(self.forecast_cache, self.models, post=api_views)
+        self.default_location = default_location()
+        self.routes = {
+            '/forecast': self.forecast,
+            '/nowcast': self.nowcast,
+            '/chat': self.chat,
+            '/healthz': self.healthz,
+            '/metrics': self.metrics,
+        }
+
+    # --- ASGI ---
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+        path = scope['path'].rstrip('/') or '/'
+        handler = self.routes.get(path)
+        with METRICS.span('api_request', endpoint=path if handler else 'unknown'):
+            try:
+                if handler is None:
+                    raise ApiError(404, f"ไม่มี {path}")
+                if scope['method'] not in ('GET', 'POST'):
+                    raise ApiError(405, "ใช้ได้แค่ GET / POST")
+                query = {k: v[-1] for k, v in parse_qs(scope['query_string'].decode('latin-1')).items()}
+                body = await self._read_json(receive) if scope['method'] == 'POST' else {}
+                status, content_type, payload = 200, JSON_TYPE, await handler(query, body)
+                if isinstance(payload, tuple):
+                    content_type, payload = payload
+            except ApiError as e:
+                status, content_type, payload = e.status, JSON_TYPE, _dumps({'error': str(e)})
+            except Exception as e:
+                status, content_type, payload = 500, JSON_TYPE, _dumps({'error': f"{type(e).__name__}: {e}"})
+        METRICS.inc('api_requests', status=status)
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', content_type), (b'content-length', str(len(payload)).encode())]})
+        await send({'type': 'http.response.body', 'body': payload})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self.precomputer.start()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.precomputer.stop()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _read_json(self, receive):
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > MAX_BODY:
+                raise ApiError(413, f"body ใหญ่เกิน {MAX_BODY} bytes")
+            chunks.append(chunk)
+            if not message.get('more_body'):
+                break
+        raw = b''.join(chunks)
+        if not raw:
+            return {}
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            raise ApiError(400, "body ต้องเป็น JSON") from None
+        if not isinstance(body, dict):
+            raise ApiError(400, "body ต้องเป็น JSON object")
+        return body
+
+    # --- ผลพยากรณ์ ---
+    async def _forecast(self, lat, lon):
+        # เจอ cache -> ตอบทันทีบน event loop / ไม่เจอ -> ดึง Open-Meteo + รันโมเดลใน Thread
+        forecast = self.precomputer.get(lat, lon, compute=False)
+        if forecast is None:
+            forecast = await asyncio.get_running_loop().run_in_executor(None, self.precomputer.get, lat, lon)
+        return forecast
+
+    async def _views(self, locations, key):
+        forecasts = [self.precomputer.get(lat, lon, compute=False) for lat, lon in locations]
+        missing = [loc for loc, forecast in zip(locations, forecasts) if forecast is None]
+        if len(missing) > 1:
+            # หลายพิกัดใหม่ในคำขอเดียว: ดึงแบบหลายพิกัด + predict รวมครั้งเดียวใน Thread
+            await asyncio.get_running_loop().run_in_executor(None, self.precomputer.refresh_many, missing)
+        if missing:
+            forecasts = await asyncio.gather(*(self._forecast(lat, lon) for lat, lon in locations))
+        out = []
+        for (lat, lon), forecast in zip(locations, forecasts):
+            if forecast is None:
+                METRICS.inc('api_fetch_errors')
+                out.append(_dumps({'lat': lat, 'lon': lon, 'error': "ดึงข้อมูล Open-Meteo ไม่สำเร็จ"}))
+            elif key not in forecast.views:
+                # ผลที่สร้างโดย post hook อื่น (เช่น precomputer ที่แชร์กับ app.py)
+                # สร้าง dict ใหม่แล้วสลับทีเดียว ไม่แก้ dict เดิมที่ session ของ Streamlit อาจอ่านอยู่
+                views = {**forecast.views, **api_views(forecast)}
+                forecast.views = views
+                out.append(views[key])
+            else:
+                out.append(forecast.views[key])
+        return out
+
+    async def _locations_response(self, query, body, key):
+        locations, batch = parse_locations(query, body, self.default_location)
+        parts = await self._views(locations, key)
+        if not batch:
+            return parts[0]
+        return b'{"results":[' + b','.join(parts) + b']}'
+
+    async def forecast(self, query, body):
+        return await self._locations_response(query, body, 'forecast_json')
+
+    async def nowcast(self, query, body):
+        return await self._locations_response(query, body, 'nowcast_json')
+
+    async def chat(self, query, body):
+        message = body.get('message', query.get('message'))
+        if not isinstance(message, str) or not message.strip():
+            raise ApiError(400, "ต้องมี message")
+        locations, batch = parse_locations(query, body, self.default_location)
+        if batch:
+            raise ApiError(400, "/chat รับได้พิกัดเดียว (lat / lon)")
+        lat, lon = locations[0]
+        forecast = await self._forecast(lat, lon)
+        context = forecast.views.get('chat') if forecast is not None else None
+        intent, reply = zeus_reply(self.responses, message, context)
+        return _dumps({'lat': lat, 'lon': lon, 'intent': intent, 'reply': reply})
+
+    async def healthz(self, query, body):
+        return _dumps({'status': 'ok', 'precompute': self.precomputer.stats})
+
+    async def metrics(self, query, body):
+        return b'text/plain; version=0.0.4; charset=utf-8', METRICS.prometheus_text().encode('utf-8')
+
+
+app = ZeusAPI()
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Zeus forecast API (ไม่มี UI)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+    print(f"⚡ Zeus API: http://{args.host}:{args.port}/forecast")
+    uvicorn.run('zeus_api:app' if args.workers > 1 else app, host=args.host, port=args.port,
+                workers=args.workers, access_log=False)
@@ -0,0 +1,108 @@
+import argparse
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# ==========================================
+# Zeus Charts (หน้า Oracle)
+# กราฟเทียบ Zeus Oracle Model vs Open-Meteo สร้างครั้งเดียวต่อผลพยากรณ์ (ชั่วโมงที่ออกพยากรณ์) แล้วทุก session ใช้ร่วมกัน
+# - ข้อมูลเป็น float32 (Plotly ส่งเป็น base64 typed array) แกนเวลาส่งแค่จุดเริ่ม + ระยะห่าง (x0 / dx) ไม่ใช่ 24 timestamp ต่อเส้น
+# - template plotly_dark ตัดเหลือเฉพาะส่วนที่กราฟเส้น / แท่งใช้ (ตัวเต็ม ~7 KB ต่อกราฟ ส่วนใหญ่เป็นค่า default ของกราฟชนิดอื่น)
+# - หน้าเว็บส่งเฉพาะกราฟของแท็บที่เปิดอยู่
+# ==========================================
+
+HOUR_MS = 3600 * 1000
+# ส่วนของ plotly_dark ที่กราฟ 2 มิติ (scatter / bar) ใช้จริง
+_TEMPLATE_LAYOUT_KEYS = ('autotypenumbers', 'colorway', 'font', 'hovermode', 'hoverlabel', 'paper_bgcolor',
+                         'plot_bgcolor', 'xaxis', 'yaxis', 'title', 'shapedefaults', 'annotationdefaults')
+_TEMPLATE_TRACE_TYPES = ('scatter', 'bar')
+
+# (ชื่อกราฟ, ชื่อแท็บ) ตามลำดับแท็บในหน้า Oracle
+ORACLE_TABS = (
+    ('temp', "🌡️ อุณหภูมิ"),
+    ('humidity', "💧 ความชื้น"),
+    ('uv', "☀️ UV Index"),
+    ('rain', "🌧️ ฝน"),
+)
+
+
+def compact_template(name='plotly_dark'):
+    full = pio.templates[name].to_plotly_json()
+    return go.layout.Template(
+        layout={k: v for k, v in full['layout'].items() if k in _TEMPLATE_LAYOUT_KEYS},
+        data={k: v for k, v in full['data'].items() if k in _TEMPLATE_TRACE_TYPES})
+
+
+DARK_TEMPLATE = compact_template()
+
+
+def _series(values):
+    # None (API ไม่มีค่า) -> NaN = เส้นขาดช่วงเหมือนเดิม
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float32)
+
+
+def _layout(title, **extra):
+    # แกนเวลาระบุ type='date' เอง เพราะไม่มี array x ให้ Plotly เดาชนิดแกน
+    return dict(template=DARK_TEMPLATE, title=title, hovermode="x unified", xaxis=dict(type='date'), **extra)
+
+
+def _compare_figure(start, pred, api, pred_name, api_name, color, title, unit):
+    time_axis = dict(x0=start, dx=HOUR_MS)
+    return go.Figure(
+        data=[
+            go.Scatter(y=_series(pred), name=pred_name, line=dict(color=color, width=4), **time_axis),
+            go.Scatter(y=_series(api), name=api_name, line=dict(color='gray', dash='dot', width=2), **time_axis),
+        ],
+        layout=_layout(title, yaxis_title=unit))
+
+
+def oracle_figures(forecast):
+    if not forecast.times:
+        return {}
+    start = forecast.times[0].isoformat()
+    hourly, preds = forecast.api, forecast.preds
+    figures = {
+        'temp': _compare_figure(start, preds['temp'], hourly['temperature_2m'], 'Zeus Oracle Model (Local)',
+                                'Standard API', '#FFD700', "เปรียบเทียบอุณหภูมิ (Temperature)", "°C"),
+        'humidity': _compare_figure(start, preds['humidity'], hourly['relative_humidity_2m'], 'Zeus Oracle Model',
+                                    'API Base', '#00BFFF', "เปรียบเทียบความชื้น (Humidity)", "%"),
+        'uv': _compare_figure(start, preds['uv'], hourly['uv_index'], 'Zeus Oracle Model',
+                              'API Base', '#FFA500', "เปรียบเทียบดัชนี UV", "Index"),
+    }
+
+    # ฝน: แท่ง = โอกาสตกจาก AI (%) แกนซ้าย, เส้น = ปริมาณจาก API (mm) แกนขวา
+    time_axis = dict(x0=start, dx=HOUR_MS)
+    figures['rain'] = go.Figure(
+        data=[
+            go.Bar(y=_series(preds['rain']), name='Zeus Oracle Model (Probability %)',
+                   marker_color='#1E90FF', opacity=0.6, **time_axis),
+            go.Scatter(y=_series(hourly['rain']), name='API Rain (mm)', line=dict(color='white', dash='solid'),
+                       yaxis='y2', **time_axis),
+        ],
+        layout=_layout("เปรียบเทียบฝน: โอกาสตก (AI) vs ปริมาณ (API)",
+                       yaxis=dict(title_text="Zeus: Rain Probability (%)", range=[0, 100]),
+                       yaxis2=dict(title_text="API: Rain Amount (mm)", overlaying='y', side='right')))
+    return figures
+
+
+def payload_bytes(figure):
+    # ขนาด spec ที่ st.plotly_chart ส่งไปหน้าเว็บ
+    return len(pio.to_json(figure, validate=False).encode('utf-8'))
+
+
+if __name__ == '__main__':
+    from datetime import datetime, timedelta
+    from types import SimpleNamespace
+
+    parser = argparse.ArgumentParser(description="ดูขนาดกราฟหน้า Oracle ที่ส่งไปหน้าเว็บ")
+    parser.add_argument('--hours', type=int, default=24)
+    args = parser.parse_args()
+
+    now = datetime.now().replace(minute=0, second=0, microsecond=0)
+    ramp = list(np.linspace(25, 35, args.hours))
+    sample = SimpleNamespace(times=[now + timedelta(hours=i) for i in range(args.hours)],
+                             preds={k: np.asarray(ramp, dtype=np.float32) for k in ('temp', 'humidity', 'uv', 'rain')},
+                             api={k: ramp for k in ('temperature_2m', 'relative_humidity_2m', 'uv_index', 'rain')})
+    for name, figure in oracle_figures(sample).items():
+        print(f"📊 {name}: {payload_bytes(figure):,} bytes")
@@ -0,0 +1,150 @@
+import argparse
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+
+# ==========================================
+# Zeus Chat History
+# ประวัติแชทต่อ session มีขอบเขต: เก็บข้อความล่าสุดในหน่วยความจำแค่ RECENT_MESSAGES ข้อความ (ring buffer)
+# ข้อความที่เก่ากว่านั้นล้นลง SQLite ไฟล์เดียว (แชร์ทุก session / worker) แล้วค่อยโหลดกลับเมื่อผู้ใช้กดดูย้อนหลัง
+# -> ทุก rerun วาดข้อความไม่เกิน RECENT_MESSAGES (+ หน้าที่ขอดูย้อนหลัง) ไม่ว่าจะคุยยาวแค่ไหน
+# ==========================================
+
+CHAT_DB = os.environ.get('ZEUS_CHAT_DB', os.path.join(os.environ.get('ZEUS_CACHE_DIR', '.zeus_cache'),
+                                                      'chat_history.sqlite3'))
+RECENT_MESSAGES = 30
+PAGE_SIZE = 20
+# ประวัติที่ล้นลงดิสก์เก่ากว่านี้ลบทิ้ง (session ของ Streamlit ไม่มี hook ตอนปิด)
+MAX_AGE = 7 * 24 * 3600
+
+
+class ChatSpillStore:
+
+    def __init__(self, path=CHAT_DB, max_age=MAX_AGE):
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # connection เดียวต่อ process ใช้ข้าม Thread ของ Streamlit (คุมด้วย lock)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS chat_messages ('
+                ' session_id TEXT NOT NULL, seq INTEGER NOT NULL, role TEXT NOT NULL,'
+                ' content TEXT NOT NULL, created_at REAL NOT NULL,'
+                ' PRIMARY KEY (session_id, seq)) WITHOUT ROWID')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS chat_messages_created ON chat_messages (created_at)')
+        if max_age:
+            self.prune(max_age)
+
+    def spill(self, session_id, rows):
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO chat_messages VALUES (?, ?, ?, ?, ?)',
+                [(session_id, seq, role, content, now) for seq, role, content in rows])
+
+    def fetch(self, session_id, before_seq, limit=PAGE_SIZE):
+        # ข้อความก่อน before_seq จำนวน limit ข้อความ เรียงเก่า -> ใหม่
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT seq, role, content FROM chat_messages WHERE session_id = ? AND seq < ?'
+                ' ORDER BY seq DESC LIMIT ?', (session_id, before_seq, limit)).fetchall()
+        return rows[::-1]
+
+    def delete_session(self, session_id):
+        with self._lock:
+            self._conn.execute('DELETE FROM chat_messages WHERE session_id = ?', (session_id,))
+
+    def prune(self, max_age=MAX_AGE):
+        with self._lock:
+            return self._conn.execute('DELETE FROM chat_messages WHERE created_at < ?',
+                                      (time.time() - max_age,)).rowcount
+
+    def stats(self):
+        with self._lock:
+            sessions, messages = self._conn.execute(
+                'SELECT COUNT(DISTINCT session_id), COUNT(*) FROM chat_messages').fetchone()
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return {'sessions': sessions, 'messages': messages, 'db_mb': round(size / 1024 ** 2, 2)}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ChatHistory:
+    # เก็บใน st.session_state ต่อ session: ข้อความ = (seq, role, content)
+
+    def __init__(self, store, session_id=None, recent=RECENT_MESSAGES, page_size=PAGE_SIZE):
+        self.store = store
+        self.session_id = session_id or uuid.uuid4().hex
+        self.page_size = page_size
+        self.recent = deque(maxlen=recent)
+        # ข้อความเก่าที่ผู้ใช้ขอดู (โหลดจาก SQLite ทีละหน้า)
+        self.older = []
+        self.next_seq = 0
+        # ก่อน seq นี้ไม่มีอะไรเหลือใน SQLite แล้ว (ถูก prune / โหลดมาจนหมด) ปุ่มดูย้อนหลังจะไม่ขึ้นอีก
+        self.oldest_seq = 0
+
+    def __len__(self):
+        return self.next_seq
+
+    def append(self, role, content):
+        if len(self.recent) == self.recent.maxlen:
+            # ตัวที่กำลังจะหลุดจาก ring buffer ลงดิสก์ก่อน
+            self.store.spill(self.session_id, [self.recent[0]])
+        self.recent.append((self.next_seq, role, content))
+        self.next_seq += 1
+
+    def first_visible_seq(self):
+        if self.older:
+            return self.older[0][0]
+        return self.recent[0][0] if self.recent else 0
+
+    def has_older(self):
+        return self.first_visible_seq() > self.oldest_seq
+
+    def load_older(self):
+        before = self.first_visible_seq()
+        rows = self.store.fetch(self.session_id, before, self.page_size)
+        if len(rows) < self.page_size:
+            # ได้ไม่เต็มหน้า = ข้างหลังนี้ไม่มีแล้ว
+            self.oldest_seq = rows[0][0] if rows else before
+        self.older[:0] = rows
+        return len(rows)
+
+    def collapse(self):
+        # กลับไปแสดงแค่ข้อความล่าสุด (เรียกตอนส่งข้อความใหม่)
+        self.older = []
+
+    def visible(self):
+        for _, role, content in self.older:
+            yield {'role': role, 'content': content}
+        for _, role, content in self.recent:
+            yield {'role': role, 'content': content}
+
+    def clear(self):
+        self.store.delete_session(self.session_id)
+        self.recent.clear()
+        self.older = []
+        self.next_seq = 0
+        self.oldest_seq = 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="ดู / ล้างประวัติแชทที่ล้นลง SQLite")
+    parser.add_argument('--db', default=CHAT_DB)
+    parser.add_argument('--prune-days', type=float, default=None, help="ลบประวัติที่เก่ากว่ากี่วัน")
+    args = parser.parse_args()
+
+    store = ChatSpillStore(args.db, max_age=None)
+    if args.prune_days is not None:
+        removed = store.prune(args.prune_days * 24 * 3600)
+        print(f"🧹 ลบ {removed} ข้อความ")
+    print(f"💬 {args.db}: {store.stats()}")
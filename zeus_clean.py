@@ -0,0 +1,197 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import zeus_stations
+import zeus_store
+
+# ==========================================
+# Zeus Cleaning Engine
+# ขั้นตอนเดียวกับ clean_data.ipynb (ชุด 'Authentic Data Only') แต่อ่านข้อมูลทีละก้อนตามลำดับเวลา
+# - รอบที่ 1: ลบ Timezone ผิด / เวลาซ้ำ / -999 แล้วสะสม mean, variance ของแต่ละคอลัมน์ (Chan/Welford)
+# - รอบที่ 2: ทำทุก Mask (Outlier z-score, แถวที่ค่าหลักว่าง) ในรอบเดียวแล้วเขียนออกทีละก้อน
+# หน่วยความจำสูงสุด = ขนาดก้อนเดียว (ค่าเริ่มต้น 1 เดือนจาก Zeus Store) ไม่ขึ้นกับจำนวนเดือนของข้อมูล
+# ==========================================
+
+BAD_TIMEZONE = 'Africa/Malabo'
+ERROR_CODE = -999
+NUMERIC_COLUMNS = ['temp', 'humidity', 'pressure', 'rain', 'uv', 'co2', 'pm25', 'wind_speed']
+OUTLIER_COLUMNS = ['temp', 'humidity', 'pressure', 'co2', 'pm25', 'uv']
+Z_THRESHOLD = 5
+CORE_FEATURES = ['temp', 'humidity', 'pressure', 'rain', 'uv', 'wind_speed']
+RAIN_THRESHOLD = 0.05
+# แถวซ้ำ = สถานีเดียวกันในนาทีเดียวกัน (หลายสถานีส่งข้อมูลเวลาเดียวกันได้)
+DEDUPE_KEY = ['station_id', 'datetime']
+CHUNK_ROWS = 100_000
+
+
+class RunningStats:
+    # mean / variance แบบสะสมทีละก้อน (รวมผลแต่ละก้อนด้วยสูตรของ Chan) ข้ามค่า NaN เหมือน pandas
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.n = np.zeros(len(columns))
+        self.mean = np.zeros(len(columns))
+        self.m2 = np.zeros(len(columns))
+
+    def update(self, X):
+        valid = ~np.isnan(X)
+        n_b = valid.sum(axis=0).astype(np.float64)
+        seen = n_b > 0
+        if not seen.any():
+            return
+        mean_b = np.zeros_like(self.mean)
+        mean_b[seen] = np.nansum(X[:, seen], axis=0) / n_b[seen]
+        m2_b = np.nansum((X - mean_b) ** 2 * valid, axis=0)
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.mean = np.where(seen, self.mean + delta * n_b / n, self.mean)
+            self.m2 = np.where(seen, self.m2 + m2_b + delta ** 2 * self.n * n_b / n, self.m2)
+        self.n = n
+
+    @property
+    def std(self):
+        # ddof=1 เหมือน Series.std()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.n > 1, np.sqrt(self.m2 / (self.n - 1)), np.nan)
+
+    def as_dict(self):
+        return {col: {'count': int(n), 'mean': float(m), 'std': float(s)}
+                for col, n, m, s in zip(self.columns, self.n, self.mean, self.std)}
+
+
+# --- แหล่งข้อมูล (ต้องเรียงตามเวลามาแล้ว) ---
+def iter_csv_chunks(path, chunk_rows=CHUNK_ROWS):
+    yield from pd.read_csv(path, chunksize=chunk_rows)
+
+
+def prefilter(df):
+    # ตัดแถวที่ใช้ไม่ได้ทีละแถว: Timezone ผิด / ไม่มีสถานี / เวลาอ่านไม่ได้
+    keep = np.ones(len(df), dtype=bool)
+    if 'timezone' in df.columns:
+        keep &= (df['timezone'].str.strip() != BAD_TIMEZONE).to_numpy()
+    if 'station_id' in df.columns:
+        keep &= df['station_id'].notna().to_numpy()
+    df = df[keep]
+    if not pd.api.types.is_datetime64_any_dtype(df['datetime']):
+        df = df.assign(datetime=zeus_store.parse_datetime(df['datetime']).to_numpy())
+    return df[df['datetime'].notna()]
+
+
+def iter_deduped(chunks):
+    # ลบแถวซ้ำของ (สถานี, เวลา) เก็บแถวสุดท้าย ข้ามขอบก้อน: แถวที่เวลาเท่ากับแถวท้ายสุดของก้อนจะถูกยกไปรวมกับก้อนถัดไป
+    carry = None
+    for df in chunks:
+        df = prefilter(df)
+        if df.empty:
+            continue
+        df = df.sort_values('datetime', kind='stable')
+        if carry is not None:
+            if df['datetime'].iloc[0] < carry['datetime'].iloc[0]:
+                raise ValueError("ข้อมูลต้องเรียงตามเวลามาก่อน (ก้อนถัดไปมีเวลาย้อนหลัง)")
+            df = pd.concat([carry, df], ignore_index=True)
+        tail = (df['datetime'] == df['datetime'].iloc[-1]).to_numpy()
+        carry = df[tail]
+        body = df[~tail]
+        if len(body):
+            yield body.drop_duplicates(subset=DEDUPE_KEY, keep='last')
+    if carry is not None:
+        yield carry.drop_duplicates(subset=DEDUPE_KEY, keep='last')
+
+
+def fix_values(df):
+    # -999 (Error Code) และพิกัด 0 -> NaN, คอลัมน์ตัวเลขหลักต้องเป็นตัวเลข
+    df = df.copy()
+    numeric = df.select_dtypes(include=[np.number]).columns
+    df[numeric] = df[numeric].mask(df[numeric] == ERROR_CODE)
+    for col in ('lat', 'long'):
+        if col in df.columns:
+            df[col] = df[col].mask(df[col] == 0)
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+def apply_masks(df, stats):
+    # ทุก Mask ในรอบเดียว: z-score ของทุกคอลัมน์คำนวณพร้อมกันเป็น Matrix แล้วค่อยตัดแถวที่ค่าหลักว่าง
+    cols = [c for c in stats.columns if c in df.columns]
+    idx = [stats.columns.index(c) for c in cols]
+    mean, std = stats.mean[idx], stats.std[idx]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        z = np.abs((df[cols].to_numpy(dtype=np.float64) - mean) / std)
+    outlier = (z > Z_THRESHOLD) & (std > 0)
+    df = df.copy()
+    for j, col in enumerate(cols):
+        if outlier[:, j].any():
+            df[col] = df[col].mask(outlier[:, j])
+
+    df = df[df[CORE_FEATURES].notna().all(axis=1).to_numpy()]
+    # ตัวแปรเสริม (Feature Engineering) เหมือนใน notebook
+    hour = df['datetime'].dt.hour
+    return df.assign(
+        hour=hour,
+        is_day=((hour >= 6) & (hour <= 18)).astype(int),
+        rain_clean=(df['rain'] > RAIN_THRESHOLD).astype(int),
+        month=df['datetime'].dt.month,
+    )
+
+
+def clean_chunks(chunk_source):
+    # chunk_source: ฟังก์ชันที่เรียกแล้วได้ iterator ของ DataFrame ใหม่ทุกครั้ง (อ่าน 2 รอบ)
+    report = {'rows_in': 0, 'rows_valid': 0, 'rows_out': 0}
+
+    def counted():
+        for df in chunk_source():
+            report['rows_in'] += len(df)
+            yield df
+
+    stats = RunningStats(OUTLIER_COLUMNS)
+    for df in iter_deduped(counted()):
+        df = fix_values(df)
+        report['rows_valid'] += len(df)
+        stats.update(df.reindex(columns=OUTLIER_COLUMNS).to_numpy(dtype=np.float64))
+    report['stats'] = stats.as_dict()
+
+    def cleaned():
+        for df in iter_deduped(chunk_source()):
+            out = apply_masks(fix_values(df), stats)
+            report['rows_out'] += len(out)
+            yield out
+
+    return cleaned(), report
+
+
+def clean_dataset(source='master_raw', output='cleaned', store_dir=zeus_store.STORE_DIR,
+                  csv_path=None, chunk_rows=CHUNK_ROWS):
+    # อ่านจาก Zeus Store ทีละเดือน (หรือ CSV ที่เรียงเวลาแล้วทีละ chunk_rows แถว) แล้วเขียนลง Store
+    if csv_path:
+        source_fn = lambda: iter_csv_chunks(csv_path, chunk_rows)
+    else:
+        source_fn = lambda: zeus_store.iter_months(source, store_dir=store_dir)
+    chunks, report = clean_chunks(source_fn)
+    zeus_store.write_chunks(chunks, output, store_dir)
+    # อัปเดตรายชื่อ/พิกัดสถานีให้แอป
+    report['stations'] = zeus_stations.build_catalog(output, store_dir)
+    return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="ทำความสะอาดข้อมูลแบบทีละก้อน (เหมือน clean_data.ipynb)")
+    parser.add_argument('--source', default='master_raw', help="dataset ต้นทางใน Zeus Store")
+    parser.add_argument('--output', default='cleaned')
+    parser.add_argument('--store-dir', default=zeus_store.STORE_DIR)
+    parser.add_argument('--csv', default=None, help="อ่านจาก CSV ที่เรียงตามเวลาแล้วแทน Store")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+    zeus_store.use_system_memory_pool()
+
+    t0 = time.perf_counter()
+    print(f"🧹 กำลังทำความสะอาด {args.csv or args.source} -> zeus_store/{args.output} ...")
+    report = clean_dataset(args.source, args.output, args.store_dir, args.csv, args.chunk_rows)
+    print("-" * 50)
+    print(f"✨ ทำความสะอาดเสร็จสิ้น! {report['rows_in']} -> {report['rows_out']} แถว "
+          f"({time.perf_counter() - t0:.2f} วินาที)")
@@ -0,0 +1,152 @@
+import argparse
+import asyncio
+import random
+from urllib.parse import urlencode
+
+import requests
+
+from zeus_metrics import METRICS
+
+# ==========================================
+# Zeus Batch Fetcher
+# ดึง Open-Meteo หลายพิกัดพร้อมกันแบบ asyncio ด้วยคำขอแบบหลายพิกัด (latitude=a,b,c&longitude=x,y,z)
+# - แบ่งพิกัดเป็นก้อนละ chunk_size ต่อคำขอ ยิงพร้อมกันไม่เกิน concurrency คำขอ (Semaphore)
+# - ล่ม / timeout / 429 / 5xx -> ลองใหม่แบบ exponential backoff + jitter; ก้อนที่ยังพังคืน None รายพิกัด
+# - แต่ละคำขอคือ requests.Session.get ใน asyncio.to_thread (ใช้ session / connection pool เดียวกับ ForecastCache ได้)
+# ผลที่ได้ใช้เติม ForecastCache.prefetch() แล้ว ForecastPrecomputer รันโมเดลรวดเดียวทุกพิกัด
+# ==========================================
+
+CHUNK_SIZE = 50
+MAX_CONCURRENCY = 4
+RETRIES = 3
+BACKOFF = 0.5
+TIMEOUT = 15.0
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class FetchError(Exception):
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+    @property
+    def retryable(self):
+        return self.status is None or self.status in RETRY_STATUS
+
+
+def get_json(session, url, params, timeout=TIMEOUT):
+    # เรียกผ่าน asyncio.to_thread: ได้ proxy / redirect / gzip / connection pool ของ requests ครบเหมือนทางดึงเดี่ยว
+    try:
+        response = session.get(url, params=urlencode(params, safe=','), timeout=timeout)
+    except requests.RequestException as e:
+        raise FetchError(f"{type(e).__name__}: {e}") from e
+    if response.status_code != 200:
+        raise FetchError(f"HTTP {response.status_code}", response.status_code)
+    try:
+        return response.json()
+    except ValueError as e:
+        # JSON เสีย
+        raise FetchError(f"ตอบกลับผิดรูปแบบ: {e}") from e
+
+
+class BatchFetcher:
+
+    def __init__(self, base_url, chunk_size=CHUNK_SIZE, concurrency=MAX_CONCURRENCY, retries=RETRIES,
+                 backoff=BACKOFF, timeout=TIMEOUT, rng=None, session=None):
+        self.base_url = base_url
+        self.session = session or requests.Session()
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.rng = rng or random.Random()
+        self.stats = {'requests': 0, 'retries': 0, 'failed_chunks': 0}
+
+    def _params(self, sites, current, hourly, timezone):
+        params = {
+            'latitude': ','.join(str(lat) for lat, _ in sites),
+            'longitude': ','.join(str(lon) for _, lon in sites),
+            'timezone': timezone,
+        }
+        if current:
+            params['current'] = ','.join(current)
+        if hourly:
+            params['hourly'] = ','.join(hourly)
+        return params
+
+    async def _fetch_chunk(self, semaphore, sites, current, hourly, timezone):
+        params = self._params(sites, current, hourly, timezone)
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.stats['retries'] += 1
+                METRICS.inc('open_meteo_retries')
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1) * (1 + self.rng.random()))
+            try:
+                async with semaphore:
+                    self.stats['requests'] += 1
+                    with METRICS.span('open_meteo_batch_request'):
+                        payload = await asyncio.to_thread(get_json, self.session, self.base_url, params,
+                                                          self.timeout)
+                # พิกัดเดียว Open-Meteo ตอบเป็น object / หลายพิกัดตอบเป็น list ตามลำดับที่ขอ
+                payloads = [payload] if isinstance(payload, dict) else payload
+                if not isinstance(payloads, list) or len(payloads) != len(sites):
+                    raise FetchError(f"ได้ {len(payloads) if isinstance(payloads, list) else '?'} พิกัด "
+                                     f"จากที่ขอ {len(sites)}")
+                if not all(isinstance(p, dict) and ('current' in p or 'hourly' in p) for p in payloads):
+                    raise FetchError("Open-Meteo payload ไม่มี current/hourly")
+                return payloads
+            except FetchError as e:
+                METRICS.inc('open_meteo_failures', error=f"HTTP {e.status}" if e.status else 'FetchError')
+                if not e.retryable:
+                    break
+        self.stats['failed_chunks'] += 1
+        return [None] * len(sites)
+
+    async def fetch(self, sites, current=(), hourly=(), timezone='auto'):
+        # sites: [(lat, lon), ...] -> [payload หรือ None] ตามลำดับเดิม
+        sites = list(sites)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        chunks = [sites[i:i + self.chunk_size] for i in range(0, len(sites), self.chunk_size)]
+        results = await asyncio.gather(
+            *(self._fetch_chunk(semaphore, chunk, current, hourly, timezone) for chunk in chunks))
+        return [payload for chunk in results for payload in chunk]
+
+
+def parse_sites(text):
+    # "lat,lon;lat,lon" -> [(lat, lon), ...]
+    return [tuple(float(v) for v in pair.split(',')) for pair in text.split(';') if pair]
+
+
+if __name__ == '__main__':
+    import time
+    from datetime import datetime
+
+    from zeus_forecast import compute_forecasts, issue_hour
+    from zeus_inference import engine_for
+    from zeus_registry import MODEL_FILES, ModelRegistry
+    from zeus_weather import CURRENT_VARS, HOURLY_VARS, OPEN_METEO_URL, TIMEZONE
+
+    parser = argparse.ArgumentParser(description="ดึงพยากรณ์หลายพิกัดรวดเดียว แล้วรันโมเดลรวมครั้งเดียว")
+    parser.add_argument('--sites', required=True, help="lat,lon;lat,lon;...")
+    parser.add_argument('--url', default=OPEN_METEO_URL)
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--concurrency', type=int, default=MAX_CONCURRENCY)
+    args = parser.parse_args()
+
+    sites = parse_sites(args.sites)
+    fetcher = BatchFetcher(args.url, args.chunk_size, args.concurrency)
+    t0 = time.perf_counter()
+    payloads = asyncio.run(fetcher.fetch(sites, CURRENT_VARS, HOURLY_VARS, TIMEZONE))
+    fetch_s = time.perf_counter() - t0
+    models = ModelRegistry(MODEL_FILES)
+    items = [(p, site, 0.0, ()) for site, p in zip(sites, payloads) if p is not None]
+    t0 = time.perf_counter()
+    forecasts = compute_forecasts(items, issue_hour(datetime.now().timestamp()),
+                                  engine_for(models), engine_for(models, ('temp',)))
+    predict_s = time.perf_counter() - t0
+    print(f"🌐 {len(sites)} พิกัด: ดึง {fetch_s:.2f} s ({fetcher.stats}) | รันโมเดล {predict_s * 1000:.1f} ms")
+    for forecast in forecasts:
+        temp = forecast.preds.get('temp')
+        print(f"  {forecast.location}: {forecast.error or f'{temp.min():.1f}-{temp.max():.1f}°C'}")
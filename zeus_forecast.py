@@ -0,0 +1,327 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+import pytz
+
+from zeus_indices import calculate_heat_index, check_zeus_mood
+from zeus_inference import FEATURES, FeatureContractError, build_hourly_matrix, engine_for
+from zeus_metrics import METRICS
+from zeus_registry import ModelLoadError
+from zeus_weather import TIMEZONE
+
+# ==========================================
+# Zeus Forecast Precomputer
+# ผลพยากรณ์ของหน้า Oracle (24 ชม.) และค่าที่หน้าแชทใช้ ขึ้นกับแค่ payload ของ Open-Meteo + ชั่วโมงปัจจุบัน
+# จึงคำนวณครั้งเดียวต่อ (พิกัด, ชั่วโมงที่ออกพยากรณ์) ใน Thread เบื้องหลัง แล้วทุก session อ่านผลเดียวกัน
+# - หน้าเว็บแค่อ่าน dict (ไม่รันโมเดล / ไม่สร้างกราฟ) เวลา render จึงไม่ขึ้นกับจำนวนผู้ใช้
+# - Thread ตื่นทุก REFRESH_SECONDS และตรงต้นชั่วโมง: คำนวณใหม่เมื่อชั่วโมงเปลี่ยน / payload ใหม่ / โมเดลถูก reload
+# - ข้ามชั่วโมงแล้วแต่ยังคำนวณไม่เสร็จ -> ตอบผลชั่วโมงก่อนไปก่อน (คำนวณสดเฉพาะพิกัดที่ยังไม่เคยมีผล)
+# - รอบเบื้องหลังทำทุกพิกัดพร้อมกัน: ดึง Open-Meteo แบบหลายพิกัด (ForecastCache.prefetch) + predict Matrix เดียว
+# ==========================================
+
+HOURS = 24
+REFRESH_SECONDS = 30
+# พิกัดที่ไม่มีใครเปิดดูเกินนี้ เลิกคำนวณเบื้องหลัง
+LOCATION_TTL = 2 * 3600
+# จำนวนพิกัดที่ติดตาม / คำนวณเบื้องหลังได้พร้อมกัน (LRU) กันคนยิงพิกัดสุ่มจน memory + คำขอ Open-Meteo โตไม่จำกัด
+MAX_LOCATIONS = 256
+THAI_TZ = pytz.timezone(TIMEZONE)
+
+
+def issue_hour(ts):
+    # ชั่วโมงที่ออกพยากรณ์ (ตัดนาทีทิ้ง) ตามเวลาไทย
+    return datetime.fromtimestamp(ts, THAI_TZ).replace(minute=0, second=0, microsecond=0)
+
+
+@dataclass
+class OracleForecast:
+    location: tuple
+    issued_at: datetime
+    fetched_at: float
+    version: tuple
+    times: list = field(default_factory=list)
+    preds: dict = field(default_factory=dict)  # temp / humidity / rain (%) / uv: array 24 ชม.
+    api: dict = field(default_factory=dict)    # ค่า hourly ของ Open-Meteo 24 ชม. (เส้นเทียบในกราฟ / ไทม์ไลน์)
+    chat: dict = field(default_factory=dict)   # ค่าจุดเดียว ณ ชั่วโมงปัจจุบัน สำหรับหน้าแชท
+    error: str = ''
+    chat_error: str = ''
+    compute_seconds: float = 0.0
+    views: dict = field(default_factory=dict)  # ของที่แอปสร้างต่อจากผลนี้ (กราฟ / ChatContext) ผ่าน post hook
+
+
+@dataclass
+class ChatContext:
+    # บริบทสภาพอากาศที่หน้าแชทใช้ตอบทุกข้อความ: คำนวณครั้งเดียวต่อผลพยากรณ์ แชร์ทุก session
+    pred_temp: float
+    hum: float
+    press: float
+    rain_status: float
+    uv: float
+    heat_index: float
+    advice: str
+    mood_text: str
+    mood_icon: str
+    mood_alert: bool
+    template_values: dict = field(init=False, repr=False)  # ค่าที่ใช้เติม template ของ zeus_responses
+
+    def __post_init__(self):
+        self.template_values = {
+            'pred_temp': self.pred_temp, 'hum': self.hum, 'press': self.press,
+            'mood_text': self.mood_text, 'mood_icon': self.mood_icon, 'advice': self.advice,
+        }
+
+
+def chat_context(forecast):
+    # บริบทของหน้าแชท / API: อุณหภูมิที่โมเดลทำนาย + Heat Index + อารมณ์ของซุส (ทุกข้อความแค่อ่านค่านี้)
+    chat = forecast.chat
+    if forecast.chat_error or 'pred_temp' not in chat:
+        return None
+    mood_text, mood_icon, mood_alert = check_zeus_mood(chat['press'], chat['hum'], chat['rain_status'])
+    heat_index, advice, _ = calculate_heat_index(chat['pred_temp'], chat['hum'])
+    return ChatContext(chat['pred_temp'], chat['hum'], chat['press'], chat['rain_status'], chat['uv'],
+                       float(heat_index), advice, mood_text, mood_icon, mood_alert)
+
+
+def chat_point(payload, issued_at):
+    # ค่าปัจจุบันจาก API + ชั่วโมง/เดือน เหมือนที่หน้าแชทเคยสร้าง X_input เอง
+    current = payload['current']
+    hour = issued_at.hour
+    point = {
+        'temp': current['temperature_2m'],
+        'hum': current['relative_humidity_2m'],
+        'press': current['surface_pressure'],
+        'rain_status': current['rain'],
+        'wind': current['wind_speed_10m'],
+        'uv': payload['hourly']['uv_index'][hour],
+        'hour': hour,
+        'is_day': 1 if 6 <= hour <= 18 else 0,
+        'month': issued_at.month,
+    }
+    # เรียงตาม FEATURES ของ zeus_inference
+    row = {'temp': point['temp'], 'humidity': point['hum'], 'pressure': point['press'], 'rain': point['rain_status'],
+           'uv': point['uv'], 'wind_speed': point['wind'], 'hour': hour, 'is_day': point['is_day'], 'month': point['month']}
+    X = np.array([[np.nan if row[f] is None else row[f] for f in FEATURES]], dtype=np.float32)
+    return point, X
+
+
+def compute_forecast(payload, issued_at, engine, chat_engine, location=None, fetched_at=0.0, version=()):
+    return compute_forecasts([(payload, location, fetched_at, version)], issued_at, engine, chat_engine)[0]
+
+
+def compute_forecasts(items, issued_at, engine, chat_engine):
+    # items: [(payload, location, fetched_at, version), ...]
+    # Matrix ของทุกพิกัดต่อกันแล้ว predict ครั้งเดียว (หลายพิกัด = แถวเพิ่ม ไม่ใช่รอบ predict เพิ่ม)
+    t0 = time.perf_counter()
+    forecasts, blocks, points = [], [], []
+    for payload, location, fetched_at, version in items:
+        forecast = OracleForecast(location, issued_at, fetched_at, version)
+        forecasts.append(forecast)
+        if 'hourly' not in payload:
+            forecast.error = forecast.chat_error = "ไม่พบข้อมูลพยากรณ์ล่วงหน้า (Hourly Data missing)"
+            continue
+        hourly = payload['hourly']
+        if isinstance(engine, Exception):
+            forecast.error = str(engine)
+        else:
+            with METRICS.span('build_features'):
+                X_future, forecast.times = build_hourly_matrix(hourly, issued_at, hours=HOURS)
+            blocks.append((forecast, X_future))
+            forecast.api = {k: hourly[k][:HOURS] for k in ('temperature_2m', 'relative_humidity_2m', 'uv_index',
+                                                          'rain', 'surface_pressure')}
+        if 'current' in payload:
+            forecast.chat, X_now = chat_point(payload, issued_at)
+            if isinstance(chat_engine, Exception):
+                forecast.chat_error = str(chat_engine)
+            else:
+                points.append((forecast, X_now))
+
+    if blocks:
+        preds = engine.predict(np.concatenate([X for _, X in blocks]))
+        start = 0
+        for forecast, X in blocks:
+            forecast.preds = {name: values[start:start + len(X)] for name, values in preds.items()}
+            start += len(X)
+    if points:
+        pred_temp = chat_engine.predict(np.concatenate([X for _, X in points]))['temp']
+        for i, (forecast, _) in enumerate(points):
+            forecast.chat['pred_temp'] = float(pred_temp[i])
+
+    # เวลาคำนวณเฉลี่ยต่อพิกัด
+    elapsed = (time.perf_counter() - t0) / max(len(forecasts), 1)
+    for forecast in forecasts:
+        forecast.compute_seconds = elapsed
+    return forecasts
+
+
+class ForecastPrecomputer:
+
+    def __init__(self, forecast_cache, models, post=None, interval=REFRESH_SECONDS, clock=time.time,
+                 max_locations=MAX_LOCATIONS):
+        self.cache = forecast_cache
+        self.models = models
+        self.post = post
+        self.interval = interval
+        self.clock = clock
+        self.max_locations = max_locations
+        self._forecasts = {}
+        # พิกัด -> เวลาที่มีคนขอล่าสุด เรียงจากขอนานสุด -> ล่าสุด
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+        self._compute_locks = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self.stats = {'computed': 0, 'reads': 0, 'sync_computes': 0, 'stale_reads': 0, 'last_compute_s': 0.0}
+
+    @staticmethod
+    def location_key(lat, lon):
+        return round(float(lat), 4), round(float(lon), 4)
+
+    # --- อ่านจากหน้าเว็บ / API ---
+    def get(self, lat, lon, compute=True):
+        loc = self.location_key(lat, lon)
+        now = self.clock()
+        with self._lock:
+            self._seen[loc] = now
+            self._seen.move_to_end(loc)
+            self._evict()
+            forecast = self._forecasts.get(loc)
+            stale = forecast is not None and forecast.issued_at != issue_hour(now)
+            self.stats['reads'] += 1
+            if stale:
+                self.stats['stale_reads'] += 1
+            elif forecast is None and compute:
+                self.stats['sync_computes'] += 1
+        miss = 'compute' if compute else 'miss'
+        METRICS.inc('forecast_reads', result='stale' if stale else miss if forecast is None else 'hit')
+        if stale:
+            # ข้ามชั่วโมงแล้ว: ตอบของเดิมไปก่อน ปลุก Thread ให้คำนวณชั่วโมงใหม่
+            self._wake.set()
+        if forecast is not None or not compute:
+            # compute=False: ผู้เรียก (เช่น event loop ของ API) ห้ามบล็อก -> ได้ None แล้วไปคำนวณใน Thread เอง
+            return forecast
+        # พิกัดใหม่ยังไม่เคยคำนวณ: คำนวณตอนนี้ (คำขอพร้อมกันรอผลเดียวกัน)
+        return self.refresh(*loc)
+
+    def _evict(self):
+        # ต้องถือ self._lock อยู่: เกินโควตา -> ทิ้งพิกัดที่ไม่มีใครขอนานที่สุด
+        while len(self._seen) > self.max_locations:
+            loc, _ = self._seen.popitem(last=False)
+            self._forecasts.pop(loc, None)
+            self._compute_locks.pop(loc, None)
+            METRICS.inc('forecast_evictions')
+
+    # --- คำนวณ ---
+    def _engines(self):
+        engines = []
+        for names in (None, ('temp',)):
+            try:
+                engines.append(engine_for(self.models, names))
+            except (ModelLoadError, FeatureContractError) as e:
+                engines.append(e)
+        return engines
+
+    def refresh(self, lat, lon):
+        loc = self.location_key(lat, lon)
+        entry = self.cache.get_entry(*loc)
+        if entry is None:
+            return self._forecasts.get(loc)
+        issued_at = issue_hour(self.clock())
+        engine, chat_engine = self._engines()
+        # Engine ถูกสร้างใหม่เมื่อ Registry reload โมเดล -> id เปลี่ยน -> คำนวณใหม่
+        version = (issued_at, entry.fetched_at,
+                   *(str(e) if isinstance(e, Exception) else id(e) for e in (engine, chat_engine)))
+        with self._lock:
+            lock = self._compute_locks.setdefault(loc, threading.Lock())
+        with lock:
+            current = self._forecasts.get(loc)
+            if current is not None and current.version == version:
+                return current
+            with METRICS.span('forecast_compute'):
+                forecast = compute_forecast(entry.payload, issued_at, engine, chat_engine, loc,
+                                            entry.fetched_at, version)
+            self._store(loc, forecast)
+        return forecast
+
+    def refresh_many(self, locations):
+        # หลายพิกัดรวดเดียว: ดึง Open-Meteo แบบหลายพิกัด (ถ้า cache รองรับ) + predict ครั้งเดียวทุกพิกัด
+        locations = [self.location_key(lat, lon) for lat, lon in locations]
+        prefetch = getattr(self.cache, 'prefetch', None)
+        if prefetch is not None:
+            prefetch(locations)
+        issued_at = issue_hour(self.clock())
+        engine, chat_engine = self._engines()
+        items = []
+        for loc in locations:
+            entry = self.cache.get_entry(*loc)
+            if entry is None:
+                continue
+            version = (issued_at, entry.fetched_at,
+                       *(str(e) if isinstance(e, Exception) else id(e) for e in (engine, chat_engine)))
+            current = self._forecasts.get(loc)
+            if current is None or current.version != version:
+                items.append((entry.payload, loc, entry.fetched_at, version))
+        if not items:
+            return []
+        with METRICS.span('forecast_compute_batch'):
+            forecasts = compute_forecasts(items, issued_at, engine, chat_engine)
+        for forecast in forecasts:
+            self._store(forecast.location, forecast)
+        return forecasts
+
+    def _store(self, loc, forecast):
+        # post hook สร้างของต่อจากผล (กราฟ / บริบทแชท) เช็คเองว่าส่วนไหนมี error
+        if self.post is not None:
+            with METRICS.span('forecast_views'):
+                forecast.views = self.post(forecast)
+        forecast.compute_seconds = round(forecast.compute_seconds, 4)
+        with self._lock:
+            self._forecasts[loc] = forecast
+            self.stats['computed'] += 1
+            self.stats['last_compute_s'] = forecast.compute_seconds
+
+    # --- Thread เบื้องหลัง ---
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='zeus-precompute', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def _sleep_seconds(self):
+        # ตื่นก่อนครบ interval ถ้าต้นชั่วโมงถัดไปมาถึงก่อน
+        now = self.clock()
+        to_next_hour = 3600 - now % 3600 + 0.5
+        return min(self.interval, to_next_hour)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self._sleep_seconds())
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            now = self.clock()
+            with self._lock:
+                for loc, seen in list(self._seen.items()):
+                    if now - seen > LOCATION_TTL:
+                        self._seen.pop(loc)
+                        self._forecasts.pop(loc, None)
+                        self._compute_locks.pop(loc, None)
+                locations = list(self._seen)
+            try:
+                self.refresh_many(locations)
+            except Exception:
+                # Thread เบื้องหลังห้ามตาย: ก้อนรวมพัง -> ไล่ทีละพิกัด (พิกัดที่เสียไม่ลากคนอื่นไปด้วย)
+                METRICS.inc('precompute_errors')
+                for loc in locations:
+                    try:
+                        self.refresh(*loc)
+                    except Exception:
+                        METRICS.inc('precompute_errors')
@@ -0,0 +1,244 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+# ==========================================
+# Zeus Flat Forest
+# แปลง Random Forest ของ sklearn เป็นตาราง Node แบบ Array (feature, threshold, left, right, value)
+# แล้วทำนายด้วย NumPy ทีเดียวทุกต้นทุกแถว ไม่ต้อง dispatch ทีละต้นผ่าน joblib
+#
+# โครงสร้างไฟล์:
+#   zeus_models_flat/<model>/meta.json        <- ชี้ไปยังเวอร์ชันปัจจุบัน (เขียนทับแบบ atomic)
+#   zeus_models_flat/<model>/<version>/*.npy  <- ตาราง Node ของทุกต้นต่อกันเป็นก้อนเดียว
+#                                                (ไม่บีบอัด จึงโหลดแบบ mmap_mode='r' ได้)
+# ==========================================
+
+FLAT_DIR = 'zeus_models_flat'
+ARRAYS = ('feature', 'threshold', 'left', 'right', 'value', 'missing_left', 'is_leaf', 'roots')
+# โฟลเดอร์ tmp-* ของ exporter ที่ค้างนานกว่านี้ถือว่า process ตายไปแล้ว ลบทิ้งได้
+TMP_GRACE = 3600
+
+
+def _float32_floor(threshold):
+    # X ถูกแปลงเป็น float32 ก่อนเทียบ: ปัด threshold ลงเป็น float32 ตัวที่ไม่เกินค่าเดิม
+    # จะได้ x <= t32 ให้ผลเหมือน x <= t64 ทุกค่า x ที่เป็น float32
+    t32 = threshold.astype(np.float32)
+    over = t32.astype(np.float64) > threshold
+    t32[over] = np.nextafter(t32[over], np.float32(-np.inf))
+    return t32
+
+
+def flatten_forest(model, positive_class=1):
+    # รวม Node ของทุกต้นเป็นตารางเดียว (index แบบ global) ใบไม้ชี้กลับหาตัวเอง
+    is_classifier = hasattr(model, 'classes_')
+    class_index = list(model.classes_).index(positive_class) if is_classifier else None
+
+    parts = {name: [] for name in ARRAYS if name != 'roots'}
+    roots = []
+    offset = 0
+    max_depth = 0
+    for est in model.estimators_:
+        tree = est.tree_
+        n = tree.node_count
+        ids = np.arange(n, dtype=np.int64)
+        leaf = tree.children_left == -1
+        left = np.where(leaf, ids, tree.children_left) + offset
+        right = np.where(leaf, ids, tree.children_right) + offset
+        feature = np.where(leaf, 0, tree.feature)
+        threshold = np.where(leaf, np.inf, tree.threshold)
+
+        value = tree.value[:, 0, :]
+        if is_classifier:
+            normalizer = value.sum(axis=1)
+            normalizer[normalizer == 0.0] = 1.0
+            value = value[:, class_index] / normalizer
+        else:
+            value = value[:, 0]
+
+        missing = getattr(tree, 'missing_go_to_left', None)
+        missing = np.zeros(n, dtype=bool) if missing is None else (np.asarray(missing) == 1) & ~leaf
+
+        parts['feature'].append(feature.astype(np.int32))
+        parts['threshold'].append(_float32_floor(threshold))
+        parts['left'].append(left.astype(np.int32))
+        parts['right'].append(right.astype(np.int32))
+        parts['value'].append(value.astype(np.float64))
+        parts['missing_left'].append(missing)
+        parts['is_leaf'].append(leaf)
+        roots.append(offset)
+        offset += n
+        max_depth = max(max_depth, tree.max_depth)
+
+    arrays = {name: np.concatenate(chunks) for name, chunks in parts.items()}
+    arrays['roots'] = np.asarray(roots, dtype=np.int32)
+    meta = {
+        'kind': 'classifier' if is_classifier else 'regressor',
+        'features': [str(f) for f in getattr(model, 'feature_names_in_', [])],
+        'n_features': int(model.n_features_in_),
+        'n_trees': len(roots),
+        'n_nodes': int(offset),
+        'max_depth': int(max_depth),
+    }
+    return FlatForest(arrays, meta)
+
+
+class FlatForest:
+    # ใช้แทนโมเดล sklearn ได้ในแอป: มี predict / predict_proba / feature_names_in_
+
+    def __init__(self, arrays, meta):
+        self.meta = meta
+        # ทุกตารางเป็น Array ที่อ่านอย่างเดียว เปิดแบบ mmap ได้ทั้งหมด
+        # (หลาย process ใช้ page cache ชุดเดียวกัน ไม่ต้องคัดลอกเป็นของตัวเอง)
+        for name in ARRAYS:
+            setattr(self, name, arrays[name])
+        self.n_features_in_ = meta['n_features']
+        if meta['features']:
+            self.feature_names_in_ = np.asarray(meta['features'], dtype=object)
+        if meta['kind'] == 'classifier':
+            self.classes_ = np.array([0, 1])
+
+    def predict_matrix(self, X):
+        # X: float32 (n_samples, n_features) เรียงตามลำดับ Feature ของโมเดล
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n_samples, n_trees = X.shape[0], len(self.roots)
+        node = np.tile(self.roots, n_samples)
+        sample = np.repeat(np.arange(n_samples), n_trees)
+        active = np.flatnonzero(~self.is_leaf[node])
+        # เดินลงทีละชั้นพร้อมกันทุกต้นทุกแถว เก็บเฉพาะคู่ที่ยังไม่ถึงใบ
+        while active.size:
+            nd = node[active]
+            x = X[sample[active], self.feature[nd]]
+            go_left = (x <= self.threshold[nd]) | (np.isnan(x) & self.missing_left[nd])
+            nxt = np.where(go_left, self.left[nd], self.right[nd])
+            node[active] = nxt
+            active = active[~self.is_leaf[nxt]]
+        values = self.value[node].reshape(n_samples, n_trees)
+        # บวกทีละต้นตามลำดับแบบเดียวกับ sklearn ผลรวมจะตรงทุก bit (mean แบบ pairwise ต่างกันหลักทศนิยมท้ายๆ)
+        out = np.zeros(n_samples)
+        for j in range(n_trees):
+            out += values[:, j]
+        return out / n_trees
+
+    def _as_matrix(self, X):
+        if hasattr(X, 'columns') and self.meta['features']:
+            X = X[self.meta['features']]
+        return np.asarray(X, dtype=np.float32)
+
+    def predict(self, X):
+        out = self.predict_matrix(self._as_matrix(X))
+        if self.meta['kind'] == 'classifier':
+            return (out > 0.5).astype(int)
+        return out
+
+    def predict_proba(self, X):
+        p = self.predict_matrix(self._as_matrix(X))
+        return np.column_stack([1.0 - p, p])
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in ARRAYS)
+
+
+# --- บันทึก / โหลด ---
+def save_flat_forest(forest, model_dir, source=None):
+    # เขียนเวอร์ชันใหม่ในโฟลเดอร์แยก แล้วค่อยสลับ meta.json (process ที่ mmap ตัวเก่าอยู่ไม่พัง)
+    os.makedirs(model_dir, exist_ok=True)
+    meta = dict(forest.meta)
+    digest = hashlib.sha1()
+    for name in ARRAYS:
+        digest.update(np.ascontiguousarray(getattr(forest, name)).tobytes())
+    version = digest.hexdigest()[:12]
+    version_dir = os.path.join(model_dir, version)
+    if not os.path.isdir(version_dir):
+        tmp_dir = f"{version_dir}.tmp-{os.getpid()}"
+        os.makedirs(tmp_dir, exist_ok=True)
+        for name in ARRAYS:
+            np.save(os.path.join(tmp_dir, f"{name}.npy"), getattr(forest, name))
+        os.replace(tmp_dir, version_dir)
+    else:
+        # เวอร์ชันเดิมถูก publish ซ้ำ: ให้เป็นตัวล่าสุดตาม mtime (ใช้ตัดสินว่าอะไรเก่ากว่าด้านล่าง)
+        os.utime(version_dir)
+
+    meta.update(version=version, source=source or {}, exported_at=time.time())
+    tmp_meta = os.path.join(model_dir, f"meta.json.tmp-{os.getpid()}")
+    with open(tmp_meta, 'w') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp_meta, os.path.join(model_dir, 'meta.json'))
+
+    prune_versions(model_dir, version)
+    return version_dir
+
+
+def prune_versions(model_dir, version, tmp_grace=TMP_GRACE):
+    # ลบเวอร์ชันที่เก่ากว่าตัวที่เพิ่ง publish (ไฟล์ที่ยัง mmap อยู่จะหายจริงเมื่อ process นั้นปิด)
+    # - เวอร์ชันที่ใหม่กว่า (exporter อื่นที่ publish ตามมา) ไม่แตะ
+    # - tmp-* คือ exporter อื่นที่กำลังเขียนอยู่: ลบเฉพาะที่ค้างเกิน tmp_grace (process ตายกลางทาง)
+    published = os.stat(os.path.join(model_dir, version)).st_mtime
+    now = time.time()
+    for entry in os.listdir(model_dir):
+        path = os.path.join(model_dir, entry)
+        if entry == version or not os.path.isdir(path):
+            continue
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue
+        if '.tmp-' in entry:
+            if now - mtime > tmp_grace:
+                shutil.rmtree(path, ignore_errors=True)
+        elif mtime < published:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def load_flat_forest(meta_path, mmap_mode=None):
+    with open(meta_path) as f:
+        meta = json.load(f)
+    version_dir = os.path.join(os.path.dirname(meta_path), meta['version'])
+    arrays = {}
+    for name in ARRAYS:
+        path = os.path.join(version_dir, f"{name}.npy")
+        if name == 'is_leaf' and not os.path.exists(path):
+            # export รุ่นแรกยังไม่มี is_leaf: ใบไม้คือ Node ที่ชี้กลับหาตัวเอง
+            arrays[name] = arrays['left'] == np.arange(len(arrays['left']), dtype=np.int32)
+            continue
+        arrays[name] = np.load(path, mmap_mode=mmap_mode)
+    return FlatForest(arrays, meta)
+
+
+def export_model(model, name, flat_dir=FLAT_DIR, source_path=None):
+    source = {}
+    if source_path:
+        st_ = os.stat(source_path)
+        source = {'path': os.path.basename(source_path), 'mtime_ns': st_.st_mtime_ns, 'size': st_.st_size}
+    forest = flatten_forest(model)
+    save_flat_forest(forest, os.path.join(flat_dir, name), source=source)
+    return forest
+
+
+def export_all(model_files=None, base_dir='.', flat_dir=None):
+    import joblib
+    from zeus_registry import MODEL_FILES
+
+    model_files = model_files or MODEL_FILES
+    flat_dir = flat_dir or os.path.join(base_dir, FLAT_DIR)
+    for name, filename in model_files.items():
+        path = os.path.join(base_dir, filename)
+        t0 = time.perf_counter()
+        forest = export_model(joblib.load(path), name, flat_dir, source_path=path)
+        print(f"   ✅ {filename} -> {flat_dir}/{name} "
+              f"({forest.meta['n_trees']} ต้น, {forest.meta['n_nodes']:,} nodes, "
+              f"{forest.nbytes / 1024 ** 2:.1f} MB, {time.perf_counter() - t0:.1f}s)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="แปลงโมเดล .pkl เป็น Flat Forest (.npy)")
+    parser.add_argument('--base-dir', default='.')
+    parser.add_argument('--flat-dir', default=None)
+    args = parser.parse_args()
+    print("⚡ กำลังแปลงโมเดลเป็น Flat Forest...")
+    export_all(base_dir=args.base_dir, flat_dir=args.flat_dir)
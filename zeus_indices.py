@@ -0,0 +1,109 @@
+import argparse
+
+import numpy as np
+
+# ==========================================
+# Zeus Indices
+# Heat Index / UV Burn Rate / อารมณ์ของซุส แบบ array: ให้คะแนนทั้งชุดรายชั่วโมง (24 ชม. หรือกี่วันก็ได้) ใน NumPy call เดียว
+# - เกณฑ์อยู่ในตาราง (ขอบเขต + ข้อความ) แปลงค่าเป็นระดับด้วย np.digitize / np.select
+# - ฟังก์ชันแบบค่าเดียวของเดิม (calculate_heat_index ฯลฯ) ใช้ตารางเดียวกัน คืนค่าเหมือนเดิมทุกอย่าง
+# ==========================================
+
+# Heat Index: hi < 27 / < 32 / < 41 / ที่เหลือ
+HEAT_EDGES = (27, 32, 41)
+HEAT_ADVICE = ("🏃 สบายๆ: วิ่งจอกกิ้งได้ ", "⚠️ เริ่มร้อน: จิบน้ำบ่อยๆ ", "🏠 ร้อนชื้น: อยู่ในร่มเถอะมนุษย์ ",
+               "☠️ อันตราย: Heat Stroke! ")
+HEAT_COLORS = ("green", "#FFD700", "orange", "red")
+
+# UV: <= 2 / <= 5 / <= 7 / <= 10 / ที่เหลือ
+UV_EDGES = (2, 5, 7, 10)
+UV_BURN = ("Low", "Moderate", "High", "Very High", "Extreme")
+UV_ADVICE = ("ผิวไม่ไหม้ง่ายๆ (ออกแดดได้ 60+ นาที)", "ออกแดดได้ประมาณ 45 นาที", "ระวัง! (ออกแดดได้ 30 นาที)",
+             "อันตราย! (ออกแดดได้ 15-25 นาที)", "🔥 ร้อนมาก ผิวไหม้ใน < 10 นาที")
+
+# อารมณ์ของซุส: พายุ (ความกดต่ำ + ชื้นจัด) ก่อน แล้วค่อยดูฝนที่ตกอยู่
+STORM_PRESSURE = 1006
+STORM_HUMIDITY = 80
+MOOD_TEXT = ("⚡ ความกดอากาศต่ำผิดปกติ ฝนจะมา!", "ฝนกำลังตก", "ท้องฟ้าปกติ")
+MOOD_ICON = ("⛈️", "🌧️", "☁️")
+MOOD_ALERT = (True, False, False)
+MOOD_STORM, MOOD_RAIN, MOOD_CLEAR = range(3)
+
+
+def _array(values):
+    # list จาก API อาจมี None -> NaN
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    if np.isscalar(values):
+        return np.float64(values)
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+def apparent_temperature(temp, humidity):
+    # สูตรคำนวณความร้อนสะสมที่ร่างกายรู้สึก (Apparent Temperature)
+    # อ้างอิง: Australian Bureau of Meteorology approximation
+    vapor_pressure = humidity / 100 * 6.105 * np.exp(17.27 * temp / (237.7 + temp))
+    return temp + 0.33 * vapor_pressure - 4.0
+
+
+def heat_levels(hi):
+    return np.digitize(hi, HEAT_EDGES)
+
+
+def uv_levels(uv):
+    # right=True: ขอบบนรวมอยู่ในระดับนั้น (<=)
+    return np.digitize(uv, UV_EDGES, right=True)
+
+
+def mood_levels(pressure, humidity, rain):
+    storm = (pressure < STORM_PRESSURE) & (humidity > STORM_HUMIDITY)
+    return np.select([storm, rain > 0], [MOOD_STORM, MOOD_RAIN], default=MOOD_CLEAR)
+
+
+def hourly_indices(temp, humidity, uv, pressure, rain):
+    # ทั้งชุดรายชั่วโมง -> dict ของ array (ระดับเป็น index ของตารางด้านบน)
+    temp, humidity, uv = _array(temp), _array(humidity), _array(uv)
+    pressure, rain = _array(pressure), _array(rain)
+    hi = apparent_temperature(temp, humidity)
+    mood = mood_levels(pressure, humidity, rain)
+    return {
+        'heat_index': hi,
+        'heat_level': heat_levels(hi),
+        'uv': uv,
+        'uv_level': uv_levels(uv),
+        'mood_level': mood,
+        'storm_alert': mood == MOOD_STORM,
+    }
+
+
+# --- แบบค่าเดียว (API เดิมของ app.py) ---
+def calculate_burn_rate(uv_index):
+    level = int(uv_levels(uv_index))
+    return UV_BURN[level], UV_ADVICE[level]
+
+
+def calculate_heat_index(temp, humidity):
+    hi = apparent_temperature(temp, humidity)
+    level = int(heat_levels(hi))
+    return hi, HEAT_ADVICE[level], HEAT_COLORS[level]
+
+
+def check_zeus_mood(pressure, humidity, rain_status):
+    level = int(mood_levels(pressure, humidity, rain_status))
+    return MOOD_TEXT[level], MOOD_ICON[level], MOOD_ALERT[level]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="คำนวณ Heat Index / UV Burn Rate / อารมณ์ของซุส")
+    parser.add_argument('--temp', type=float, required=True)
+    parser.add_argument('--humidity', type=float, required=True)
+    parser.add_argument('--uv', type=float, default=0.0)
+    parser.add_argument('--pressure', type=float, default=1010.0)
+    parser.add_argument('--rain', type=float, default=0.0)
+    args = parser.parse_args()
+
+    hi, advice, _ = calculate_heat_index(args.temp, args.humidity)
+    print(f"🔥 รู้สึกเหมือน {hi:.1f}°C {advice}")
+    print(f"☀️ UV {args.uv}: {' - '.join(calculate_burn_rate(args.uv))}")
+    mood_text, mood_icon, _ = check_zeus_mood(args.pressure, args.humidity, args.rain)
+    print(f"{mood_icon} {mood_text}")
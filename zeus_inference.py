@@ -0,0 +1,145 @@
+import threading
+from datetime import timedelta
+
+import numpy as np
+
+from zeus_metrics import METRICS
+
+# ==========================================
+# Zeus Oracle Inference Engine
+# ทำนายทั้ง 4 เป้าหมาย (อุณหภูมิ / ความชื้น / โอกาสฝน / UV) จาก Matrix เดียว
+# - รับข้อมูลรายชั่วโมงเป็น float32 matrix ครั้งเดียว ไม่สร้าง DataFrame ต่อการเรียก
+# - ตรวจลำดับ Feature ของแต่ละโมเดลแค่ครั้งเดียวตอนสร้าง Engine
+# ==========================================
+
+# ลำดับคอลัมน์ของ Matrix รวม (ทุกโมเดลหยิบคอลัมน์ไปจากตรงนี้)
+FEATURES = ('temp', 'humidity', 'pressure', 'rain', 'uv', 'wind_speed', 'hour', 'is_day', 'month')
+
+# Feature ของแต่ละโมเดล ต้องตรงกับลำดับตอน fit ใน train_model.ipynb
+MODEL_FEATURES = {
+    'temp': ('humidity', 'pressure', 'rain', 'uv', 'wind_speed', 'hour', 'is_day', 'month'),
+    'humidity': ('temp', 'pressure', 'rain', 'uv', 'wind_speed', 'hour', 'is_day', 'month'),
+    'rain': ('temp', 'humidity', 'pressure', 'uv', 'wind_speed', 'hour', 'is_day', 'month'),
+    'uv': ('temp', 'humidity', 'pressure', 'rain', 'wind_speed', 'hour', 'is_day', 'month'),
+}
+
+# คอลัมน์ใน payload รายชั่วโมงของ Open-Meteo ที่ใช้เติม Matrix
+HOURLY_COLUMNS = {
+    'temp': 'temperature_2m',
+    'humidity': 'relative_humidity_2m',
+    'pressure': 'surface_pressure',
+    'rain': 'rain',
+    'uv': 'uv_index',
+    'wind_speed': 'wind_speed_10m',
+}
+
+
+class FeatureContractError(ValueError):
+    pass
+
+
+def is_day_hour(hour):
+    # 06:00 - 18:00 คือกลางวัน (เหมือนตอนเทรน)
+    return ((hour >= 6) & (hour <= 18)).astype(np.float32)
+
+
+def build_hourly_matrix(hourly, current_dt, hours=24):
+    # Matrix (hours x 9) เรียงตาม FEATURES พร้อมแกนเวลา สำหรับหน้า Oracle
+    times = [current_dt + timedelta(hours=i) for i in range(hours)]
+    X = np.empty((hours, len(FEATURES)), dtype=np.float32)
+    for col, key in HOURLY_COLUMNS.items():
+        # API อาจส่ง null มาบางชั่วโมง -> NaN
+        values = hourly[key][:hours]
+        X[:, FEATURES.index(col)] = np.fromiter(
+            (np.nan if v is None else v for v in values), dtype=np.float32, count=hours)
+
+    hour = np.fromiter((t.hour for t in times), dtype=np.float32, count=hours)
+    is_day = is_day_hour(hour)
+    X[:, FEATURES.index('hour')] = hour
+    X[:, FEATURES.index('is_day')] = is_day
+    X[:, FEATURES.index('month')] = np.fromiter((t.month for t in times), dtype=np.float32, count=hours)
+    # กลางคืน UV ต้อง 0
+    uv = FEATURES.index('uv')
+    X[:, uv] = np.where(is_day == 1, X[:, uv], 0.0)
+    return X, times
+
+
+class _SklearnForest:
+    # เรียก tree_.predict ของแต่ละต้นตรงๆ ข้ามการ validate input ของ sklearn ทุกครั้ง
+
+    def __init__(self, model, positive_class=None):
+        self.trees = [est.tree_ for est in model.estimators_]
+        self.n_classes = getattr(model, 'n_classes_', None)
+        self.class_index = None
+        if positive_class is not None:
+            self.class_index = list(model.classes_).index(positive_class)
+
+    def predict_matrix(self, X):
+        total = np.zeros(X.shape[0], dtype=np.float64)
+        for tree in self.trees:
+            # single-output: tree_.predict คืน (n_samples, max_n_classes)
+            value = tree.predict(X)
+            if self.class_index is None:
+                total += value[:, 0]
+            else:
+                proba = value[:, :self.n_classes]
+                normalizer = proba.sum(axis=1)
+                normalizer[normalizer == 0.0] = 1.0
+                total += proba[:, self.class_index] / normalizer
+        return total / len(self.trees)
+
+
+def check_feature_contract(name, model):
+    expected = MODEL_FEATURES[name]
+    names = getattr(model, 'feature_names_in_', None)
+    if names is not None:
+        if tuple(names) != expected:
+            raise FeatureContractError(
+                f"{name}: ลำดับ Feature ไม่ตรง (โมเดล {tuple(names)} / ที่ใช้ {expected})")
+    elif getattr(model, 'n_features_in_', len(expected)) != len(expected):
+        raise FeatureContractError(f"{name}: จำนวน Feature ไม่ตรง ({model.n_features_in_} != {len(expected)})")
+
+
+class OracleEngine:
+
+    def __init__(self, models, names=None):
+        self.models = {name: models[name] for name in names or MODEL_FEATURES}
+        self._forests = {}
+        self._columns = {}
+        for name, model in self.models.items():
+            check_feature_contract(name, model)
+            self._columns[name] = np.array([FEATURES.index(f) for f in MODEL_FEATURES[name]])
+            if hasattr(model, 'predict_matrix'):
+                # Flat Forest (zeus_forest.py) ทำนายทุกต้นพร้อมกันอยู่แล้ว
+                self._forests[name] = model
+            else:
+                self._forests[name] = _SklearnForest(model, positive_class=1 if name == 'rain' else None)
+
+    def predict(self, X):
+        # X: float32 matrix เรียงตาม FEATURES -> dict ของผลทำนายทั้ง 4 ตัว
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        out = {}
+        for name, forest in self._forests.items():
+            with METRICS.span('predict', model=name):
+                out[name] = forest.predict_matrix(np.ascontiguousarray(X[:, self._columns[name]]))
+        # โอกาสฝนแสดงเป็น %
+        if 'rain' in out:
+            out['rain'] = out['rain'] * 100
+        return out
+
+
+_engine_lock = threading.Lock()
+_engines = {}
+
+
+def engine_for(models, names=None):
+    # Engine ใช้ซ้ำได้ตราบใดที่ Registry ยังให้โมเดลตัวเดิม (reload แล้วจะสร้างใหม่)
+    names = tuple(names or MODEL_FEATURES)
+    current = {name: models[name] for name in names}
+    key = tuple(id(current[name]) for name in names)
+    with _engine_lock:
+        engine = _engines.get(names)
+        if engine is None or engine[0] != key:
+            engine = (key, OracleEngine(current, names))
+            _engines[names] = engine
+    return engine[1]
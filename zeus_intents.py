@@ -0,0 +1,115 @@
+import argparse
+from collections import deque
+from dataclasses import dataclass
+
+# ==========================================
+# Zeus Intent Matcher (Ark Zeus Chat)
+# แยกหมวดข้อความผู้ใช้ด้วย Aho-Corasick automaton ที่สร้างครั้งเดียวตอน import
+# - อ่านข้อความรอบเดียว เจอ keyword / คำยกเว้นทุกคำพร้อมกัน (รวมคำที่ซ้อนกัน เช่น "บ้า" ใน "บ้าน")
+# - เวลาต่อข้อความขึ้นกับความยาวข้อความ ไม่ขึ้นกับจำนวน keyword
+# - ความหมายเหมือน any(word in text) / all(exclusion not in text) แบบเดิมทุกกรณี
+# ==========================================
+
+
+@dataclass(frozen=True)
+class Intent:
+    name: str
+    keywords: tuple
+    # เจอคำเหล่านี้ -> ไม่ใช่หมวดนี้ ไปดูหมวดถัดไป (เช่น "บ้าน" มี "บ้า" อยู่ข้างใน)
+    blockers: tuple = ()
+    # เจอคำเหล่านี้ -> ยังเป็นหมวดนี้ แต่ตอบแบบปฏิเสธ (ชื่อหมวด + '_negated')
+    negations: tuple = ()
+
+
+# เรียงตามลำดับความสำคัญ (หมวดแรกที่ตรงชนะ)
+INTENTS = (
+    Intent('insult', ("กาก", "โง่", "ทำไม", "เก่ง", "แน่จริง", "ด่า", "สาบาน", "ห่วย", "สวะ", "บ้า", "ตาย", "อ่อน"),
+           blockers=("บ้าน",)),
+    Intent('love', ("เมีย", "เฮรา", "แฟน", "ผู้หญิง", "สวย", "ความรัก", "จีบ", "นก", "หงส์", "ชู้", "วัว")),
+    Intent('rain', ("ฝน", "พายุ", "ตก", "เปียก", "ร่ม", "ฟ้าผ่า", "เมฆ", "มืด", "ครึ้ม"),
+           negations=("ไม่ตก", "ไม่เปียก", "ข้าวเปียก", "สอบตก", "ของตก")),
+    Intent('heat', ("ร้อน", "อุณหภูมิ", "หนาว", "สภาพอากาศ", "แดด", "ไหม้", "อุ่น", "แอร์"),
+           negations=("ไม่ร้อน", "ไม่หนาว", "ไม่ไหม้")),
+    Intent('greeting', ("สวัสดี", "ทักทาย", "ชื่อ", "ใคร", "ซุส", "เทพ", "hello", "hi")),
+)
+FALLBACK = 'fallback'
+
+
+class IntentMatcher:
+
+    def __init__(self, intents=INTENTS, fallback=FALLBACK):
+        self.intents = tuple(intents)
+        self.fallback = fallback
+        # คำแต่ละคำ -> bitmask ของบทบาท (intent i: keyword = bit 3i, blocker = 3i+1, negation = 3i+2)
+        term_bits = {}
+        self._rules = []
+        for i, intent in enumerate(self.intents):
+            for role, words in enumerate((intent.keywords, intent.blockers, intent.negations)):
+                for word in words:
+                    word = word.lower()
+                    term_bits[word] = term_bits.get(word, 0) | 1 << (3 * i + role)
+            self._rules.append((intent.name, 1 << 3 * i, 1 << 3 * i + 1, 1 << 3 * i + 2))
+        self._build(term_bits)
+
+    def _build(self, term_bits):
+        # Trie: goto[state] = {ตัวอักษร: state ถัดไป}, out[state] = bitmask ของคำที่จบที่ state นี้
+        goto, out = [{}], [0]
+        for term, bits in term_bits.items():
+            state = 0
+            for ch in term:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(0)
+                state = nxt
+            out[state] |= bits
+
+        # Failure link (BFS) + รวม output ของ suffix ที่เป็นคำด้วย -> เจอคำที่ซ้อนกันครบ
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] |= out[fail[nxt]]
+        self._goto, self._fail, self._out = goto, fail, out
+
+    def scan(self, text):
+        # bitmask รวมของทุกคำที่อยู่ในข้อความ (อ่านรอบเดียว)
+        goto, fail, out = self._goto, self._fail, self._out
+        state, found = 0, 0
+        for ch in text.lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            found |= out[state]
+        return found
+
+    def match(self, text):
+        found = self.scan(text)
+        for name, keyword, blocker, negation in self._rules:
+            if found & keyword and not found & blocker:
+                return f"{name}_negated" if found & negation else name
+        return self.fallback
+
+
+# สร้างครั้งเดียวต่อ process
+MATCHER = IntentMatcher()
+
+
+def match_intent(text):
+    return MATCHER.match(text)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="ทดลองแยกหมวดข้อความของ Ark Zeus Chat")
+    parser.add_argument('text', nargs='+')
+    args = parser.parse_args()
+    for text in args.text:
+        print(f"{text} -> {match_intent(text)}")
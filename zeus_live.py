@@ -0,0 +1,249 @@
+import argparse
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytz
+
+from merge_data import FOLDER_PATH, column_names, extract_payload
+from zeus_metrics import METRICS
+from zeus_weather import TIMEZONE
+
+# ==========================================
+# Zeus Live Feed (สถานีของเราเอง)
+# ตามไฟล์ Log ของวันนี้ (dataset_new/YYYYMMDD) ที่สถานีต่อท้ายทุก 5 นาที แบบ offset polling
+# - จำ offset ที่อ่านถึง อ่านเฉพาะ byte ใหม่ ไม่อ่านไฟล์ซ้ำ (ไม่มี inotify ใน stdlib และ polling ใช้กับทุก filesystem)
+# - บรรทัดที่ยังเขียนไม่เสร็จ (ไม่มี \n) เก็บไว้ต่อกับรอบถัดไป
+# - เที่ยงคืนเปลี่ยนไปไฟล์ของวันใหม่ แต่ยังตามไฟล์เมื่อวานต่ออีก ROTATE_GRACE วินาที (บรรทัดที่มาช้า)
+# - ไฟล์ถูกแทนที่ / ถูกตัด (inode เปลี่ยน หรือเล็กลง) -> อ่านใหม่จากต้นไฟล์
+# - ค่าล่าสุดเก็บใน ring buffer (deque) ให้ Dashboard อ่าน
+# ==========================================
+
+LIVE_DIR = os.environ.get('ZEUS_LIVE_DIR', FOLDER_PATH)
+STATION_ID = os.environ.get('ZEUS_STATION_ID', 'S1-0000898463')
+POLL_SECONDS = 2.0
+# 1 วันของค่าทุก 5 นาที
+BUFFER_SIZE = 288
+ROTATE_GRACE = 120
+# สถานีส่งทุก 5 นาที เงียบเกินนี้ถือว่าค่าเก่า
+STALE_SECONDS = 15 * 60
+# อ่านต่อรอบไม่เกินนี้ (ตามไฟล์ใหญ่ทันทีละนิด ไม่ค้างหน่วยความจำ)
+MAX_READ_BYTES = 1 << 20
+THAI_TZ = pytz.timezone(TIMEZONE)
+
+_COL = {name: i for i, name in enumerate(column_names)}
+
+
+@dataclass(frozen=True)
+class Reading:
+    unix_time: int
+    station_id: str
+    temp: float
+    humidity: float
+    pressure: float
+    rain: float
+    wind_speed: float
+    uv: float
+    co2: float
+    pm25: float
+
+
+def _float(value):
+    try:
+        return float(value)
+    except ValueError:
+        return float('nan')
+
+
+def parse_line(line):
+    # บรรทัด syslog -> Reading (ใช้ตัวแยก '] ' เดียวกับ merge_data.py) / None ถ้าไม่ใช่บรรทัดข้อมูล
+    payload = extract_payload(line)
+    if payload is None:
+        return None
+    values = payload.split(',')
+    try:
+        unix_time = int(values[_COL['unix_time']])
+    except ValueError:
+        return None
+    return Reading(unix_time, values[_COL['station_id']],
+                   *(_float(values[_COL[name]]) for name in
+                     ('temp', 'humidity', 'pressure', 'rain', 'wind_speed', 'uv', 'co2', 'pm25')))
+
+
+def daily_path(folder, ts):
+    return os.path.join(folder, datetime.fromtimestamp(ts, THAI_TZ).strftime('%Y%m%d'))
+
+
+class FileTail:
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+        self.inode = None
+        self.partial = b''
+
+    def poll(self):
+        # คืนบรรทัดที่เขียนเสร็จแล้วตั้งแต่รอบก่อน
+        try:
+            st_ = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+        if st_.st_ino != self.inode or st_.st_size < self.offset:
+            # ไฟล์ใหม่ / ถูกแทนที่ / ถูกตัด
+            if self.inode is not None:
+                METRICS.inc('live_file_resets')
+            self.inode, self.offset, self.partial = st_.st_ino, 0, b''
+        if st_.st_size == self.offset:
+            return []
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(min(st_.st_size - self.offset, MAX_READ_BYTES))
+        self.offset += len(data)
+        data = self.partial + data
+        end = data.rfind(b'\n') + 1
+        self.partial = data[end:]
+        return data[:end].decode('utf-8', errors='ignore').splitlines()
+
+
+class LiveFeed:
+
+    def __init__(self, folder=LIVE_DIR, station_id=STATION_ID, maxlen=BUFFER_SIZE, poll_interval=POLL_SECONDS,
+                 clock=time.time):
+        self.folder = folder
+        self.station_id = station_id
+        self.poll_interval = poll_interval
+        self.clock = clock
+        self.readings = deque(maxlen=maxlen)
+        self.lines = 0
+        self.bad_lines = 0
+        self.last_poll = 0.0
+        self.last_error = ''
+        self._tail = None
+        # ไฟล์ของเมื่อวานที่ยังตามต่อหลังเที่ยงคืน: (FileTail, หมดเวลาเมื่อไร)
+        self._previous = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def _ingest(self, lines):
+        added = 0
+        for line in lines:
+            self.lines += 1
+            reading = parse_line(line)
+            if reading is None:
+                self.bad_lines += 1
+                continue
+            if self.station_id and reading.station_id != self.station_id:
+                continue
+            # ค่าซ้ำ / ย้อนเวลา (เช่นไฟล์เมื่อวานที่มาช้า) ไม่ต่อท้าย
+            if self.readings and reading.unix_time <= self.readings[-1].unix_time:
+                continue
+            self.readings.append(reading)
+            added += 1
+        if added:
+            METRICS.inc('live_readings', added)
+        return added
+
+    def poll(self):
+        now = self.clock()
+        path = daily_path(self.folder, now)
+        with self._lock:
+            if self._tail is None or self._tail.path != path:
+                if self._tail is not None:
+                    METRICS.inc('live_rotations')
+                    self._previous = (self._tail, now + ROTATE_GRACE)
+                self._tail = FileTail(path)
+            lines = []
+            if self._previous is not None:
+                tail, until = self._previous
+                lines += tail.poll()
+                if now >= until:
+                    self._previous = None
+            lines += self._tail.poll()
+            self.last_poll = now
+            return self._ingest(lines)
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll()
+                self.last_error = ''
+            except Exception as e:
+                # ไฟล์หาย / บรรทัดแปลก / อะไรก็ตาม: จดไว้แล้ววนต่อ Thread ต้องไม่ตาย
+                self.last_error = f"{type(e).__name__}: {e}"
+                METRICS.inc('live_poll_errors', error=type(e).__name__)
+
+    def start(self):
+        if self._thread is None:
+            self.poll()
+            self._thread = threading.Thread(target=self._run, name='zeus-live', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def latest(self):
+        with self._lock:
+            return self.readings[-1] if self.readings else None
+
+    def recent(self, n=BUFFER_SIZE):
+        with self._lock:
+            return list(self.readings)[-n:]
+
+    def status(self):
+        with self._lock:
+            tail = self._tail
+            return {
+                'path': tail.path if tail else '',
+                'offset': tail.offset if tail else 0,
+                'readings': len(self.readings),
+                'lines': self.lines,
+                'bad_lines': self.bad_lines,
+                'last_poll': self.last_poll,
+                'error': self.last_error,
+            }
+
+
+def replay(source, folder=LIVE_DIR, speed=60.0):
+    # จำลองสถานี: เขียนบรรทัดจากไฟล์เก่าต่อท้ายไฟล์ของวันนี้ตามจังหวะจริง (หารด้วย speed)
+    target = daily_path(folder, time.time())
+    os.makedirs(folder, exist_ok=True)
+    with open(source, encoding='utf-8', errors='ignore') as src, open(target, 'a', encoding='utf-8') as out:
+        prev = None
+        for line in src:
+            reading = parse_line(line)
+            if reading is not None and prev is not None:
+                time.sleep(max(0.0, (reading.unix_time - prev) / speed))
+            prev = reading.unix_time if reading is not None else prev
+            out.write(line)
+            out.flush()
+            print(f"✍️ {target}: {line.strip()[:80]}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="ตามไฟล์ Log ของสถานีแบบสด")
+    parser.add_argument('--folder', default=LIVE_DIR)
+    parser.add_argument('--station', default=STATION_ID)
+    parser.add_argument('--replay', metavar='FILE', help="เขียนบรรทัดจากไฟล์นี้ต่อท้ายไฟล์ของวันนี้แทนการตาม")
+    parser.add_argument('--speed', type=float, default=60.0, help="ความเร็วของ --replay (เท่าของเวลาจริง)")
+    args = parser.parse_args()
+
+    if args.replay:
+        replay(args.replay, args.folder, args.speed)
+        raise SystemExit(0)
+
+    feed = LiveFeed(args.folder, args.station)
+    print(f"📡 ตาม {daily_path(args.folder, time.time())} (Ctrl+C เพื่อหยุด)")
+    try:
+        while True:
+            if feed.poll():
+                r = feed.latest()
+                lag = time.time() - r.unix_time
+                print(f"🌡️ {r.temp:.1f}°C 💧 {r.humidity:.0f}% PM2.5 {r.pm25:.0f} CO2 {r.co2:.0f} ppm (ช้า {lag:.0f} วินาที)")
+            time.sleep(feed.poll_interval)
+    except KeyboardInterrupt:
+        print(f"👋 {feed.status()}")
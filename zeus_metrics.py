@@ -0,0 +1,373 @@
+import argparse
+import collections
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ==========================================
+# Zeus Metrics: จับเวลา hot path + counter ใน process ของแอป (เบาพอจะเปิดไว้ตลอดใน production)
+# - METRICS.span('open_meteo_fetch'): สะสม count / sum / max / histogram ต่อ stage (+ label เช่น model)
+# - METRICS.inc('forecast_cache', result='hit'): counter
+# - ZEUS_METRICS_PORT=9108  -> HTTP endpoint /metrics (Prometheus text) และ /metrics.json
+# - ZEUS_METRICS_FILE=path  -> เขียน JSON sidecar ทุก ZEUS_METRICS_INTERVAL วินาที
+# - ZEUS_PROFILE=1          -> sampling profiler: rerun ที่ช้ากว่า ZEUS_PROFILE_SLOW_MS
+#                              เก็บ folded stacks ไว้ที่ ZEUS_PROFILE_DIR (เปิดด้วย flamegraph.pl / speedscope)
+# ==========================================
+
+# ขอบบนของ histogram (วินาที)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PREFIX = 'zeus_'
+
+METRICS_PORT = int(os.environ.get('ZEUS_METRICS_PORT', '0') or 0)
+METRICS_FILE = os.environ.get('ZEUS_METRICS_FILE', '')
+METRICS_INTERVAL = float(os.environ.get('ZEUS_METRICS_INTERVAL', '15'))
+
+PROFILE = os.environ.get('ZEUS_PROFILE') == '1'
+PROFILE_SLOW_MS = float(os.environ.get('ZEUS_PROFILE_SLOW_MS', '500'))
+PROFILE_INTERVAL = float(os.environ.get('ZEUS_PROFILE_INTERVAL_MS', '5')) / 1000
+PROFILE_DIR = os.environ.get('ZEUS_PROFILE_DIR', os.path.join('.zeus_cache', 'profiles'))
+# เก็บไฟล์ profile ล่าสุดไม่เกินนี้ (ลบไฟล์เก่าสุดทิ้ง)
+MAX_PROFILES = 50
+
+
+class _Histogram:
+    __slots__ = ('count', 'sum', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+
+def _labels_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key, extra=()):
+    items = list(key) + list(extra)
+    if not items:
+        return ''
+    body = ','.join('{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"')) for k, v in items)
+    return '{' + body + '}'
+
+
+def _series_name(name, key):
+    return name + ''.join(f"[{k}={v}]" for k, v in key)
+
+
+# ==========================================
+# Sampling profiler (เก็บเฉพาะ Thread ที่กำลัง rerun)
+# ==========================================
+
+def _folded_stack(frame):
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ';'.join(reversed(parts))
+
+
+class SamplingProfiler:
+
+    def __init__(self, interval=PROFILE_INTERVAL):
+        self.interval = interval
+        self._targets = {}
+        self._lock = threading.Lock()
+        self._active = threading.Event()
+        self._thread = None
+
+    def begin(self, thread_id):
+        stacks = collections.Counter()
+        with self._lock:
+            self._targets[thread_id] = stacks
+            self._active.set()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='zeus-profiler', daemon=True)
+                self._thread.start()
+        return stacks
+
+    def end(self, thread_id):
+        with self._lock:
+            stacks = self._targets.pop(thread_id, collections.Counter())
+            if not self._targets:
+                self._active.clear()
+        return stacks
+
+    def _run(self):
+        while True:
+            self._active.wait()
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id, stacks in self._targets.items():
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        stacks[_folded_stack(frame)] += 1
+            del frames
+            time.sleep(self.interval)
+
+
+def write_folded(stacks, path):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
+    os.replace(tmp, path)
+
+
+def prune_profiles(profile_dir, keep=MAX_PROFILES):
+    files = sorted(glob.glob(os.path.join(profile_dir, '*.folded')), key=os.path.getmtime)
+    for path in files[:-keep] if keep else files:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# ==========================================
+# Registry ของ metric ทั้ง process
+# ==========================================
+
+class Metrics:
+
+    def __init__(self, profile=PROFILE, slow_ms=PROFILE_SLOW_MS, profile_dir=PROFILE_DIR):
+        self.started_at = time.time()
+        self._spans = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+        self.profiler = SamplingProfiler() if profile else None
+        self.slow_seconds = slow_ms / 1000
+        self.profile_dir = profile_dir
+        self._server = None
+        self._writer = None
+
+    # --- บันทึกค่า ---
+    def observe(self, name, seconds, **labels):
+        key = (name, _labels_key(labels))
+        with self._lock:
+            hist = self._spans.get(key)
+            if hist is None:
+                hist = self._spans[key] = _Histogram()
+            hist.observe(seconds)
+
+    @contextmanager
+    def span(self, name, **labels):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - t0, **labels)
+
+    def inc(self, name, value=1, **labels):
+        key = (name, _labels_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    @contextmanager
+    def rerun(self, page=''):
+        # ครอบทั้ง rerun: span 'rerun' + (ถ้าเปิด profiler) เก็บ stack ของ Thread นี้ไว้ดูตอนช้า
+        thread_id = threading.get_ident()
+        stacks = self.profiler.begin(thread_id) if self.profiler else None
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            self.observe('rerun', elapsed, page=page)
+            if stacks is not None:
+                self.profiler.end(thread_id)
+                if elapsed >= self.slow_seconds and stacks:
+                    self._save_profile(stacks, page, elapsed)
+
+    def _save_profile(self, stacks, page, elapsed):
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        slug = ''.join(c if c.isalnum() else '_' for c in page) or 'rerun'
+        path = os.path.join(self.profile_dir, f"rerun-{stamp}-{slug}-{elapsed * 1000:.0f}ms.folded")
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            write_folded(stacks, path)
+            prune_profiles(self.profile_dir)
+        except OSError:
+            return
+        self.inc('slow_rerun_profiles', page=page)
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+        self.started_at = time.time()
+
+    # --- ส่งออก ---
+    def snapshot(self):
+        with self._lock:
+            spans = {key: (h.count, h.sum, h.max) for key, h in self._spans.items()}
+            counters = dict(self._counters)
+        return {
+            'pid': os.getpid(),
+            'uptime_s': round(time.time() - self.started_at, 1),
+            'rss_mb': round(_rss_bytes() / 1024 ** 2, 1),
+            'spans': {
+                _series_name(name, key): {
+                    'count': count,
+                    'sum_s': round(total, 6),
+                    'mean_ms': round(total / count * 1000, 3) if count else 0.0,
+                    'max_ms': round(peak * 1000, 3),
+                }
+                for (name, key), (count, total, peak) in sorted(spans.items())
+            },
+            'counters': {_series_name(name, key): value for (name, key), value in sorted(counters.items())},
+        }
+
+    def prometheus_text(self):
+        with self._lock:
+            spans = {key: (h.count, h.sum, list(h.buckets)) for key, h in self._spans.items()}
+            counters = dict(self._counters)
+        lines = []
+        seen = set()
+        for (name, key), (count, total, buckets) in sorted(spans.items()):
+            metric = f"{PREFIX}{name}_seconds"
+            if metric not in seen:
+                seen.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, n in zip(BUCKETS, buckets):
+                cumulative += n
+                lines.append(f"{metric}_bucket{_format_labels(key, [('le', bound)])} {cumulative}")
+            lines.append(f"{metric}_bucket{_format_labels(key, [('le', '+Inf')])} {count}")
+            lines.append(f"{metric}_sum{_format_labels(key)} {total:.6f}")
+            lines.append(f"{metric}_count{_format_labels(key)} {count}")
+        for (name, key), value in sorted(counters.items()):
+            metric = f"{PREFIX}{name}_total"
+            if metric not in seen:
+                seen.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_format_labels(key)} {value}")
+        lines.append(f"# TYPE {PREFIX}process_resident_memory_bytes gauge")
+        lines.append(f"{PREFIX}process_resident_memory_bytes {_rss_bytes()}")
+        lines.append(f"# TYPE {PREFIX}process_start_time_seconds gauge")
+        lines.append(f"{PREFIX}process_start_time_seconds {self.started_at:.0f}")
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+
+    def start_exporters(self, port=METRICS_PORT, path=METRICS_FILE, interval=METRICS_INTERVAL):
+        # เรียกซ้ำได้ (เปิดแค่ครั้งแรก); port / path ว่าง = ไม่เปิด
+        if port and self._server is None:
+            try:
+                self._server = _MetricsServer(('0.0.0.0', port), self)
+            except OSError as e:
+                # หลาย worker บนเครื่องเดียวกันชนพอร์ต: ตัวแรกได้ไป ตัวที่เหลือใช้ JSON sidecar แทน
+                print(f"⚠️ เปิด metrics endpoint :{port} ไม่ได้ ({e})")
+            else:
+                threading.Thread(target=self._server.serve_forever, name='zeus-metrics-http', daemon=True).start()
+        if path and self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, args=(path, interval),
+                                            name='zeus-metrics-file', daemon=True)
+            self._writer.start()
+        return self
+
+    def _write_loop(self, path, interval):
+        while True:
+            try:
+                self.write_json(path)
+            except OSError:
+                pass
+            time.sleep(interval)
+
+
+def _rss_bytes():
+    from zeus_registry import current_rss_bytes
+    return current_rss_bytes()
+
+
+class _MetricsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, metrics):
+        super().__init__(address, _MetricsHandler)
+        self.metrics = metrics
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path == '/metrics':
+            body = self.server.metrics.prometheus_text().encode()
+            content_type = 'text/plain; version=0.0.4; charset=utf-8'
+        elif path == '/metrics.json':
+            body = json.dumps(self.server.metrics.snapshot(), ensure_ascii=False).encode()
+            content_type = 'application/json'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+# ตัวเดียวทั้ง process (โมดูลอื่น import ไปใช้ตรงๆ)
+METRICS = Metrics()
+
+
+def merge_profiles(profile_dir, out_path):
+    # รวม .folded ทุกไฟล์เป็นไฟล์เดียว (flame graph ของ rerun ที่ช้าทั้งหมด)
+    total = collections.Counter()
+    files = glob.glob(os.path.join(profile_dir, '*.folded'))
+    for path in files:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                stack, _, count = line.rstrip('\n').rpartition(' ')
+                if stack:
+                    total[stack] += int(count)
+    write_folded(total, out_path)
+    return len(files)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Zeus metrics tools")
+    parser.add_argument('--summary', metavar='JSON', help="สรุป span จาก JSON sidecar (ZEUS_METRICS_FILE)")
+    parser.add_argument('--merge-profiles', metavar='OUT', help="รวมไฟล์ .folded ใน --profile-dir เป็นไฟล์เดียว")
+    parser.add_argument('--profile-dir', default=PROFILE_DIR)
+    args = parser.parse_args()
+
+    if args.summary:
+        import pandas as pd
+        with open(args.summary, encoding='utf-8') as f:
+            snap = json.load(f)
+        print(f"📈 pid {snap['pid']} | uptime {snap['uptime_s']} s | RSS {snap['rss_mb']} MB")
+        if snap['spans']:
+            print(pd.DataFrame(snap['spans']).T.sort_values('sum_s', ascending=False).to_string())
+        for name, value in snap['counters'].items():
+            print(f"  {name}: {value}")
+    if args.merge_profiles:
+        n = merge_profiles(args.profile_dir, args.merge_profiles)
+        print(f"🔥 รวม {n} ไฟล์ -> {args.merge_profiles} (flamegraph.pl {args.merge_profiles} > flame.svg)")
+    if not (args.summary or args.merge_profiles):
+        parser.print_help()
@@ -0,0 +1,306 @@
+import argparse
+import functools
+import hashlib
+import os
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import joblib
+
+from zeus_forest import FLAT_DIR, load_flat_forest
+from zeus_metrics import METRICS
+
+# ==========================================
+# Zeus Model Registry
+# โหลดโมเดลครั้งเดียวต่อ 1 process แล้วแชร์ให้ทุก session ใช้ร่วมกัน
+# - โหลดแบบ Lazy: โหลดเฉพาะโมเดลที่หน้านั้นๆ เรียกใช้จริง
+# - Reload เฉพาะตอนไฟล์ .pkl ถูกเปลี่ยน (mtime / hash)
+# - เก็บสถิติเวลาโหลดและหน่วยความจำ (RSS) ของแต่ละโมเดล
+# - ถ้ามี Flat Forest (zeus_forest.py) ที่ export หลัง .pkl จะใช้ตัวนั้นแทน
+#   และเปิดแบบ mmap อ่านอย่างเดียว: หลาย Streamlit process ใช้หน่วยความจำก้อนเดียวกันผ่าน page cache
+# ==========================================
+
+# ชื่อโมเดล -> ไฟล์ที่ train_model.ipynb บันทึกไว้
+MODEL_FILES = {
+    'temp': 'zeus_oracle_model.pkl',
+    'humidity': 'zeus_humidity_model.pkl',
+    'rain': 'zeus_rain_class_model.pkl',
+    'uv': 'zeus_uv_model.pkl',
+}
+
+# ความถี่ในการเช็คไฟล์ (วินาที) กันไม่ให้ os.stat ทุกครั้งที่ rerun
+DEFAULT_CHECK_INTERVAL = 2.0
+
+# ปิด mmap ได้ด้วย ZEUS_MODEL_MMAP=0 (จะโหลด Flat Forest เข้าหน่วยความจำของ process เอง)
+MODEL_MMAP = os.environ.get('ZEUS_MODEL_MMAP', '1') != '0'
+
+
+class ModelLoadError(RuntimeError):
+    pass
+
+
+def current_rss_bytes():
+    # อ่าน Resident Set Size ของ process ปัจจุบัน (Linux อ่านจาก /proc ได้เร็วที่สุด)
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return 0
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+@dataclass
+class ModelStats:
+    name: str
+    path: str
+    format: str = ''
+    loaded: bool = False
+    load_seconds: float = 0.0
+    rss_bytes: int = 0
+    load_count: int = 0
+    mtime_ns: int = 0
+    size_bytes: int = 0
+    data_bytes: int = 0
+    sha256: str = ''
+    last_error: str = ''
+
+    def as_dict(self):
+        return {
+            'model': self.name,
+            'file': os.path.basename(self.path) if self.format != 'flat' else f"{FLAT_DIR}/{self.name}",
+            'format': self.format,
+            'loaded': self.loaded,
+            'load_time_s': round(self.load_seconds, 3),
+            'rss_mb': round(self.rss_bytes / 1024 ** 2, 1),
+            'file_mb': round(self.data_bytes / 1024 ** 2, 1),
+            'loads': self.load_count,
+            'error': self.last_error,
+        }
+
+
+@dataclass
+class _Entry:
+    filename: str
+    stats: ModelStats
+    model: object = None
+    checked_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class ModelRegistry(Mapping):
+    # ใช้งานได้เหมือน dict เดิม: models['temp'].predict(...)
+
+    def __init__(self, files=None, base_dir='.', loader=joblib.load, flat_dir=FLAT_DIR,
+                 mmap=MODEL_MMAP, check_interval=DEFAULT_CHECK_INTERVAL):
+        files = MODEL_FILES if files is None else files
+        self.base_dir = base_dir
+        self.loader = loader
+        self.flat_dir = os.path.join(base_dir, flat_dir) if flat_dir else None
+        self.flat_loader = functools.partial(load_flat_forest, mmap_mode='r' if mmap else None)
+        self.check_interval = check_interval
+        self._entries = {
+            name: _Entry(filename, ModelStats(name, os.path.join(base_dir, filename)))
+            for name, filename in files.items()
+        }
+
+    # --- Mapping interface ---
+    def __getitem__(self, name):
+        entry = self._entries[name]
+        now = time.monotonic()
+        if entry.model is not None and now - entry.checked_at < self.check_interval:
+            return entry.model
+
+        with entry.lock:
+            if entry.model is None or self._file_changed(entry):
+                self._load(entry)
+            entry.checked_at = time.monotonic()
+            return entry.model
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __bool__(self):
+        # เทียบเท่า models เดิมที่เป็น None เมื่อหาไฟล์โมเดลไม่เจอ
+        return all(os.path.exists(self._source(name)[0]) for name in self._entries)
+
+    # --- การโหลด / ตรวจสอบไฟล์ ---
+    def _source(self, name):
+        # ใช้ Flat Forest ถ้า export ไว้แล้วและไม่เก่ากว่า .pkl
+        pkl = os.path.join(self.base_dir, self._entries[name].filename)
+        if self.flat_dir:
+            meta = os.path.join(self.flat_dir, name, 'meta.json')
+            try:
+                meta_mtime = os.stat(meta).st_mtime_ns
+            except OSError:
+                meta_mtime = None
+            if meta_mtime is not None:
+                try:
+                    if meta_mtime >= os.stat(pkl).st_mtime_ns:
+                        return meta, 'flat', self.flat_loader
+                except OSError:
+                    return meta, 'flat', self.flat_loader
+        return pkl, 'pickle', self.loader
+
+    def _file_changed(self, entry):
+        stats = entry.stats
+        if self._source(stats.name)[0] != stats.path:
+            return True
+        try:
+            st_ = os.stat(stats.path)
+        except OSError:
+            # ไฟล์หายไประหว่างรัน ใช้โมเดลที่อยู่ในหน่วยความจำต่อไป
+            return False
+        if st_.st_mtime_ns == stats.mtime_ns and st_.st_size == stats.size_bytes:
+            return False
+        # mtime เปลี่ยน แต่เนื้อไฟล์อาจเหมือนเดิม (เช่น git checkout / touch) -> เช็ค hash ก่อน reload
+        digest = file_sha256(stats.path)
+        if digest == stats.sha256:
+            stats.mtime_ns, stats.size_bytes = st_.st_mtime_ns, st_.st_size
+            return False
+        return True
+
+    def _load(self, entry):
+        stats = entry.stats
+        path, fmt, loader = self._source(stats.name)
+        try:
+            st_ = os.stat(path)
+            digest = file_sha256(path)
+            rss_before = current_rss_bytes()
+            t0 = time.perf_counter()
+            model = loader(path)
+            elapsed = time.perf_counter() - t0
+        except Exception as e:
+            stats.last_error = str(e)
+            METRICS.inc('model_load_errors', model=stats.name)
+            if entry.model is not None:
+                # ไฟล์ใหม่เสีย ให้ใช้โมเดลตัวเก่าไปก่อน
+                return
+            raise ModelLoadError(f"{stats.name}: {e}") from e
+
+        # แทนที่ตัวเก่า (session ที่ถือตัวเก่าอยู่ยังใช้ต่อได้จนจบ rerun)
+        entry.model = model
+        stats.path, stats.format = path, fmt
+        stats.loaded = True
+        stats.load_seconds = elapsed
+        METRICS.observe('model_load', elapsed, model=stats.name, format=fmt)
+        stats.rss_bytes = max(current_rss_bytes() - rss_before, 0)
+        stats.load_count += 1
+        stats.mtime_ns, stats.size_bytes, stats.sha256 = st_.st_mtime_ns, st_.st_size, digest
+        # Flat Forest: ขนาดรวมของตาราง Node / pickle: ขนาดไฟล์
+        stats.data_bytes = getattr(model, 'nbytes', st_.st_size)
+        stats.last_error = ''
+
+    # --- รายงานสถิติ ---
+    def is_loaded(self, name):
+        return self._entries[name].model is not None
+
+    def preload(self, names=None):
+        for name in names or self._entries:
+            self[name]
+
+    def stats(self):
+        return [e.stats.as_dict() for e in self._entries.values()]
+
+
+# ==========================================
+# Memory report: หน่วยความจำที่เป็นของ process นี้คนเดียว (Private) กับที่แชร์กับ process อื่น (Shared)
+# อ่านจาก /proc/self/smaps (Linux เท่านั้น)
+# ==========================================
+
+_SMAPS_FIELDS = {
+    'Rss': 'rss', 'Pss': 'pss',
+    'Shared_Clean': 'shared', 'Shared_Dirty': 'shared',
+    'Private_Clean': 'private', 'Private_Dirty': 'private',
+}
+
+
+def memory_report(model_dir=None):
+    # คืน {'process': {...}, 'models': {...}} หน่วยเป็น MB; models = เฉพาะไฟล์ที่ mmap จาก model_dir
+    totals = {'rss': 0, 'pss': 0, 'shared': 0, 'private': 0}
+    models = dict(totals)
+    model_dir = os.path.abspath(model_dir) if model_dir else None
+    in_model = False
+    try:
+        with open('/proc/self/smaps') as f:
+            for line in f:
+                parts = line.split(None, 5)
+                if not parts[0].endswith(':'):
+                    # บรรทัดหัวของ mapping: "addr-addr perms offset dev inode [path]"
+                    path = parts[5].strip() if len(parts) > 5 else ''
+                    in_model = bool(model_dir) and path.startswith(model_dir)
+                    continue
+                field_name = _SMAPS_FIELDS.get(parts[0][:-1])
+                if field_name is None:
+                    continue
+                kb = int(parts[1])
+                totals[field_name] += kb
+                if in_model:
+                    models[field_name] += kb
+    except OSError:
+        return None
+    to_mb = lambda d: {k: round(v / 1024, 1) for k, v in d.items()}
+    return {'process': to_mb(totals), 'models': to_mb(models)}
+
+
+def _measure_worker(base_dir, mmap, ready, done, results):
+    registry = ModelRegistry(base_dir=base_dir, mmap=mmap)
+    registry.preload()
+    # ทำนายหนึ่งครั้งให้ page ของโมเดลถูกแตะจริง
+    import numpy as np
+    for name in registry:
+        model = registry[name]
+        if hasattr(model, 'predict_matrix'):
+            model.predict_matrix(np.zeros((24, model.n_features_in_), dtype=np.float32))
+    ready.wait()
+    results.put((os.getpid(), memory_report(os.path.join(base_dir, FLAT_DIR)), registry.stats()))
+    done.wait()
+
+
+def measure_workers(base_dir='.', workers=2, mmap=MODEL_MMAP):
+    # จำลองหลาย Streamlit process บนเครื่องเดียว: ทุกตัวโหลดโมเดลแล้วค้างไว้พร้อมกันก่อนวัด
+    import multiprocessing as mp
+    ctx = mp.get_context('spawn')
+    ready, done, results = ctx.Barrier(workers + 1), ctx.Event(), ctx.Queue()
+    procs = [ctx.Process(target=_measure_worker, args=(base_dir, mmap, ready, done, results))
+             for _ in range(workers)]
+    for p in procs:
+        p.start()
+    ready.wait()
+    reports = [results.get() for _ in procs]
+    done.set()
+    for p in procs:
+        p.join()
+    return reports
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="วัดหน่วยความจำหลังโหลดโมเดล (Private vs Shared ต่อ process)")
+    parser.add_argument('--base-dir', default='.')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--no-mmap', action='store_true')
+    args = parser.parse_args()
+
+    mmap = not args.no_mmap
+    print(f"🧠 โหลดโมเดลใน {args.workers} process พร้อมกัน (mmap={'on' if mmap else 'off'})")
+    for pid, report, stats in measure_workers(args.base_dir, args.workers, mmap):
+        formats = ','.join(sorted({s['format'] for s in stats}))
+        proc, mdl = report['process'], report['models']
+        print(f"   pid {pid} [{formats}] process: RSS {proc['rss']} MB = private {proc['private']} + shared {proc['shared']} "
+              f"(PSS {proc['pss']}) | model mmap: private {mdl['private']} / shared {mdl['shared']} MB")
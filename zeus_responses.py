@@ -0,0 +1,177 @@
+import argparse
+import json
+import os
+import random
+import string
+import threading
+import time
+
+from zeus_intents import match_intent
+
+# ==========================================
+# Zeus Response Store (Ark Zeus Chat)
+# คำตอบของซุสอยู่ใน zeus_responses.json (แก้เนื้อหาได้โดยไม่ต้อง deploy โค้ด)
+# - โหลด + แยก template เป็นชิ้น (ข้อความ / ช่องเติมค่า) ครั้งเดียวต่อ process จัดกลุ่มตาม intent
+# - ตอนตอบ: สุ่ม template ของ intent นั้นแล้วเติมค่าเฉพาะอันที่ได้
+# - ไฟล์เปลี่ยน (mtime) -> โหลดใหม่เอง; ไฟล์ใหม่เสียใช้ชุดเดิมต่อ
+# ==========================================
+
+RESPONSES_FILE = os.environ.get(
+    'ZEUS_RESPONSES_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'zeus_responses.json'))
+# ความถี่ในการเช็คไฟล์ (วินาที) เหมือน ModelRegistry
+DEFAULT_CHECK_INTERVAL = 2.0
+FALLBACK_INTENT = 'fallback'
+# ความกดอากาศต่ำกว่านี้ = พายุมา คำถามเรื่องฝนตอบแบบเกรี้ยวกราดกว่า
+STORM_PRESSURE = 1008
+# ยังไม่มีผลพยากรณ์ / โมเดลพัง
+NO_CONTEXT_REPLY = "ข้าสัมผัสไม่ได้ถึงพลังญาณหยั่งรู้ พวกมนุษย์อย่างเจ้าทำเซิร์ฟเวอร์ข้าพังรึ?!"
+
+
+class ResponseTemplateError(ValueError):
+    pass
+
+
+class Template:
+    __slots__ = ('text', 'theme', 'fields', '_parts')
+
+    def __init__(self, text, theme='', allowed=None):
+        self.text = text
+        self.theme = theme
+        parts = []
+        try:
+            for literal, field, spec, conversion in string.Formatter().parse(text):
+                if field is not None and (not field.isidentifier() or conversion):
+                    raise ResponseTemplateError(f"ช่องเติมค่าต้องเป็นชื่อตัวแปรเท่านั้น: {{{field}}} ใน {text!r}")
+                if allowed is not None and field is not None and field not in allowed:
+                    raise ResponseTemplateError(f"ไม่รู้จักช่อง {{{field}}} ใน {text!r}")
+                parts.append((literal, field, spec or ''))
+        except ValueError as e:
+            if isinstance(e, ResponseTemplateError):
+                raise
+            raise ResponseTemplateError(f"template ผิดรูปแบบ ({e}): {text!r}") from e
+        self._parts = tuple(parts)
+        self.fields = frozenset(field for _, field, _ in parts if field is not None)
+
+    def render(self, values):
+        out = []
+        for literal, field, spec in self._parts:
+            out.append(literal)
+            if field is not None:
+                out.append(format(values[field], spec))
+        return ''.join(out)
+
+
+def _expect(value, kind, where):
+    # JSON ถูกไวยากรณ์แต่โครงสร้างผิด (เช่นทั้งไฟล์เป็น list) ต้องไม่หลุดเป็น AttributeError
+    if not isinstance(value, kind):
+        raise ResponseTemplateError(f"{where} ต้องเป็น {kind.__name__} ไม่ใช่ {type(value).__name__}")
+    return value
+
+
+def parse_responses(raw):
+    # JSON -> {intent: tuple(Template)} (ธีมเป็นแค่การจัดกลุ่มให้คนแก้ สุ่มรวมทั้ง intent เหมือนเดิม)
+    _expect(raw, dict, "ไฟล์ template")
+    fields = _expect(raw.get('fields', []), list, "'fields'")
+    allowed = frozenset(_expect(f, str, "ชื่อช่องใน 'fields'") for f in fields) or None
+    intents = {}
+    for intent, spec in _expect(raw.get('intents', {}), dict, "'intents'").items():
+        themes = _expect(_expect(spec, dict, f"intent '{intent}'").get('themes', []), list,
+                         f"themes ของ '{intent}'")
+        templates = []
+        for group in themes:
+            _expect(group, dict, f"theme ใน '{intent}'")
+            theme = _expect(group.get('theme', ''), str, f"ชื่อ theme ใน '{intent}'")
+            for text in _expect(group.get('templates', []), list, f"templates ของ '{intent}'"):
+                templates.append(Template(_expect(text, str, f"template ใน '{intent}'"), theme, allowed))
+        if not templates:
+            raise ResponseTemplateError(f"intent '{intent}' ไม่มี template")
+        intents[intent] = tuple(templates)
+    if FALLBACK_INTENT not in intents:
+        raise ResponseTemplateError(f"ต้องมี intent '{FALLBACK_INTENT}'")
+    return intents
+
+
+class ResponseStore:
+
+    def __init__(self, path=RESPONSES_FILE, check_interval=DEFAULT_CHECK_INTERVAL, rng=None):
+        self.path = path
+        self.check_interval = check_interval
+        self.rng = rng or random.Random()
+        self.last_error = ''
+        self.loads = 0
+        self._mtime_ns = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._intents = self._load()
+
+    def _load(self):
+        st_ = os.stat(self.path)
+        with open(self.path, encoding='utf-8') as f:
+            intents = parse_responses(json.load(f))
+        self._mtime_ns = st_.st_mtime_ns
+        self.loads += 1
+        self.last_error = ''
+        return intents
+
+    def _maybe_reload(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            try:
+                if os.stat(self.path).st_mtime_ns == self._mtime_ns:
+                    return
+                self._intents = self._load()
+            except (OSError, ValueError) as e:
+                # ไฟล์หาย / JSON เสีย / template ผิด: ใช้ชุดเดิมต่อ
+                self.last_error = str(e)
+
+    @property
+    def intents(self):
+        self._maybe_reload()
+        return self._intents
+
+    def choose(self, intent):
+        intents = self.intents
+        return self.rng.choice(intents.get(intent) or intents[FALLBACK_INTENT])
+
+    def render(self, intent, **values):
+        return self.choose(intent).render(values)
+
+    def counts(self):
+        return {intent: len(templates) for intent, templates in self.intents.items()}
+
+
+def zeus_reply(store, text, context):
+    # ข้อความผู้ใช้ + ChatContext -> (intent, คำตอบของซุส) ใช้ทั้งหน้าแชทและ /chat ของ API
+    if context is None:
+        return None, NO_CONTEXT_REPLY
+    # แยกหมวดข้อความด้วย automaton ที่สร้างไว้ตอนเริ่ม (อ่านข้อความรอบเดียว)
+    intent = match_intent(text)
+    if intent == 'rain':
+        intent = 'rain_storm' if context.press < STORM_PRESSURE else 'rain_clear'
+    # สุ่ม template ของหมวดนี้ (zeus_responses.json) แล้วเติมค่าเฉพาะอันที่ได้
+    return intent, store.render(intent, **context.template_values)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="ตรวจ / ทดลอง zeus_responses.json")
+    parser.add_argument('--file', default=RESPONSES_FILE)
+    parser.add_argument('--render', metavar='INTENT', help="สุ่มคำตอบของ intent นี้ด้วยค่าตัวอย่าง")
+    args = parser.parse_args()
+
+    try:
+        store = ResponseStore(args.file)
+    except (OSError, ValueError) as e:
+        print(f"❌ {args.file}: {e}")
+        raise SystemExit(1)
+    print(f"✅ {args.file}: {sum(store.counts().values())} templates")
+    for intent, n in store.counts().items():
+        print(f"  {intent}: {n}")
+    if args.render:
+        sample = {'pred_temp': 33.4, 'hum': 72, 'press': 1006.2, 'mood_text': 'ท้องฟ้าปกติ',
+                  'mood_icon': '☁️', 'advice': 'ดื่มน้ำเยอะๆ'}
+        print(store.render(args.render, **sample))
@@ -0,0 +1,150 @@
+import argparse
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+import zeus_store
+
+# ==========================================
+# Zeus Stations
+# - Catalog ของสถานี (zeus_store/stations.json): พิกัด, ช่วงเวลาที่มีข้อมูล, จำนวนแถว
+#   แอปใช้เลือกสถานีและพิกัดพยากรณ์ โดยไม่ต้องอ่านข้อมูลทั้งหมดใหม่
+# - StationIndex: ดัชนีเวลาแยกต่อสถานี (timestamp เรียงแล้ว + searchsorted)
+#   ถามช่วงเวลาของสถานีหนึ่งจะเปิดเฉพาะโฟลเดอร์ station_id=<id> ใน Store ไม่แตะสถานีอื่น
+# ==========================================
+
+CATALOG_FILE = 'stations.json'
+
+# สถานีแรกของโปรเจกต์: ต.เนินหอม จ.ปราจีนบุรี (ใช้เมื่อยังไม่มี catalog)
+DEFAULT_STATIONS = [
+    {'station_id': 'S1-0000898463', 'name': 'Prachin Buri', 'lat': 14.16, 'lon': 101.35},
+]
+
+
+def catalog_path(store_dir=zeus_store.STORE_DIR):
+    return os.path.join(store_dir, CATALOG_FILE)
+
+
+def station_ids(name='cleaned', store_dir=zeus_store.STORE_DIR):
+    # อ่านจากชื่อโฟลเดอร์ partition อย่างเดียว ไม่เปิดไฟล์ข้อมูล
+    path = zeus_store.dataset_path(name, store_dir)
+    if not os.path.isdir(path):
+        return []
+    return sorted(d.split('=', 1)[1] for d in os.listdir(path)
+                  if d.startswith('station_id=') and not d.endswith('__HIVE_DEFAULT_PARTITION__'))
+
+
+def load_catalog(store_dir=zeus_store.STORE_DIR):
+    try:
+        with open(catalog_path(store_dir), encoding='utf-8') as f:
+            stations = json.load(f)['stations']
+    except (OSError, ValueError, KeyError):
+        return [dict(s) for s in DEFAULT_STATIONS]
+    return stations or [dict(s) for s in DEFAULT_STATIONS]
+
+
+def build_catalog(name='cleaned', store_dir=zeus_store.STORE_DIR):
+    # สรุปทีละสถานี (อ่านแค่ lat/long/datetime ของสถานีนั้น) แล้วเขียน stations.json แบบ atomic
+    # ชื่อสถานีที่เคยตั้งไว้ใน catalog เดิมจะถูกเก็บไว้
+    names = {s['station_id']: s.get('name') for s in load_catalog(store_dir)}
+    stations = []
+    for station_id in station_ids(name, store_dir):
+        df = zeus_store.read_dataset(name, ['lat', 'long', 'datetime'], stations=[station_id], store_dir=store_dir)
+        if df.empty:
+            continue
+        stations.append({
+            'station_id': station_id,
+            'name': names.get(station_id) or station_id,
+            'lat': round(float(df['lat'].median()), 4) if df['lat'].notna().any() else None,
+            'lon': round(float(df['long'].median()), 4) if df['long'].notna().any() else None,
+            'first': df['datetime'].iloc[0].isoformat(),
+            'last': df['datetime'].iloc[-1].isoformat(),
+            'rows': len(df),
+        })
+    path = catalog_path(store_dir)
+    tmp = f"{path}.tmp-{os.getpid()}"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'dataset': name, 'stations': stations}, f, indent=1, ensure_ascii=False)
+    os.replace(tmp, path)
+    return stations
+
+
+class StationSeries:
+    # ข้อมูลของสถานีเดียว: เวลา (int64 ns เรียงแล้ว) + คอลัมน์เป็น NumPy array
+
+    def __init__(self, df):
+        self.times = df['datetime'].to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        self.columns = {c: df[c].to_numpy() for c in df.columns}
+
+    def __len__(self):
+        return len(self.times)
+
+    def _bounds(self, start=None, end=None):
+        lo = 0 if start is None else int(np.searchsorted(self.times, pd.Timestamp(start).value, side='left'))
+        hi = len(self.times) if end is None else int(np.searchsorted(self.times, pd.Timestamp(end).value, side='left'))
+        return lo, hi
+
+    def range(self, start=None, end=None, columns=None):
+        # start <= datetime < end
+        lo, hi = self._bounds(start, end)
+        return pd.DataFrame({c: self.columns[c][lo:hi] for c in columns or self.columns})
+
+    def asof(self, when):
+        # แถวล่าสุดที่เวลาไม่เกิน when (None ถ้ายังไม่มีข้อมูลก่อนหน้านั้น)
+        i = int(np.searchsorted(self.times, pd.Timestamp(when).value, side='right')) - 1
+        if i < 0:
+            return None
+        return {c: v[i] for c, v in self.columns.items()}
+
+
+class StationIndex:
+    # โหลดแบบ Lazy ทีละสถานี แล้วเก็บไว้ใช้ซ้ำ (thread-safe สำหรับหลาย session ของ Streamlit)
+
+    def __init__(self, name='cleaned', store_dir=zeus_store.STORE_DIR, columns=None):
+        self.name = name
+        self.store_dir = store_dir
+        self.columns = columns
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def stations(self):
+        return station_ids(self.name, self.store_dir)
+
+    def series(self, station_id):
+        series = self._series.get(station_id)
+        if series is None:
+            with self._lock:
+                series = self._series.get(station_id)
+                if series is None:
+                    columns = None if self.columns is None else list(dict.fromkeys(['datetime', *self.columns]))
+                    df = zeus_store.read_dataset(self.name, columns, stations=[station_id], store_dir=self.store_dir)
+                    series = self._series[station_id] = StationSeries(df)
+        return series
+
+    def range(self, station_id, start=None, end=None, columns=None):
+        return self.series(station_id).range(start, end, columns)
+
+    def latest(self, station_id):
+        series = self.series(station_id)
+        return series.asof(pd.Timestamp.max) if len(series) else None
+
+    def refresh(self, station_id=None):
+        with self._lock:
+            if station_id is None:
+                self._series.clear()
+            else:
+                self._series.pop(station_id, None)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="สร้าง stations.json จาก dataset ใน Zeus Store")
+    parser.add_argument('--dataset', default='cleaned')
+    parser.add_argument('--store-dir', default=zeus_store.STORE_DIR)
+    args = parser.parse_args()
+    zeus_store.use_system_memory_pool()
+    print(f"📡 กำลังสรุปสถานีจาก zeus_store/{args.dataset} ...")
+    for s in build_catalog(args.dataset, args.store_dir):
+        print(f"   ✅ {s['station_id']} ({s['lat']}, {s['lon']}) {s['first']} -> {s['last']} | {s['rows']} แถว")
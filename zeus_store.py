@@ -0,0 +1,250 @@
+import argparse
+import os
+import shutil
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+# ==========================================
+# Zeus Dataset Store
+# เก็บข้อมูลแต่ละขั้นของ Pipeline เป็น Parquet แบ่งโฟลเดอร์ตามสถานีและวันที่
+#   zeus_store/<dataset>/station_id=<id>/year_month=<YYYY-MM>/part-0.parquet
+#   (แบ่งเป็นรายเดือน: สถานีหนึ่งได้ ~8,600 แถว/เดือน ถ้าแบ่งรายวันไฟล์จะเล็กเกินจนเสียเวลาเปิดไฟล์มากกว่าอ่าน)
+# - ชนิดข้อมูลถูกกำหนดตั้งแต่ตอนเขียน (float32 / int8 / timestamp) ไม่ต้องเดา dtype ใหม่ทุกครั้งที่อ่าน
+# - อ่านเฉพาะคอลัมน์ที่ใช้ (column projection) และเฉพาะช่วงวันที่ที่ต้องการ (ข้ามโฟลเดอร์เดือนอื่นไปเลย)
+# ==========================================
+
+STORE_DIR = 'zeus_store'
+PARTITION_COLUMNS = ('station_id', 'year_month')
+
+# ชื่อ dataset -> ไฟล์ CSV เดิมใน Pipeline (ใช้ตอน import ของเก่าเข้ามา)
+DATASETS = {
+    'raw': 'zeus_dataset_raw.csv',
+    'raw_new': 'zeus_dataset_raw_newdata.csv',
+    'master_raw': 'zeus_master_raw.csv',
+    'cleaned': 'zeus_master_cleaned.csv',
+    'train': 'zeus_train_final.csv',
+    'test': 'zeus_test_unseen.csv',
+}
+
+# ชนิดข้อมูลของคอลัมน์ที่รู้จัก คอลัมน์ตัวเลขอื่นๆ เก็บเป็น float32
+COLUMN_TYPES = {
+    'unix_time': pa.int64(),
+    'timezone': pa.string(),
+    'datetime': pa.timestamp('ms'),
+    'station_id': pa.string(),
+    'unk1': pa.float64(),   # เลขประจำอุปกรณ์ 15 หลัก float32 เก็บไม่พอ
+    'lat': pa.float64(),    # พิกัดต้องการทศนิยม 8 ตำแหน่ง
+    'long': pa.float64(),
+    'hour': pa.int8(),
+    'is_day': pa.int8(),
+    'month': pa.int8(),
+    'rain_clean': pa.int8(),
+}
+
+
+def use_system_memory_pool():
+    # ใช้ malloc ของระบบแทน mimalloc (ค่าเริ่มต้นของ Arrow) ซึ่งเก็บหน่วยความจำที่คืนแล้วค้างไว้
+    # อ่าน/เขียนทีละเดือนจะได้ไม่มี RSS โตตามจำนวนเดือน
+    # เรียกจาก entry point (CLI / benchmark) เท่านั้น ไม่เปลี่ยนค่าทั้ง process ตอนแค่ import โมดูลนี้
+    pa.set_memory_pool(pa.system_memory_pool())
+
+
+def dataset_path(name, store_dir=STORE_DIR):
+    return os.path.join(store_dir, name)
+
+
+def exists(name, store_dir=STORE_DIR):
+    return os.path.isdir(dataset_path(name, store_dir))
+
+
+def _column_type(name, series):
+    if name in COLUMN_TYPES:
+        return COLUMN_TYPES[name]
+    if pd.api.types.is_numeric_dtype(series):
+        return pa.float32()
+    return pa.string()
+
+
+def parse_datetime(values):
+    # ข้อมูลดิบมีทั้ง 'YYYY-MM-DD HH:MM' (merge_data.py) และแบบวันขึ้นก่อน (ไฟล์รุ่นเก่า)
+    # แปลงแบบ ISO ก่อน: ถ้าส่ง ISO เข้า dayfirst=True ตรงๆ '2026-03-01' จะกลายเป็น 3 ม.ค.
+    values = pd.Series(values)
+    parsed = pd.to_datetime(values, format='ISO8601', errors='coerce')
+    rest = parsed.isna() & values.notna()
+    if rest.any():
+        parsed[rest] = pd.to_datetime(values[rest], format='mixed', dayfirst=True, errors='coerce')
+    return parsed
+
+
+def to_table(df):
+    # DataFrame -> Arrow Table ตาม COLUMN_TYPES พร้อมคอลัมน์ year_month สำหรับแบ่งโฟลเดอร์
+    df = df.copy()
+    if 'datetime' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['datetime']):
+        df['datetime'] = parse_datetime(df['datetime'])
+    if 'station_id' in df.columns:
+        df['station_id'] = df['station_id'].astype('str').where(df['station_id'].notna(), None)
+    for col in ('unk1', 'lat', 'long'):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    # int8 ใส่ NaN ไม่ได้: คอลัมน์ที่ยังมีค่าว่างให้เก็บเป็น float32 แทน
+    fields = []
+    for col in df.columns:
+        type_ = _column_type(col, df[col])
+        if pa.types.is_integer(type_) and col != 'unix_time' and df[col].isna().any():
+            type_ = pa.float32()
+        fields.append(pa.field(col, type_))
+    table = pa.Table.from_pandas(df, schema=pa.schema(fields), preserve_index=False, safe=False)
+    if 'datetime' in df.columns:
+        table = table.append_column('year_month', pc.strftime(table['datetime'], format='%Y-%m'))
+    return table
+
+
+def write_dataset(df, name, store_dir=STORE_DIR):
+    return write_chunks([df], name, store_dir)
+
+
+def write_chunks(chunks, name, store_dir=STORE_DIR):
+    # เขียนทับทั้ง dataset จาก DataFrame ทีละก้อน (ไม่ต้องมีข้อมูลทั้งหมดในหน่วยความจำพร้อมกัน)
+    # เขียนลงโฟลเดอร์ชั่วคราวก่อนแล้วค่อยสลับ คนที่อ่านอยู่จะไม่เจอไฟล์ครึ่งๆ
+    path = dataset_path(name, store_dir)
+    tmp = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    schema = None
+    for i, df in enumerate(chunks):
+        table = to_table(df)
+        # ทุกก้อนใช้ schema ของก้อนแรก (กัน int8 กลายเป็น float32 เฉพาะบางไฟล์)
+        schema = schema or table.schema
+        table = table.select(schema.names).cast(schema, safe=False)
+        partitions = [c for c in PARTITION_COLUMNS if c in schema.names]
+        ds.write_dataset(
+            table, tmp, format='parquet',
+            partitioning=ds.partitioning(pa.schema([schema.field(c) for c in partitions]), flavor='hive')
+            if partitions else None,
+            basename_template=f"part-{i}-{{i}}.parquet",
+            preserve_order=True,
+            max_rows_per_group=1 << 20,
+            existing_data_behavior='overwrite_or_ignore',
+        )
+    old = f"{path}.old-{os.getpid()}"
+    if os.path.isdir(path):
+        os.replace(path, old)
+    os.replace(tmp, path)
+    shutil.rmtree(old, ignore_errors=True)
+    return path
+
+
+def _filter(start=None, end=None, stations=None):
+    # start <= datetime < end; เงื่อนไขบน year_month (partition) ทำให้ข้ามโฟลเดอร์เดือนอื่นโดยไม่เปิดไฟล์
+    expr = None
+    clauses = []
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+    if start is not None:
+        clauses += [ds.field('year_month') >= start.strftime('%Y-%m'),
+                    ds.field('datetime') >= pa.scalar(start.to_pydatetime(), type=pa.timestamp('ms'))]
+    if end is not None:
+        clauses += [ds.field('year_month') <= end.strftime('%Y-%m'),
+                    ds.field('datetime') < pa.scalar(end.to_pydatetime(), type=pa.timestamp('ms'))]
+    if stations is not None:
+        clauses.append(ds.field('station_id').isin(list(stations)))
+    for clause in clauses:
+        expr = clause if expr is None else expr & clause
+    return expr
+
+
+def open_dataset(name, store_dir=STORE_DIR):
+    path = dataset_path(name, store_dir)
+    if not os.path.isdir(path):
+        raise FileNotFoundError(f"ไม่พบ dataset '{name}' ใน {store_dir}/ (รันขั้นก่อนหน้า หรือ python zeus_store.py import ก่อน)")
+    return ds.dataset(path, format='parquet', partitioning='hive')
+
+
+def read_table(name, columns=None, start=None, end=None, stations=None, store_dir=STORE_DIR):
+    # เหมือน read_dataset แต่คืน pyarrow Table (ไม่ผ่าน pandas) มีคอลัมน์ datetime ติดมาด้วยเสมอถ้ามี
+    dataset = open_dataset(name, store_dir)
+    available = [c for c in dataset.schema.names if c != 'year_month']
+    wanted = list(columns) if columns is not None else available
+    read_cols = wanted + (['datetime'] if 'datetime' in available and 'datetime' not in wanted else [])
+    table = dataset.to_table(columns=read_cols, filter=_filter(start, end, stations))
+    if 'datetime' in read_cols:
+        # โฟลเดอร์ถูกอ่านตามสถานีก่อน -> เรียงตามเวลารวมอีกครั้ง (stable รักษาลำดับเดิมในวันเดียวกัน)
+        table = table.take(pc.sort_indices(table, sort_keys=[('datetime', 'ascending')]))
+    return table
+
+
+def read_dataset(name, columns=None, start=None, end=None, stations=None, store_dir=STORE_DIR):
+    # อ่านเฉพาะคอลัมน์ใน columns (None = ทุกคอลัมน์) เรียงตามเวลา
+    table = read_table(name, columns, start, end, stations, store_dir)
+    wanted = list(columns) if columns is not None else table.column_names
+    df = table.to_pandas()
+    for col in df.columns:
+        if pa.types.is_dictionary(table.schema.field(col).type):
+            df[col] = df[col].astype('str')
+    return df[wanted]
+
+
+def partition_months(name, store_dir=STORE_DIR):
+    # เดือนทั้งหมดที่มีใน dataset (เรียงตามเวลา) จากชื่อโฟลเดอร์ ไม่ต้องเปิดไฟล์
+    months = set()
+    for _, dirs, _ in os.walk(dataset_path(name, store_dir)):
+        months.update(d.split('=', 1)[1] for d in dirs if d.startswith('year_month='))
+    months.discard('__HIVE_DEFAULT_PARTITION__')
+    return sorted(months)
+
+
+def iter_months(name, columns=None, store_dir=STORE_DIR):
+    # อ่านทีละเดือน (ทุกสถานี) เรียงตามเวลา: หน่วยความจำสูงสุด = ข้อมูล 1 เดือน
+    for month in partition_months(name, store_dir):
+        start = pd.Timestamp(f"{month}-01")
+        yield read_dataset(name, columns, start=start, end=start + pd.offsets.MonthBegin(1), store_dir=store_dir)
+
+
+def datetime_range(name, store_dir=STORE_DIR):
+    # อ่านแค่คอลัมน์เวลา (ไว้หาจุดตัด Train/Test)
+    times = open_dataset(name, store_dir).to_table(columns=['datetime']).column('datetime')
+    return pc.min(times).as_py(), pc.max(times).as_py()
+
+
+def dataset_info(name, store_dir=STORE_DIR):
+    path = dataset_path(name, store_dir)
+    files, size = 0, 0
+    for root, _, names in os.walk(path):
+        for n in names:
+            files += 1
+            size += os.path.getsize(os.path.join(root, n))
+    dataset = open_dataset(name, store_dir)
+    return {'dataset': name, 'rows': dataset.count_rows(), 'files': files, 'size_mb': round(size / 1024 ** 2, 2)}
+
+
+def import_csv(csv_path, name, store_dir=STORE_DIR):
+    t0 = time.perf_counter()
+    path = write_dataset(pd.read_csv(csv_path), name, store_dir)
+    print(f"   ✅ {csv_path} -> {path} ({time.perf_counter() - t0:.2f}s)")
+    return path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="จัดการ Zeus Dataset Store (Parquet แบ่งตามสถานี/วันที่)")
+    parser.add_argument('--store-dir', default=STORE_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_import = sub.add_parser('import', help="แปลงไฟล์ CSV เดิมเข้า Store")
+    p_import.add_argument('names', nargs='*', help=f"ชื่อ dataset ({', '.join(DATASETS)}) ไม่ระบุ = ทุกไฟล์ที่มีอยู่")
+    sub.add_parser('info', help="แสดงจำนวนแถวและขนาดของแต่ละ dataset")
+    args = parser.parse_args()
+    use_system_memory_pool()
+
+    if args.command == 'import':
+        print("📦 กำลังแปลง CSV เข้า Zeus Store...")
+        for name in args.names or DATASETS:
+            if os.path.exists(DATASETS[name]):
+                import_csv(DATASETS[name], name, args.store_dir)
+            elif args.names:
+                print(f"   ❌ ไม่พบไฟล์ {DATASETS[name]}")
+    else:
+        rows = [dataset_info(name, args.store_dir) for name in DATASETS if exists(name, args.store_dir)]
+        print(pd.DataFrame(rows).to_string(index=False) if rows else "❌ ยังไม่มี dataset ใน Store")
@@ -0,0 +1,276 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from zeus_fetch import BatchFetcher
+from zeus_metrics import METRICS
+
+# ==========================================
+# Zeus Forecast Cache (Open-Meteo)
+# - แชร์ผลพยากรณ์ทุก session ต่อ key (lat, lon, ชุดตัวแปร)
+# - หมดอายุตามรอบอัปเดตรายชั่วโมงของ Open-Meteo
+# - คำขอซ้ำ key เดียวกันพร้อมกัน -> ยิง API แค่ครั้งเดียว (single-flight)
+# - ข้อมูลเก่า (stale) ตอบไปก่อน แล้ว refresh อยู่เบื้องหลัง
+# - API ล่ม -> ใช้ payload ล่าสุดที่ดีจากดิสก์
+# - prefetch(): หลายพิกัดที่หมดอายุ ดึงรวมด้วยคำขอแบบหลายพิกัดของ Open-Meteo (zeus_fetch.BatchFetcher)
+# ==========================================
+
+# เปลี่ยน URL ได้ผ่าน env เช่นชี้ไปที่ stub server ตอนทดสอบ
+OPEN_METEO_URL = os.environ.get('ZEUS_OPEN_METEO_URL', 'https://api.open-meteo.com/v1/forecast')
+CACHE_DIR = os.environ.get('ZEUS_CACHE_DIR', '.zeus_cache')
+
+CURRENT_VARS = (
+    'temperature_2m', 'relative_humidity_2m', 'apparent_temperature', 'is_day',
+    'precipitation', 'rain', 'weather_code', 'cloud_cover', 'pressure_msl',
+    'surface_pressure', 'wind_speed_10m', 'wind_direction_10m',
+)
+HOURLY_VARS = (
+    'temperature_2m', 'relative_humidity_2m', 'uv_index', 'direct_radiation',
+    'surface_pressure', 'wind_speed_10m', 'rain',
+)
+TIMEZONE = 'Asia/Bangkok'
+
+# Open-Meteo อัปเดตโมเดลทุกชั่วโมง: ข้อมูลสดถึงต้นชั่วโมงถัดไป
+UPDATE_INTERVAL = 3600
+# เลยเวลาหมดอายุแล้วแต่ยังไม่เกินนี้ -> ตอบข้อมูลเก่าไปก่อนพร้อม refresh เบื้องหลัง
+MAX_STALE = 6 * 3600
+# API ล่มแล้วเว้นช่วงก่อนลองเรียกใหม่ (วินาที)
+OFFLINE_RETRY = 60
+# จำนวน payload ที่เก็บในหน่วยความจำ (LRU) ไม่ให้พิกัดแปลกๆ จาก API ทำ memory โตไม่จำกัด
+MAX_ENTRIES = 1024
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 10
+
+
+@dataclass
+class ForecastEntry:
+    payload: dict
+    fetched_at: float
+    expires_at: float
+    source: str = 'api'  # 'api' | 'disk'
+
+    def is_fresh(self, now):
+        return now < self.expires_at
+
+
+def next_update_at(ts, interval=UPDATE_INTERVAL):
+    # ต้นชั่วโมงถัดไป (Asia/Bangkok เป็น UTC+7 ชั่วโมงเต็ม จึงตรงกับรอบ UTC)
+    return (int(ts) // interval + 1) * interval
+
+
+def make_session(pool_size=16, retries=2):
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.3,
+                  status_forcelist=(429, 500, 502, 503, 504), allowed_methods=('GET',))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class ForecastCache:
+
+    def __init__(self, base_url=None, cache_dir=CACHE_DIR, session=None,
+                 connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT,
+                 max_stale=MAX_STALE, max_workers=4, clock=time.time, max_entries=MAX_ENTRIES):
+        self.base_url = base_url or OPEN_METEO_URL
+        self.cache_dir = cache_dir
+        self.session = session or make_session()
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_stale = max_stale
+        self.clock = clock
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='zeus-forecast')
+
+    @staticmethod
+    def make_key(lat, lon, current=CURRENT_VARS, hourly=HOURLY_VARS, timezone=TIMEZONE):
+        return (round(float(lat), 4), round(float(lon), 4), tuple(current), tuple(hourly), timezone)
+
+    def get(self, lat, lon, current=CURRENT_VARS, hourly=HOURLY_VARS, timezone=TIMEZONE):
+        entry = self.get_entry(lat, lon, current, hourly, timezone)
+        return entry.payload if entry else None
+
+    def get_entry(self, lat, lon, current=CURRENT_VARS, hourly=HOURLY_VARS, timezone=TIMEZONE):
+        key = self.make_key(lat, lon, current, hourly, timezone)
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.is_fresh(now):
+                self._entries.move_to_end(key)
+                METRICS.inc('forecast_cache', result='hit')
+                return entry
+            future = self._start_refresh(key)
+
+        # Stale-while-revalidate: มีของเก่าที่ยังไม่เก่าเกินไป ตอบเลยไม่ต้องรอ
+        if entry is not None and now - entry.expires_at < self.max_stale:
+            METRICS.inc('forecast_cache', result='stale')
+            return entry
+        METRICS.inc('forecast_cache', result='miss')
+
+        try:
+            return future.result(timeout=sum(self.timeout) + 5)
+        except Exception:
+            return entry
+
+    def prefetch(self, locations, current=CURRENT_VARS, hourly=HOURLY_VARS, timezone=TIMEZONE):
+        # เรียกจาก Thread ที่ไม่มี event loop (เช่น ForecastPrecomputer) / ใน async ใช้ prefetch_async
+        return asyncio.run(self.prefetch_async(locations, current, hourly, timezone))
+
+    async def prefetch_async(self, locations, current=CURRENT_VARS, hourly=HOURLY_VARS, timezone=TIMEZONE):
+        # เฉพาะพิกัดที่ไม่มี / หมดอายุ และไม่มีใครกำลังดึงอยู่; คืนจำนวนพิกัดที่ได้ payload ใหม่
+        now = self.clock()
+        futures = {}
+        with self._lock:
+            for lat, lon in locations:
+                key = self.make_key(lat, lon, current, hourly, timezone)
+                entry = self._entries.get(key)
+                if (entry is None or not entry.is_fresh(now)) and key not in self._inflight:
+                    # จอง key ไว้ก่อน: get_entry() ที่มาพร้อมกันจะรอผลก้อนนี้ ไม่ยิงคำขอเดี่ยวซ้ำ
+                    futures[key] = self._inflight[key] = Future()
+        if not futures:
+            return 0
+        keys = list(futures)
+        fetched = 0
+        try:
+            fetcher = BatchFetcher(self.base_url, timeout=self.timeout, session=self.session)
+            with METRICS.span('open_meteo_fetch', batch='multi'):
+                payloads = await fetcher.fetch([key[:2] for key in keys], current, hourly, timezone)
+            now = self.clock()
+            for key, payload in zip(keys, payloads):
+                if payload is None:
+                    # ก้อนนี้พังทุกรอบ: คนที่รออยู่ได้ของเก่า (หน่วยความจำ / ดิสก์) ไปก่อน
+                    # รอบถัดไป get_entry() ดึงเดี่ยวตามปกติ
+                    with self._lock:
+                        fallback = self._entries.get(key)
+                    if fallback is None:
+                        # อ่านดิสก์นอก lock: get_entry() ของพิกัดอื่นไม่ต้องรอ IO
+                        fallback = self._load_from_disk(key)
+                    with self._lock:
+                        futures.pop(key).set_result(fallback)
+                        self._inflight.pop(key, None)
+                    continue
+                entry = ForecastEntry(payload, fetched_at=now, expires_at=next_update_at(now))
+                self._save_to_disk(key, entry)
+                with self._lock:
+                    self._put(key, entry)
+                    futures.pop(key).set_result(entry)
+                    self._inflight.pop(key, None)
+                fetched += 1
+        finally:
+            # พังกลางทาง / ถูกยกเลิก: ปล่อย key ที่เหลือให้ดึงใหม่ได้
+            with self._lock:
+                for key, future in futures.items():
+                    future.set_exception(RuntimeError("prefetch ไม่สำเร็จ"))
+                    self._inflight.pop(key, None)
+        return fetched
+
+    def _put(self, key, entry):
+        # ต้องถือ self._lock อยู่
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _start_refresh(self, key):
+        # ต้องถือ self._lock อยู่: ถ้ามีคำขอ key นี้กำลังวิ่งอยู่ ให้ใช้ตัวเดียวกัน
+        future = self._inflight.get(key)
+        if future is None:
+            future = self._executor.submit(self._refresh, key)
+            self._inflight[key] = future
+        return future
+
+    def _refresh(self, key):
+        lat, lon, current, hourly, timezone = key
+        entry = None
+        try:
+            try:
+                with METRICS.span('open_meteo_fetch'):
+                    payload = self._fetch(lat, lon, current, hourly, timezone)
+            except Exception as e:
+                # ไม่ว่าพังแบบไหน (เครือข่าย / payload เสีย / session แปลกๆ) ก็ถอยไปใช้ของเก่า
+                METRICS.inc('open_meteo_failures', error=type(e).__name__)
+            else:
+                now = self.clock()
+                entry = ForecastEntry(payload, fetched_at=now, expires_at=next_update_at(now))
+                self._save_to_disk(key, entry)
+
+            if entry is None:
+                # API ล่ม: ใช้ของในหน่วยความจำ หรือ payload ล่าสุดที่ดีจากดิสก์ (อ่านดิสก์นอก lock)
+                # แล้วเว้นช่วงก่อนลองใหม่ จะได้ไม่มีใครต้องรอ timeout ทุก rerun
+                with self._lock:
+                    entry = self._entries.get(key)
+                if entry is None:
+                    entry = self._load_from_disk(key)
+                if entry is not None:
+                    entry.expires_at = self.clock() + OFFLINE_RETRY
+                    METRICS.inc('forecast_fallback', source=entry.source)
+            if entry is not None:
+                with self._lock:
+                    self._put(key, entry)
+        finally:
+            # ต้องถอด future ออกเสมอ ไม่งั้น key นี้จะไม่ถูกดึงใหม่อีกเลย
+            with self._lock:
+                self._inflight.pop(key, None)
+        return entry
+
+    def _fetch(self, lat, lon, current, hourly, timezone):
+        params = {
+            'latitude': lat,
+            'longitude': lon,
+            'current': ','.join(current),
+            'hourly': ','.join(hourly),
+            'timezone': timezone,
+        }
+        response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        payload = response.json()
+        if not isinstance(payload, dict) or ('current' not in payload and 'hourly' not in payload):
+            raise ValueError("Open-Meteo payload ไม่มี current/hourly")
+        return payload
+
+    # --- Offline fallback บนดิสก์ ---
+    def _disk_path(self, key):
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"forecast_{digest}.json")
+
+    def _save_to_disk(self, key, entry):
+        if not self.cache_dir:
+            return
+        path = self._disk_path(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'fetched_at': entry.fetched_at, 'payload': entry.payload}, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def _load_from_disk(self, key):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(key), encoding='utf-8') as f:
+                saved = json.load(f)
+            # หมดอายุทันที เพื่อให้รอบถัดไปลองเรียก API ใหม่
+            return ForecastEntry(saved['payload'], fetched_at=saved['fetched_at'],
+                                 expires_at=saved['fetched_at'], source='disk')
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()